@@ -0,0 +1,13 @@
+$ErrorActionPreference = "Stop"
+
+<# 
+Run the local Spot Fleet API stand-in server (synthetic data, fault injection).
+Usage: powershell -ExecutionPolicy Bypass -File .\scripts\run_fleet_stand_in.ps1 [--port 8787] [--latency-ms 200] ...
+Then point the app at it: $env:SPOT_FLEET_API_BASE_URL = "http://127.0.0.1:8787"
+#>
+
+$RepoRoot = Resolve-Path (Join-Path $PSScriptRoot "..")
+Set-Location $RepoRoot
+
+python -m src.backend.data.fleet.stand_in_server @args
+
@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Run the local Spot Fleet API stand-in server (synthetic data, fault injection).
+# Usage: ./scripts/run_fleet_stand_in.sh [--port 8787] [--latency-ms 200] [--error-rate 0.1] ...
+# Then point the app at it: SPOT_FLEET_API_BASE_URL=http://127.0.0.1:8787
+
+repo_root="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$repo_root"
+
+python -m src.backend.data.fleet.stand_in_server "$@"
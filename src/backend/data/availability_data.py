@@ -2,13 +2,72 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
+from typing import Callable, Sequence
 
+from src.backend.data.fleet.api_client import SpotFleetAPIClient
+from src.backend.data.fleet.frames import PlacementScoreFrame
 from src.backend.data.fleet.models import InstancePool, InterruptionRate, PlacementScore, RequestGroup, SpotPrice
+from src.backend.data.fleet.placement_changes import PlacementChange
+from src.backend.data.fleet.pool_catalog import PoolCatalog
 from src.backend.data.fleet.service import SpotFleetDataService
+from src.config.settings import get_settings
 
-# Global service instance
-_service = SpotFleetDataService()
+# Process-wide service, built on first use (see `get_service`).
+_service: SpotFleetDataService | None = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> SpotFleetDataService:
+    """Return the shared Spot Fleet data service, constructing it on first use.
+
+    Construction builds an API client (which reads credentials), so it is deferred
+    until data is actually requested rather than happening at import time.
+    """
+    global _service
+    service = _service
+    if service is None:
+        with _service_lock:
+            if _service is None:
+                _service = SpotFleetDataService()
+                _subscribe_to_credentials()
+            service = _service
+    return service
+
+
+_credentials_subscribed = False
+
+
+def _subscribe_to_credentials() -> None:
+    """Rebuild the API client whenever saved credentials change (once per process)."""
+    global _credentials_subscribed
+    if _credentials_subscribed:
+        return
+    _credentials_subscribed = True
+    get_settings().subscribe(lambda _settings: reset_api_client())
+
+
+def set_service(service: SpotFleetDataService | None) -> None:
+    """Swap in an alternative service (e.g. cached, async-backed or replay).
+
+    Passing None drops the current instance; the default is rebuilt lazily.
+    """
+    global _service
+    with _service_lock:
+        _service = service
+
+
+def reset_api_client() -> None:
+    """Rebuild the service's API client so it picks up changed credentials.
+
+    Cached catalogs held by the service are kept. No-op if the service has not
+    been constructed yet (it will read current credentials when it is).
+    """
+    with _service_lock:
+        service = _service
+    if service is not None:
+        service.set_api_client(SpotFleetAPIClient())
 
 
 def get_available_fleets() -> list[RequestGroup]:
@@ -17,7 +76,47 @@ def get_available_fleets() -> list[RequestGroup]:
     Returns:
         List of RequestGroup objects
     """
-    return _service.list_available_fleets()
+    return get_service().list_available_fleets()
+
+
+def get_cached_fleets() -> list[RequestGroup] | None:
+    """Get the cached fleet catalog without network access.
+
+    Returns:
+        List of RequestGroup objects, or None if nothing has been cached yet
+    """
+    return get_service().get_cached_fleets()
+
+
+def subscribe_fleet_catalog(
+    listener: Callable[[list[RequestGroup]], None],
+) -> Callable[[], None]:
+    """Subscribe to fleet catalog changes (called from a background thread).
+
+    Args:
+        listener: Callback receiving the new list of RequestGroup objects
+
+    Returns:
+        A function that removes the listener
+    """
+    return get_service().subscribe_fleet_catalog(listener)
+
+
+def subscribe_placement_changes(
+    listener: Callable[[list[PlacementChange]], None],
+) -> Callable[[], None]:
+    """Subscribe to placement score change events (threshold crossings, new/missing AZs).
+
+    Events are produced whenever latest placement scores are fetched, and are
+    delivered on the fetching thread.
+
+    Args:
+        listener: Callback receiving a non-empty list of PlacementChange events
+
+    Returns:
+        A function that removes the listener
+    """
+    return get_service().subscribe_placement_changes(listener)
 
 
 def get_fleet_details(fleet_id: str | int) -> RequestGroup:
@@ -29,7 +128,7 @@ def get_fleet_details(fleet_id: str | int) -> RequestGroup:
     Returns:
         RequestGroup object
     """
-    return _service.get_fleet_details(fleet_id)
+    return get_service().get_fleet_details(fleet_id)
 
 
 def get_fleet_placement_scores(
@@ -48,7 +147,28 @@ def get_fleet_placement_scores(
     Returns:
         List of PlacementScore objects
     """
-    return _service.get_latest_placement_scores(fleet_id, az=az, target_capacity=target_capacity)
+    return get_service().get_latest_placement_scores(fleet_id, az=az, target_capacity=target_capacity)
+
+
+def get_fleet_placement_scores_bulk(
+    fleet_ids: Sequence[int],
+    *,
+    az: str | None = None,
+    target_capacity: int | None = None,
+) -> dict[int, list[PlacementScore]]:
+    """Get latest placement scores for many fleets at once.
+
+    Args:
+        fleet_ids: Request group IDs
+        az: Optional availability zone filter
+        target_capacity: Optional target capacity filter
+
+    Returns:
+        Mapping of group ID → PlacementScore objects
+    """
+    return get_service().get_latest_placement_scores_bulk(
+        fleet_ids, az=az, target_capacity=target_capacity
+    )
 
 
 def get_fleet_placement_score_history(
@@ -73,7 +193,7 @@ def get_fleet_placement_score_history(
     Returns:
         List of PlacementScore objects
     """
-    return _service.get_placement_score_history(
+    return get_service().get_placement_score_history(
         fleet_id,
         since=since,
         until=until,
@@ -83,6 +203,41 @@ def get_fleet_placement_score_history(
     )
 
 
+def get_fleet_placement_score_frame(
+    fleet_id: str | int,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    az: str | None = None,
+    target_capacity: int | None = None,
+    limit: int = 500,
+    max_points: int | None = None,
+) -> PlacementScoreFrame:
+    """Get placement score history for a fleet as a columnar frame.
+
+    Args:
+        fleet_id: Request group ID or name
+        since: Start time (defaults to 24 hours ago)
+        until: End time (defaults to now)
+        az: Optional availability zone filter
+        target_capacity: Optional target capacity filter
+        limit: Maximum number of results
+        max_points: Optional per-series row cap for charts (min/max downsampling)
+
+    Returns:
+        PlacementScoreFrame
+    """
+    return get_service().get_placement_score_frame(
+        fleet_id,
+        since=since,
+        until=until,
+        az=az,
+        target_capacity=target_capacity,
+        limit=limit,
+        max_points=max_points,
+    )
+
+
 def get_pool_interruption_rates(
     pool_id: int,
     *,
@@ -101,22 +256,35 @@ def get_pool_interruption_rates(
     Returns:
         List of InterruptionRate objects
     """
-    return _service.get_pool_interruption_history(pool_id, since=since, until=until, limit=limit)
+    return get_service().get_pool_interruption_history(pool_id, since=since, until=until, limit=limit)
 
 
 def get_available_pools(
-    *, region: str | None = None, instance_type: str | None = None
+    *,
+    region: str | None = None,
+    instance_type: str | None = None,
+    az: str | None = None,
 ) -> list[InstancePool]:
     """Get available instance pools.
 
     Args:
         region: Optional region filter
         instance_type: Optional instance type filter
+        az: Optional availability zone filter
 
     Returns:
         List of InstancePool objects
     """
-    return _service.get_available_pools(region=region, instance_type=instance_type)
+    return get_service().get_available_pools(region=region, instance_type=instance_type, az=az)
+
+
+def get_pool_catalog() -> PoolCatalog:
+    """Get the indexed in-memory pool catalog (for scoring / hardware selection).
+
+    Returns:
+        PoolCatalog instance
+    """
+    return get_service().pool_catalog
 
 
 def get_pool(pool_id: int) -> InstancePool:
@@ -128,7 +296,7 @@ def get_pool(pool_id: int) -> InstancePool:
     Returns:
         InstancePool object
     """
-    return _service.get_pool(pool_id)
+    return get_service().get_pool(pool_id)
 
 
 def get_spot_prices(
@@ -155,7 +323,7 @@ def get_spot_prices(
     Returns:
         List of SpotPrice objects
     """
-    return _service.get_spot_prices(
+    return get_service().get_spot_prices(
         pool_id=pool_id,
         instance_type=instance_type,
         region=region,
@@ -175,4 +343,4 @@ def get_latest_spot_price(pool_id: int) -> SpotPrice:
     Returns:
         SpotPrice object
     """
-    return _service.get_latest_spot_price(pool_id)
\ No newline at end of file
+    return get_service().get_latest_spot_price(pool_id)
\ No newline at end of file
@@ -7,6 +7,11 @@ from __future__ import annotations
 
 import requests
 
+from src.backend.data.circuit_breaker import (
+    WATTTIME_UPSTREAM,
+    get_circuit_breaker,
+    is_upstream_failure,
+)
 from src.storage.config_store import CredentialsConfig
 
 
@@ -23,10 +28,14 @@ def get_watttime_token(credentials: CredentialsConfig) -> str:
         raise ValueError("Missing WattTime username/password in credentials.")
 
     login_url = "https://api.watttime.org/login"
-    resp = requests.get(login_url, auth=(username, password), timeout=30)
-    resp.raise_for_status()
+    breaker = get_circuit_breaker(WATTTIME_UPSTREAM)
 
-    data = resp.json()
+    def _request() -> dict:
+        resp = requests.get(login_url, auth=(username, password), timeout=breaker.timeout(30))
+        resp.raise_for_status()
+        return resp.json()
+
+    data = breaker.call(_request, is_failure=is_upstream_failure)
     token = data.get("token")
     if not token:
         raise ValueError("WattTime login response missing token.")
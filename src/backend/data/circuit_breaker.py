@@ -0,0 +1,292 @@
+"""Circuit breakers for upstream HTTP APIs.
+
+Each upstream (Spot Fleet API, NESO, WattTime) gets one process-wide breaker:
+
+- closed: calls go through; outcomes and latency are kept for a rolling window.
+  Once enough calls have failed, or were too slow, the breaker opens.
+- open: calls fail immediately with `CircuitOpenError`, so callers can serve
+  cached data instead of waiting out a full request timeout.
+- half-open: after the open period a limited number of probe calls are let
+  through with a short timeout. A successful probe closes the breaker. A failed
+  probe reopens it for twice as long, up to a cap.
+
+Breaker state is exposed through `snapshot()` / `circuit_stats()` for the UI.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, TypeVar
+
+import requests
+
+from src.config.defaults import (
+    DEFAULT_CIRCUIT_FAILURE_RATE_THRESHOLD,
+    DEFAULT_CIRCUIT_MAX_OPEN_SECONDS,
+    DEFAULT_CIRCUIT_MINIMUM_CALLS,
+    DEFAULT_CIRCUIT_OPEN_SECONDS,
+    DEFAULT_CIRCUIT_PROBE_TIMEOUT_SECONDS,
+    DEFAULT_CIRCUIT_SLOW_CALL_SECONDS,
+    DEFAULT_CIRCUIT_WINDOW_SECONDS,
+)
+
+T = TypeVar("T")
+
+# Upstream names used with `get_circuit_breaker`.
+SPOT_FLEET_UPSTREAM = "spot_fleet"
+NESO_UPSTREAM = "neso"
+WATTTIME_UPSTREAM = "watttime"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, name: str, retry_after_seconds: float) -> None:
+        super().__init__(
+            f"{name} upstream is unavailable (circuit open, retry in {retry_after_seconds:.0f}s)"
+        )
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitStats:
+    """Point-in-time view of a breaker."""
+
+    name: str
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    mean_latency_seconds: float | None
+    retry_after_seconds: float | None
+
+    @property
+    def is_degraded(self) -> bool:
+        return self.state is not CircuitState.CLOSED
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Whether an exception from `requests` says the upstream is unhealthy.
+
+    Client errors (4xx other than 429) mean the upstream answered, so they do not
+    count against the breaker.
+    """
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return True
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_seconds: float = DEFAULT_CIRCUIT_WINDOW_SECONDS,
+        minimum_calls: int = DEFAULT_CIRCUIT_MINIMUM_CALLS,
+        failure_rate_threshold: float = DEFAULT_CIRCUIT_FAILURE_RATE_THRESHOLD,
+        slow_call_seconds: float = DEFAULT_CIRCUIT_SLOW_CALL_SECONDS,
+        open_seconds: float = DEFAULT_CIRCUIT_OPEN_SECONDS,
+        max_open_seconds: float = DEFAULT_CIRCUIT_MAX_OPEN_SECONDS,
+        half_open_max_calls: int = 1,
+        probe_timeout_seconds: float = DEFAULT_CIRCUIT_PROBE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Upstream name (used in errors and the UI).
+            window_seconds: Length of the rolling outcome window.
+            minimum_calls: Calls needed in the window before the breaker may open.
+            failure_rate_threshold: Failure fraction (0–1) that opens the breaker.
+            slow_call_seconds: Calls slower than this count as failures.
+            open_seconds: Initial time to fail fast before probing.
+            max_open_seconds: Cap for the open period after repeated failed probes.
+            half_open_max_calls: Concurrent probe calls allowed while half-open.
+            probe_timeout_seconds: Request timeout suggested for probe calls.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.name = name
+        self.window_seconds = float(window_seconds)
+        self.minimum_calls = int(minimum_calls)
+        self.failure_rate_threshold = float(failure_rate_threshold)
+        self.slow_call_seconds = float(slow_call_seconds)
+        self.open_seconds = float(open_seconds)
+        self.max_open_seconds = float(max_open_seconds)
+        self.half_open_max_calls = int(half_open_max_calls)
+        self.probe_timeout_seconds = float(probe_timeout_seconds)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        # (finished_at, failed, latency_seconds)
+        self._outcomes: deque[tuple[float, bool, float]] = deque()
+        self._open_until = 0.0
+        self._current_open_seconds = self.open_seconds
+        self._probes_in_flight = 0
+
+    # --- State ---
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    @property
+    def is_degraded(self) -> bool:
+        return self.state is not CircuitState.CLOSED
+
+    def snapshot(self) -> CircuitStats:
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            calls = len(self._outcomes)
+            failures = sum(1 for _, failed, _ in self._outcomes if failed)
+            latency = sum(lat for _, _, lat in self._outcomes) / calls if calls else None
+            retry_after = (
+                max(self._open_until - now, 0.0) if self._state is CircuitState.OPEN else None
+            )
+            return CircuitStats(
+                name=self.name,
+                state=self._state,
+                calls=calls,
+                failure_rate=failures / calls if calls else 0.0,
+                mean_latency_seconds=latency,
+                retry_after_seconds=retry_after,
+            )
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded outcomes."""
+        with self._lock:
+            self._close()
+
+    def timeout(self, default: float) -> float:
+        """Request timeout to use now: shortened while probing a half-open upstream."""
+        if self.state is CircuitState.HALF_OPEN:
+            return min(default, self.probe_timeout_seconds)
+        return default
+
+    # --- Calls ---
+    def call(
+        self,
+        fn: Callable[[], T],
+        *,
+        is_failure: Callable[[BaseException], bool] | None = None,
+    ) -> T:
+        """Run `fn` through the breaker.
+
+        Args:
+            fn: Zero-argument callable performing the upstream request.
+            is_failure: Classifies exceptions raised by `fn`; those returning False
+                (e.g. HTTP 404) are re-raised without counting as failures.
+
+        Returns:
+            Whatever `fn` returns.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or half-open with a probe
+                already in flight).
+        """
+        probe = self._admit()
+        started = self._clock()
+        try:
+            result = fn()
+        except BaseException as exc:
+            failed = is_failure(exc) if is_failure is not None else True
+            self._record(probe, failed=failed, latency=self._clock() - started)
+            raise
+        self._record(probe, failed=False, latency=self._clock() - started)
+        return result
+
+    def _admit(self) -> bool:
+        """Let a call through or raise; returns True if the call is a probe."""
+        with self._lock:
+            now = self._clock()
+            if self._state is CircuitState.OPEN:
+                if now < self._open_until:
+                    raise CircuitOpenError(self.name, self._open_until - now)
+                self._state = CircuitState.HALF_OPEN
+                self._probes_in_flight = 0
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def _record(self, probe: bool, *, failed: bool, latency: float) -> None:
+        failed = failed or latency > self.slow_call_seconds
+        with self._lock:
+            now = self._clock()
+            if probe and self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                if failed:
+                    self._current_open_seconds = min(
+                        self._current_open_seconds * 2, self.max_open_seconds
+                    )
+                    self._open(now)
+                else:
+                    self._close()
+                return
+
+            self._outcomes.append((now, failed, latency))
+            self._trim(now)
+            if self._state is CircuitState.CLOSED and self._should_open():
+                self._open(now)
+
+    # --- Internals (call with the lock held) ---
+    def _trim(self, now: float) -> None:
+        horizon = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            self._outcomes.popleft()
+
+    def _should_open(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures = sum(1 for _, failed, _ in self._outcomes if failed)
+        return failures / calls >= self.failure_rate_threshold
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._open_until = now + self._current_open_seconds
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._current_open_seconds = self.open_seconds
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get (or create) the process-wide breaker for an upstream."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name)
+                _breakers[name] = breaker
+    return breaker
+
+
+def circuit_stats() -> dict[str, CircuitStats]:
+    """Snapshot every breaker created so far, keyed by upstream name."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.snapshot() for b in breakers}
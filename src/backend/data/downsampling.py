@@ -0,0 +1,284 @@
+"""Visual downsampling for long time series.
+
+A week of placement scores, spot prices or carbon intensity can be tens of
+thousands of points, while a terminal chart is at most a couple of hundred
+columns wide. These helpers pick a subset of rows that preserves the visual
+shape and never exceeds the target width:
+
+- "lttb": Largest-Triangle-Three-Buckets. It keeps the point in each bucket
+  that forms the largest triangle with its neighbours, which suits line charts
+  of smooth-ish signals (prices, carbon).
+- "minmax": the min and max of each time bucket, in time order. It preserves
+  spikes and dips exactly, which suits step-like signals (placement scores) and
+  per-column range bars.
+
+Selections are returned as indexes into the source arrays, so callers can
+decimate any set of parallel columns (or a `PlacementScoreFrame`) consistently.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Literal, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.frames import FrameKey, PlacementScoreFrame
+from src.backend.data.fleet.models import InterruptionRate, SpotPrice
+from src.models.carbon_intensity import CarbonIntensitySeries
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+
+@dataclass(frozen=True, slots=True)
+class DownsampledSeries:
+    """A decimated (x, y) series and the source rows it was taken from."""
+
+    x: np.ndarray
+    y: np.ndarray
+    index: np.ndarray
+    source_size: int
+
+    def __len__(self) -> int:
+        return int(self.index.shape[0])
+
+    @property
+    def is_decimated(self) -> bool:
+        return len(self) < self.source_size
+
+
+def _as_float_axis(x: np.ndarray) -> np.ndarray:
+    """Numeric x axis (datetime64 → epoch seconds as float)."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[s]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64, copy=False)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indexes selected by Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Monotonically increasing x values (float).
+        y: Values (float, no NaN).
+        n_out: Maximum number of points to keep.
+
+    Returns:
+        Sorted integer indexes (always including the first and last point when
+        `n_out >= 2`).
+    """
+    n = int(x.shape[0])
+    if n_out >= n:
+        return np.arange(n, dtype=np.int64)
+    if n_out <= 0:
+        return np.empty(0, dtype=np.int64)
+    if n_out == 1:
+        return np.array([n - 1], dtype=np.int64)
+    if n_out == 2:
+        return np.array([0, n - 1], dtype=np.int64)
+
+    n_buckets = n_out - 2
+    # Bucket b covers [edges[b], edges[b + 1]) of the interior points 1..n-2.
+    edges = (1 + np.floor(np.arange(n_buckets + 1) * (n - 2) / n_buckets)).astype(np.int64)
+    edges[-1] = n - 1
+
+    # Mean of every bucket via prefix sums; the "next bucket" of the last bucket
+    # is the final point.
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    width = np.maximum(edges[1:] - edges[:-1], 1)
+    mean_x = (cx[edges[1:]] - cx[edges[:-1]]) / width
+    mean_y = (cy[edges[1:]] - cy[edges[:-1]]) / width
+    next_x = np.append(mean_x[1:], x[n - 1])
+    next_y = np.append(mean_y[1:], y[n - 1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for b in range(n_buckets):
+        lo, hi = edges[b], edges[b + 1]
+        if hi <= lo:
+            selected[b + 1] = lo
+            continue
+        ax, ay = x[a], y[a]
+        # Twice the triangle area (a, candidate, next-bucket mean); the constant
+        # factor does not change the argmax.
+        area = np.abs((ax - next_x[b]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[b] - ay))
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indexes of the min and max of each of `n_out // 2` equal-width x buckets.
+
+    Args:
+        x: x values (float, any order).
+        y: Values (float, no NaN).
+        n_out: Maximum number of points to keep.
+
+    Returns:
+        Sorted integer indexes; at most `n_out` of them.
+    """
+    n = int(x.shape[0])
+    if n_out >= n:
+        return np.arange(n, dtype=np.int64)
+    if n_out <= 0:
+        return np.empty(0, dtype=np.int64)
+    n_buckets = max(n_out // 2, 1)
+
+    x0, x1 = float(x.min()), float(x.max())
+    span = x1 - x0
+    if span <= 0:
+        bucket = np.zeros(n, dtype=np.int64)
+    else:
+        bucket = np.minimum(((x - x0) / span * n_buckets).astype(np.int64), n_buckets - 1)
+
+    order = np.lexsort((y, bucket))
+    b_sorted = bucket[order]
+    boundary = b_sorted[1:] != b_sorted[:-1]
+    first = np.concatenate([[True], boundary])
+    last = np.concatenate([boundary, [True]])
+    picked = np.union1d(order[first], order[last])
+    if n_out == 1:
+        # One point per bucket is all that fits: keep the maxima.
+        picked = np.sort(order[last])
+    return picked.astype(np.int64, copy=False)
+
+
+def downsample_indices(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int,
+    *,
+    method: DownsampleMethod = "lttb",
+) -> np.ndarray:
+    """Indexes (into `x`/`y`) of at most `n_out` points that keep the series' shape.
+
+    NaN values are never selected. `x` must be sorted ascending for "lttb".
+    """
+    xf = _as_float_axis(x)
+    yf = np.asarray(y, dtype=np.float64)
+    valid = ~np.isnan(yf)
+    if valid.all():
+        source = None
+    else:
+        source = np.flatnonzero(valid)
+        xf, yf = xf[source], yf[source]
+
+    if method == "lttb":
+        picked = lttb_indices(xf, yf, n_out)
+    elif method == "minmax":
+        picked = minmax_indices(xf, yf, n_out)
+    else:
+        raise ValueError(f"Unknown downsampling method: {method!r}")
+    return picked if source is None else source[picked]
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    width: int,
+    *,
+    method: DownsampleMethod = "lttb",
+) -> DownsampledSeries:
+    """Decimate a series to at most `width` points.
+
+    Args:
+        x: Sorted x values (numbers or `datetime64`).
+        y: Values, same length as `x`.
+        width: Target width in points (e.g. chart columns).
+        method: "lttb" or "minmax".
+
+    Returns:
+        DownsampledSeries whose `x`/`y` keep the input dtypes.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    index = downsample_indices(x, y, width, method=method)
+    return DownsampledSeries(x=x[index], y=y[index], index=index, source_size=int(x.shape[0]))
+
+
+# --- Adapters for the app's series types ---
+def carbon_series_arrays(series: CarbonIntensitySeries) -> tuple[np.ndarray, np.ndarray]:
+    """(`datetime64[s]` timestamps, gCO₂/kWh values) sorted by time."""
+    if not series.points:
+        return np.empty(0, dtype="datetime64[s]"), np.empty(0)
+    times = np.array([int(p.timestamp.timestamp()) for p in series.points], dtype=np.int64)
+    values = np.array([p.value_g_per_kwh for p in series.points], dtype=np.float64)
+    order = np.argsort(times, kind="stable")
+    return times[order].astype("datetime64[s]"), values[order]
+
+
+def downsample_carbon_series(
+    series: CarbonIntensitySeries,
+    width: int,
+    *,
+    method: DownsampleMethod = "lttb",
+) -> DownsampledSeries:
+    """Decimate a carbon intensity series (index refers to time-sorted points)."""
+    times, values = carbon_series_arrays(series)
+    return downsample(times, values, width, method=method)
+
+
+def downsample_pool_series(
+    items: Iterable[SpotPrice | InterruptionRate],
+    width: int,
+    *,
+    method: DownsampleMethod = "lttb",
+) -> dict[int, DownsampledSeries]:
+    """Decimate spot-price or interruption-rate history, one series per pool.
+
+    Returns:
+        Mapping of pool id → DownsampledSeries (`x` is `datetime64[s]`).
+    """
+    times_by_pool: dict[int, list[int]] = defaultdict(list)
+    values_by_pool: dict[int, list[float]] = defaultdict(list)
+    for item in items:
+        value = item.price if isinstance(item, SpotPrice) else item.rate
+        times_by_pool[item.pool_id].append(int(item.measured_at.timestamp()))
+        values_by_pool[item.pool_id].append(value)
+
+    out: dict[int, DownsampledSeries] = {}
+    for pool_id, raw_times in times_by_pool.items():
+        times = np.asarray(raw_times, dtype=np.int64)
+        order = np.argsort(times, kind="stable")
+        values = np.asarray(values_by_pool[pool_id], dtype=np.float64)[order]
+        out[pool_id] = downsample(times[order].astype("datetime64[s]"), values, width, method=method)
+    return out
+
+
+def downsample_frame(
+    frame: PlacementScoreFrame,
+    width: int,
+    *,
+    method: DownsampleMethod = "minmax",
+    by: Sequence[FrameKey] = ("group", "az", "capacity"),
+) -> PlacementScoreFrame:
+    """Decimate every (group, AZ, capacity) series of a frame to at most `width` rows.
+
+    Rows keep their original order, so the result is a drop-in replacement for
+    `frame` in chart code.
+    """
+    if len(frame) <= width:
+        return frame
+
+    codes, _ = frame.key_codes(by)
+    t = frame.epoch_seconds
+    order = np.lexsort((t, codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_codes[1:] != sorted_codes[:-1]]))
+    ends = np.append(starts[1:], order.shape[0])
+
+    keep: list[np.ndarray] = []
+    t_sorted = t[order]
+    y_sorted = frame.score[order]
+    for lo, hi in zip(starts, ends):
+        if hi - lo <= width:
+            keep.append(order[lo:hi])
+            continue
+        picked = downsample_indices(t_sorted[lo:hi], y_sorted[lo:hi], width, method=method)
+        keep.append(order[lo + picked])
+    return frame.take(np.sort(np.concatenate(keep)))
@@ -1,6 +1,7 @@
 """Spot Fleet data access module."""
 
 from src.backend.data.fleet.api_client import SpotFleetAPIClient
+from src.backend.data.fleet.frames import PlacementScoreFrame
 from src.backend.data.fleet.models import (
     InstancePool,
     InterruptionRate,
@@ -8,11 +9,22 @@ from src.backend.data.fleet.models import (
     RequestGroup,
     SpotPrice,
 )
+from src.backend.data.fleet.placement_changes import (
+    PlacementChange,
+    PlacementChangeKind,
+    PlacementSnapshotDiffer,
+)
+from src.backend.data.fleet.pool_catalog import PoolCatalog
 from src.backend.data.fleet.service import SpotFleetDataService
 
 __all__ = [
     "SpotFleetAPIClient",
     "SpotFleetDataService",
+    "PlacementScoreFrame",
+    "PoolCatalog",
+    "PlacementChange",
+    "PlacementChangeKind",
+    "PlacementSnapshotDiffer",
     "RequestGroup",
     "InstancePool",
     "PlacementScore",
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Sequence
 
 import requests
 
+from src.backend.data.circuit_breaker import (
+    SPOT_FLEET_UPSTREAM,
+    get_circuit_breaker,
+    is_upstream_failure,
+)
 from src.backend.data.fleet.models import (
     InstancePool,
     InterruptionRate,
@@ -16,6 +22,14 @@ from src.backend.data.fleet.models import (
 )
 from src.config.settings import get_spot_fleet_api_base_url, get_spot_fleet_api_key
 
+_REQUEST_TIMEOUT_SECONDS = 30
+# Bulk latest-score queries: group ids per request, and concurrency when the
+# server has no bulk endpoint and each group is fetched separately.
+_BULK_GROUPS_PER_REQUEST = 100
+_FAN_OUT_WORKERS = 8
+# Statuses from the bulk route meaning "no such route" rather than a bad request.
+_BULK_ROUTE_MISSING_STATUSES = (400, 403, 404, 405)
+
 
 class SpotFleetAPIClient:
     """HTTP client for Spot Fleet API."""
@@ -29,6 +43,8 @@ class SpotFleetAPIClient:
         """
         self.base_url = (base_url or get_spot_fleet_api_base_url()).rstrip("/")
         self.api_key = api_key if api_key is not None else get_spot_fleet_api_key()
+        # Whether the server has a bulk latest-scores endpoint (None until probed).
+        self._bulk_latest_supported: bool | None = None
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make a GET request to the API.
@@ -42,15 +58,26 @@ class SpotFleetAPIClient:
 
         Raises:
             requests.RequestException: If the request fails
+            CircuitOpenError: If the API is failing and requests are short-circuited
         """
         url = f"{self.base_url}{endpoint}"
         headers: dict[str, str] = {}
         if self.api_key:
             headers["x-api-key"] = self.api_key
 
-        response = requests.get(url, params=params, headers=headers or None, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        breaker = get_circuit_breaker(SPOT_FLEET_UPSTREAM)
+
+        def _request() -> Any:
+            response = requests.get(
+                url,
+                params=params,
+                headers=headers or None,
+                timeout=breaker.timeout(_REQUEST_TIMEOUT_SECONDS),
+            )
+            response.raise_for_status()
+            return response.json()
+
+        return breaker.call(_request, is_failure=is_upstream_failure)
 
     def get_request_groups(self) -> list[RequestGroup]:
         """List all request groups.
@@ -58,9 +85,17 @@ class SpotFleetAPIClient:
         Returns:
             List of RequestGroup objects
         """
-        data = self._get("/request-groups")
+        data = self.get_request_groups_payload()
         return [RequestGroup.from_dict(item) for item in data]
 
+    def get_request_groups_payload(self) -> list[dict[str, Any]]:
+        """List all request groups as raw API response dictionaries (for caching).
+
+        Returns:
+            List of API response dictionaries
+        """
+        return self._get("/request-groups")
+
     def get_request_group(self, id_or_name: str | int) -> RequestGroup:
         """Get a single request group by ID or name.
 
@@ -98,6 +133,35 @@ class SpotFleetAPIClient:
         Returns:
             List of PlacementScore objects
         """
+        data = self.get_placement_scores_payload(
+            request_group_id,
+            since=since,
+            until=until,
+            az=az,
+            target_capacity=target_capacity,
+            order=order,
+            limit=limit,
+        )
+        return PlacementScore.from_dicts(data)
+
+    def get_placement_scores_payload(
+        self,
+        request_group_id: str | int,
+        *,
+        since: str | None = None,
+        until: str | None = None,
+        az: str | None = None,
+        target_capacity: int | None = None,
+        order: str = "desc",
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Get raw placement score history items (for columnar consumers).
+
+        Accepts the same arguments as `get_placement_scores`.
+
+        Returns:
+            List of API response dictionaries
+        """
         params: dict[str, Any] = {"order": order, "limit": limit}
         if since:
             params["since"] = since
@@ -108,10 +172,9 @@ class SpotFleetAPIClient:
         if target_capacity is not None:
             params["target_capacity"] = target_capacity
 
-        data = self._get(
+        return self._get(
             f"/request-groups/{request_group_id}/placement-scores", params=params
         )
-        return [PlacementScore.from_dict(item) for item in data]
 
     def get_latest_placement_scores(
         self,
@@ -139,7 +202,115 @@ class SpotFleetAPIClient:
         data = self._get(
             f"/request-groups/{request_group_id}/placement-scores/latest", params=params
         )
-        return [PlacementScore.from_dict(item) for item in data]
+        return PlacementScore.from_dicts(data)
+
+    def get_latest_placement_scores_bulk(
+        self,
+        request_group_ids: Sequence[int],
+        *,
+        az: str | None = None,
+        target_capacity: int | None = None,
+    ) -> dict[int, list[PlacementScore]]:
+        """Get latest placement scores for many request groups.
+
+        Uses the bulk `/placement-scores/latest?group_ids=...` endpoint when the
+        server has one. Otherwise each group's `/latest` endpoint is fetched
+        concurrently. Unknown routes answer 404/405, or 403 "Missing
+        Authentication Token" behind API Gateway (400 from some proxies), so
+        those statuses fall back too; the route is only remembered as missing
+        once the per-group requests succeed, so a rejected API key is not.
+
+        Args:
+            request_group_ids: Request group IDs
+            az: Optional availability zone filter
+            target_capacity: Optional target capacity filter
+
+        Returns:
+            Mapping of group ID → PlacementScore objects. Groups whose request
+            (or bulk chunk) failed are omitted.
+
+        Raises:
+            requests.RequestException: If every request failed
+        """
+        ids = list(dict.fromkeys(int(gid) for gid in request_group_ids))
+        if not ids:
+            return {}
+
+        if self._bulk_latest_supported is not False:
+            try:
+                result = self._get_latest_placement_scores_bulk(
+                    ids, az=az, target_capacity=target_capacity
+                )
+                self._bulk_latest_supported = True
+                return result
+            except requests.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if status not in _BULK_ROUTE_MISSING_STATUSES:
+                    raise
+            result = self._fan_out_latest_placement_scores(ids, az=az, target_capacity=target_capacity)
+            self._bulk_latest_supported = False
+            return result
+
+        return self._fan_out_latest_placement_scores(ids, az=az, target_capacity=target_capacity)
+
+    def _get_latest_placement_scores_bulk(
+        self,
+        ids: list[int],
+        *,
+        az: str | None,
+        target_capacity: int | None,
+    ) -> dict[int, list[PlacementScore]]:
+        """Bulk-fetch latest scores chunk by chunk.
+
+        Raises:
+            requests.RequestException: If the first chunk fails. Later failed
+                chunks are omitted from the result instead.
+        """
+        result: dict[int, list[PlacementScore]] = {}
+        for i in range(0, len(ids), _BULK_GROUPS_PER_REQUEST):
+            chunk = ids[i : i + _BULK_GROUPS_PER_REQUEST]
+            params: dict[str, Any] = {"group_ids": ",".join(str(gid) for gid in chunk)}
+            if az:
+                params["az"] = az
+            if target_capacity is not None:
+                params["target_capacity"] = target_capacity
+            try:
+                data = self._get("/placement-scores/latest", params=params)
+            except Exception:
+                # Best-effort past the first chunk: keep what was fetched.
+                if i == 0:
+                    raise
+                continue
+            for gid in chunk:
+                result[gid] = []
+            for score in PlacementScore.from_dicts(data):
+                result.setdefault(score.request_group_id, []).append(score)
+        return result
+
+    def _fan_out_latest_placement_scores(
+        self,
+        ids: list[int],
+        *,
+        az: str | None,
+        target_capacity: int | None,
+    ) -> dict[int, list[PlacementScore]]:
+        result: dict[int, list[PlacementScore]] = {}
+        errors: list[Exception] = []
+        with ThreadPoolExecutor(max_workers=min(_FAN_OUT_WORKERS, len(ids))) as pool:
+            futures = {
+                pool.submit(
+                    self.get_latest_placement_scores, gid, az=az, target_capacity=target_capacity
+                ): gid
+                for gid in ids
+            }
+            for future in as_completed(futures):
+                try:
+                    result[futures[future]] = future.result()
+                except Exception as exc:
+                    errors.append(exc)
+        if errors and not result:
+            raise errors[0]
+        return {gid: result[gid] for gid in ids if gid in result}
 
     def get_pools(self) -> list[InstancePool]:
         """List all instance pools.
@@ -204,7 +375,7 @@ class SpotFleetAPIClient:
             params["until"] = until
 
         data = self._get("/spot-prices", params=params)
-        return [SpotPrice.from_dict(item) for item in data]
+        return SpotPrice.from_dicts(data)
 
     def get_pool_spot_prices(
         self,
@@ -234,7 +405,7 @@ class SpotFleetAPIClient:
             params["until"] = until
 
         data = self._get(f"/pools/{pool_id}/spot-prices", params=params)
-        return [SpotPrice.from_dict(item) for item in data]
+        return SpotPrice.from_dicts(data)
 
     def get_latest_spot_price(self, pool_id: int) -> SpotPrice:
         """Get the latest spot price for a specific pool.
@@ -290,7 +461,7 @@ class SpotFleetAPIClient:
             params["until"] = until
 
         data = self._get("/interruption-rates", params=params)
-        return [InterruptionRate.from_dict(item) for item in data]
+        return InterruptionRate.from_dicts(data)
 
     def get_pool_interruption_rates(
         self,
@@ -320,4 +491,4 @@ class SpotFleetAPIClient:
             params["until"] = until
 
         data = self._get(f"/pools/{pool_id}/interruption-rates", params=params)
-        return [InterruptionRate.from_dict(item) for item in data]
+        return InterruptionRate.from_dicts(data)
@@ -0,0 +1,402 @@
+"""Columnar containers for Spot Fleet time series.
+
+`PlacementScoreFrame` holds placement score history as parallel NumPy arrays so
+per-AZ / per-capacity analysis (forecasting, charts) never has to loop over
+`PlacementScore` objects.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Literal, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.models import PlacementScore, _parse_iso_datetime
+
+# Column names accepted by the `by=` arguments below.
+FrameKey = Literal["group", "az", "capacity"]
+AggName = Literal["mean", "min", "max", "count", "sum"]
+
+_DEFAULT_KEYS: tuple[FrameKey, ...] = ("group", "az", "capacity")
+
+
+def _to_epoch_seconds(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+@dataclass(frozen=True, slots=True)
+class GroupedScores:
+    """Result of `PlacementScoreFrame.group_by` (one row per key)."""
+
+    keys: dict[str, np.ndarray]
+    values: np.ndarray
+    count: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+
+@dataclass(frozen=True, slots=True)
+class PlacementScoreFrame:
+    """Placement score history stored column-wise.
+
+    `az_code` and `group_code` are categorical codes into `az_categories` and
+    `group_categories`; `measured_at` is `datetime64[s]` in UTC.
+    """
+
+    measured_at: np.ndarray
+    score: np.ndarray
+    az_code: np.ndarray
+    target_capacity: np.ndarray
+    group_code: np.ndarray
+    az_categories: tuple[str, ...] = ()
+    group_categories: tuple[int, ...] = ()
+
+    # --- Construction ---
+    @classmethod
+    def empty(cls) -> PlacementScoreFrame:
+        return cls(
+            measured_at=np.empty(0, dtype="datetime64[s]"),
+            score=np.empty(0, dtype=np.float64),
+            az_code=np.empty(0, dtype=np.int32),
+            target_capacity=np.empty(0, dtype=np.int32),
+            group_code=np.empty(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        measured_at: Sequence[int] | np.ndarray,
+        score: Sequence[float] | np.ndarray,
+        availability_zone: Sequence[str] | np.ndarray,
+        target_capacity: Sequence[int] | np.ndarray,
+        group_id: Sequence[int] | np.ndarray,
+    ) -> PlacementScoreFrame:
+        """Build a frame from raw columns (`measured_at` as epoch seconds or datetime64)."""
+        ts = np.asarray(measured_at)
+        if not np.issubdtype(ts.dtype, np.datetime64):
+            ts = ts.astype(np.int64).astype("datetime64[s]")
+        else:
+            ts = ts.astype("datetime64[s]")
+        if ts.size == 0:
+            return cls.empty()
+
+        az_values, az_code = np.unique(np.asarray(availability_zone, dtype=object), return_inverse=True)
+        group_values, group_code = np.unique(np.asarray(group_id, dtype=np.int64), return_inverse=True)
+        return cls(
+            measured_at=ts,
+            score=np.asarray(score, dtype=np.float64),
+            az_code=az_code.astype(np.int32),
+            target_capacity=np.asarray(target_capacity, dtype=np.int32),
+            group_code=group_code.astype(np.int32),
+            az_categories=tuple(str(a) for a in az_values),
+            group_categories=tuple(int(g) for g in group_values),
+        )
+
+    @classmethod
+    def from_payload(cls, items: Iterable[dict[str, Any]]) -> PlacementScoreFrame:
+        """Build a frame directly from `/placement-scores` API response items."""
+        rows = list(items)
+        if not rows:
+            return cls.empty()
+
+        # Many AZs share a `measured_at`, so parse each distinct string once.
+        epoch_by_raw: dict[str, int] = {}
+        measured: list[int] = []
+        for item in rows:
+            raw = item["measured_at"]
+            epoch = epoch_by_raw.get(raw)
+            if epoch is None:
+                epoch = _to_epoch_seconds(_parse_iso_datetime(raw))
+                epoch_by_raw[raw] = epoch
+            measured.append(epoch)
+
+        return cls.from_columns(
+            measured_at=np.asarray(measured, dtype=np.int64),
+            score=[float(item["placement_score"]) for item in rows],
+            availability_zone=[str(item["availability_zone"]) for item in rows],
+            target_capacity=[int(item["target_capacity"]) for item in rows],
+            group_id=[int(item["group_id"]) for item in rows],
+        )
+
+    @classmethod
+    def from_scores(cls, scores: Iterable[PlacementScore]) -> PlacementScoreFrame:
+        """Build a frame from already-parsed `PlacementScore` objects."""
+        rows = list(scores)
+        if not rows:
+            return cls.empty()
+        return cls.from_columns(
+            measured_at=np.asarray([_to_epoch_seconds(s.measured_at) for s in rows], dtype=np.int64),
+            score=[s.score for s in rows],
+            availability_zone=[s.availability_zone for s in rows],
+            target_capacity=[s.target_capacity for s in rows],
+            group_id=[s.request_group_id for s in rows],
+        )
+
+    @classmethod
+    def concat(cls, frames: Iterable[PlacementScoreFrame]) -> PlacementScoreFrame:
+        """Concatenate frames, re-coding categories into a shared vocabulary."""
+        parts = [f for f in frames if len(f)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls.from_columns(
+            measured_at=np.concatenate([f.measured_at for f in parts]),
+            score=np.concatenate([f.score for f in parts]),
+            availability_zone=np.concatenate([f.availability_zone for f in parts]),
+            target_capacity=np.concatenate([f.target_capacity for f in parts]),
+            group_id=np.concatenate([f.group_id for f in parts]),
+        )
+
+    # --- Basic accessors ---
+    def __len__(self) -> int:
+        return int(self.score.shape[0])
+
+    @property
+    def availability_zone(self) -> np.ndarray:
+        """Decoded AZ names (object array)."""
+        if not len(self):
+            return np.empty(0, dtype=object)
+        return np.asarray(self.az_categories, dtype=object)[self.az_code]
+
+    @property
+    def group_id(self) -> np.ndarray:
+        """Decoded request group ids."""
+        if not len(self):
+            return np.empty(0, dtype=np.int64)
+        return np.asarray(self.group_categories, dtype=np.int64)[self.group_code]
+
+    @property
+    def epoch_seconds(self) -> np.ndarray:
+        return self.measured_at.astype(np.int64)
+
+    def latest_measured_at(self) -> datetime | None:
+        if not len(self):
+            return None
+        return datetime.fromtimestamp(int(self.epoch_seconds.max()), tz=timezone.utc)
+
+    def take(self, index: np.ndarray) -> PlacementScoreFrame:
+        """Return a frame with the given rows (boolean mask or integer index)."""
+        return PlacementScoreFrame(
+            measured_at=self.measured_at[index],
+            score=self.score[index],
+            az_code=self.az_code[index],
+            target_capacity=self.target_capacity[index],
+            group_code=self.group_code[index],
+            az_categories=self.az_categories,
+            group_categories=self.group_categories,
+        )
+
+    def filter(
+        self,
+        *,
+        group_id: int | None = None,
+        az: str | None = None,
+        target_capacity: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> PlacementScoreFrame:
+        mask = np.ones(len(self), dtype=bool)
+        if group_id is not None:
+            if group_id not in self.group_categories:
+                return self.take(np.zeros(len(self), dtype=bool))
+            mask &= self.group_code == self.group_categories.index(group_id)
+        if az is not None:
+            if az not in self.az_categories:
+                return self.take(np.zeros(len(self), dtype=bool))
+            mask &= self.az_code == self.az_categories.index(az)
+        if target_capacity is not None:
+            mask &= self.target_capacity == target_capacity
+        if since is not None:
+            mask &= self.epoch_seconds >= _to_epoch_seconds(since)
+        if until is not None:
+            mask &= self.epoch_seconds <= _to_epoch_seconds(until)
+        return self.take(mask)
+
+    def to_scores(self) -> list[PlacementScore]:
+        """Materialise rows back into `PlacementScore` objects."""
+        azs = self.availability_zone
+        groups = self.group_id
+        return [
+            PlacementScore(
+                measured_at=datetime.fromtimestamp(int(ts), tz=timezone.utc),
+                score=float(score),
+                availability_zone=str(az),
+                target_capacity=int(cap),
+                request_group_id=int(group),
+            )
+            for ts, score, az, cap, group in zip(
+                self.epoch_seconds, self.score, azs, self.target_capacity, groups
+            )
+        ]
+
+    # --- Keys ---
+    def _key_column(self, key: FrameKey) -> np.ndarray:
+        if key == "group":
+            return self.group_code.astype(np.int64)
+        if key == "az":
+            return self.az_code.astype(np.int64)
+        if key == "capacity":
+            return self.target_capacity.astype(np.int64)
+        raise ValueError(f"Unknown frame key: {key!r}")
+
+    def key_codes(self, by: Sequence[FrameKey] = _DEFAULT_KEYS) -> tuple[np.ndarray, np.ndarray]:
+        """Return (`codes`, `unique_rows`) for the composite key `by`.
+
+        `codes[i]` is the dense key index of row `i`; `unique_rows` has one row per
+        key with the raw (still categorical) key columns in `by` order.
+        """
+        if not by:
+            return np.zeros(len(self), dtype=np.int64), np.empty((1, 0), dtype=np.int64)
+        if not len(self):
+            return np.empty(0, dtype=np.int64), np.empty((0, len(by)), dtype=np.int64)
+
+        # Pack the key columns into one int64 (mixed radix) so a 1-D unique does the
+        # work; `np.unique(axis=0)` on a stacked 2-D array is an order of magnitude slower.
+        columns = [self._key_column(k) for k in by]
+        lows = [int(col.min()) for col in columns]
+        spans = [int(col.max()) - lo + 1 for col, lo in zip(columns, lows)]
+        packed = np.zeros(len(self), dtype=np.int64)
+        for col, lo, span in zip(columns, lows, spans):
+            packed = packed * span + (col - lo)
+        unique_packed, codes = np.unique(packed, return_inverse=True)
+
+        unique_rows = np.empty((unique_packed.shape[0], len(by)), dtype=np.int64)
+        remainder = unique_packed
+        for j in range(len(by) - 1, -1, -1):
+            unique_rows[:, j] = remainder % spans[j] + lows[j]
+            remainder = remainder // spans[j]
+        return codes.reshape(-1).astype(np.int64), unique_rows
+
+    def decode_keys(self, by: Sequence[FrameKey], unique_rows: np.ndarray) -> dict[str, np.ndarray]:
+        keys: dict[str, np.ndarray] = {}
+        for col, key in enumerate(by):
+            raw = unique_rows[:, col]
+            if key == "group":
+                keys["group_id"] = np.asarray(self.group_categories, dtype=np.int64)[raw]
+            elif key == "az":
+                keys["availability_zone"] = np.asarray(self.az_categories, dtype=object)[raw]
+            else:
+                keys["target_capacity"] = raw.astype(np.int32)
+        return keys
+
+    # --- Vectorised analysis ---
+    def group_by(self, by: Sequence[FrameKey] = ("az",), *, agg: AggName = "mean") -> GroupedScores:
+        """Aggregate scores per composite key."""
+        if not len(self):
+            return GroupedScores(keys={}, values=np.empty(0), count=np.empty(0, dtype=np.int64))
+
+        codes, unique_rows = self.key_codes(by)
+        n_keys = unique_rows.shape[0]
+        count = np.bincount(codes, minlength=n_keys)
+        if agg in ("mean", "sum"):
+            total = np.bincount(codes, weights=self.score, minlength=n_keys)
+            values = total / count if agg == "mean" else total
+        elif agg == "min":
+            values = np.full(n_keys, np.inf)
+            np.minimum.at(values, codes, self.score)
+        elif agg == "max":
+            values = np.full(n_keys, -np.inf)
+            np.maximum.at(values, codes, self.score)
+        elif agg == "count":
+            values = count.astype(np.float64)
+        else:
+            raise ValueError(f"Unknown aggregation: {agg!r}")
+        return GroupedScores(keys=self.decode_keys(by, unique_rows), values=values, count=count)
+
+    def latest_per_key(self, by: Sequence[FrameKey] = _DEFAULT_KEYS) -> PlacementScoreFrame:
+        """Return the most recent row for each composite key."""
+        if not len(self):
+            return self
+        codes, _ = self.key_codes(by)
+        order = np.lexsort((self.epoch_seconds, codes))
+        sorted_codes = codes[order]
+        is_last = np.ones(sorted_codes.shape[0], dtype=bool)
+        is_last[:-1] = sorted_codes[1:] != sorted_codes[:-1]
+        return self.take(order[is_last])
+
+    def rolling_mean(
+        self, window: timedelta, *, by: Sequence[FrameKey] = _DEFAULT_KEYS
+    ) -> np.ndarray:
+        """Trailing time-window mean of `score` per key, aligned with the frame's rows.
+
+        Each row's value averages every row of the same key measured within
+        `(measured_at - window, measured_at]`.
+        """
+        n = len(self)
+        if not n:
+            return np.empty(0)
+        window_s = int(window.total_seconds())
+        if window_s <= 0:
+            raise ValueError("window must be positive")
+
+        codes, _ = self.key_codes(by)
+        t = self.epoch_seconds
+        t_rel = t - t.min()
+        # Offset each key into its own disjoint time band so a single searchsorted
+        # finds every row's window start without crossing key boundaries.
+        band = int(t_rel.max()) + window_s + 1
+        composite = codes * band + t_rel
+        order = np.argsort(composite, kind="stable")
+        comp_sorted = composite[order]
+        score_sorted = self.score[order]
+
+        csum = np.concatenate(([0.0], np.cumsum(score_sorted)))
+        start = np.searchsorted(comp_sorted, comp_sorted - window_s, side="right")
+        # Include later rows that share the exact same timestamp.
+        end = np.searchsorted(comp_sorted, comp_sorted, side="right")
+        means_sorted = (csum[end] - csum[start]) / (end - start)
+
+        out = np.empty(n)
+        out[order] = means_sorted
+        return out
+
+    def pivot_az(
+        self, *, freq: timedelta | None = None, agg: Literal["mean", "max", "min"] = "mean"
+    ) -> tuple[np.ndarray, tuple[str, ...], np.ndarray]:
+        """Pivot to a time × AZ matrix.
+
+        Args:
+            freq: Optional bucket width; timestamps are floored to it. If None, each
+                distinct `measured_at` becomes a row.
+            agg: How to combine multiple scores in the same (time, AZ) cell (e.g.
+                across target capacities).
+
+        Returns:
+            (`times` as datetime64[s], `azs`, `matrix`) where `matrix[i, j]` is NaN
+            when AZ `j` has no score in time bucket `i`.
+        """
+        if not len(self):
+            return np.empty(0, dtype="datetime64[s]"), (), np.empty((0, 0))
+
+        t = self.epoch_seconds
+        if freq is not None:
+            step = int(freq.total_seconds())
+            if step <= 0:
+                raise ValueError("freq must be positive")
+            t = (t // step) * step
+        times, time_idx = np.unique(t, return_inverse=True)
+        n_az = len(self.az_categories)
+        flat = time_idx.reshape(-1) * n_az + self.az_code
+        size = times.shape[0] * n_az
+
+        if agg == "mean":
+            count = np.bincount(flat, minlength=size)
+            total = np.bincount(flat, weights=self.score, minlength=size)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cells = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+        else:
+            fill = -np.inf if agg == "max" else np.inf
+            cells = np.full(size, fill)
+            ufunc = np.maximum if agg == "max" else np.minimum
+            ufunc.at(cells, flat, self.score)
+            cells[np.isinf(cells)] = np.nan
+
+        matrix = cells.reshape(times.shape[0], n_az)
+        return times.astype("datetime64[s]"), self.az_categories, matrix
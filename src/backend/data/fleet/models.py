@@ -4,17 +4,53 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable
 
 from dateutil.parser import isoparse
+from dateutil.tz import tzutc
+
+
+def _normalize_utc(dt: datetime) -> datetime:
+    """Use `timezone.utc` for zero-offset timestamps whichever parser produced them."""
+    if isinstance(dt.tzinfo, tzutc):
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_iso_fast(value: str) -> datetime:
+    """Parse ISO8601 via `datetime.fromisoformat`, falling back to dateutil's `isoparse`."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _normalize_utc(isoparse(value))
 
 
 def _parse_iso_datetime(value: str | None) -> datetime | None:
     """Parse ISO8601 datetime string to datetime object."""
     if value is None:
         return None
-    return isoparse(value)
+    return _parse_iso_fast(value)
+
+
+class _TimestampMemo:
+    """Memoising ISO8601 parser for a single response array.
+
+    Placement scores for many AZs/capacities share a `measured_at`, so each distinct
+    string is parsed once per response.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self) -> None:
+        self._cache: dict[str, datetime] = {}
+
+    def __call__(self, value: str) -> datetime:
+        parsed = self._cache.get(value)
+        if parsed is None:
+            parsed = _parse_iso_fast(value)
+            self._cache[value] = parsed
+        return parsed
 
 
 def _parse_jsonish_list_str(value: Any) -> list[Any] | None:
@@ -60,12 +96,12 @@ def _parse_datetime_flexible(value: Any) -> datetime | None:
     if isinstance(value, datetime):
         return value
     try:
-        return isoparse(str(value))
+        return _parse_iso_fast(str(value))
     except Exception:
         try:
             from dateutil.parser import parse as dtparse
 
-            return dtparse(str(value))
+            return _normalize_utc(dtparse(str(value)))
         except Exception:
             return None
 
@@ -148,16 +184,30 @@ class PlacementScore:
     request_group_id: int
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> PlacementScore:
-        """Create PlacementScore from API response dictionary."""
+    def from_dict(
+        cls, data: dict[str, Any], parse_timestamp: Callable[[str], datetime] | None = None
+    ) -> PlacementScore:
+        """Create PlacementScore from API response dictionary.
+
+        Args:
+            data: One item of the API response.
+            parse_timestamp: Parser for `measured_at` (e.g. a `_TimestampMemo`
+                shared across a response); defaults to ISO8601 parsing.
+        """
         return cls(
-            measured_at=_parse_iso_datetime(data["measured_at"]),
+            measured_at=(parse_timestamp or _parse_iso_datetime)(data["measured_at"]),
             score=float(data["placement_score"]),
             availability_zone=str(data["availability_zone"]),
             target_capacity=int(data["target_capacity"]),
             request_group_id=int(data["group_id"]),
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list[PlacementScore]:
+        """Create PlacementScore objects from a whole API response array."""
+        parse = _TimestampMemo()
+        return [cls.from_dict(data, parse) for data in items]
+
 
 @dataclass(frozen=True, slots=True)
 class SpotPrice:
@@ -168,14 +218,28 @@ class SpotPrice:
     pool_id: int
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> SpotPrice:
-        """Create SpotPrice from API response dictionary."""
+    def from_dict(
+        cls, data: dict[str, Any], parse_timestamp: Callable[[str], datetime] | None = None
+    ) -> SpotPrice:
+        """Create SpotPrice from API response dictionary.
+
+        Args:
+            data: One item of the API response.
+            parse_timestamp: Parser for `measured_at` (e.g. a `_TimestampMemo`
+                shared across a response); defaults to ISO8601 parsing.
+        """
         return cls(
-            measured_at=_parse_iso_datetime(data["measured_at"]),
+            measured_at=(parse_timestamp or _parse_iso_datetime)(data["measured_at"]),
             price=float(data["price"]),
             pool_id=int(data["pool_id"]),
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list[SpotPrice]:
+        """Create SpotPrice objects from a whole API response array."""
+        parse = _TimestampMemo()
+        return [cls.from_dict(data, parse) for data in items]
+
 
 @dataclass(frozen=True, slots=True)
 class InterruptionRate:
@@ -186,10 +250,24 @@ class InterruptionRate:
     pool_id: int
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> InterruptionRate:
-        """Create InterruptionRate from API response dictionary."""
+    def from_dict(
+        cls, data: dict[str, Any], parse_timestamp: Callable[[str], datetime] | None = None
+    ) -> InterruptionRate:
+        """Create InterruptionRate from API response dictionary.
+
+        Args:
+            data: One item of the API response.
+            parse_timestamp: Parser for `measured_at` (e.g. a `_TimestampMemo`
+                shared across a response); defaults to ISO8601 parsing.
+        """
         return cls(
-            measured_at=_parse_iso_datetime(data["measured_at"]),
+            measured_at=(parse_timestamp or _parse_iso_datetime)(data["measured_at"]),
             rate=float(data["rate"]),
             pool_id=int(data["pool_id"]),
         )
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list[InterruptionRate]:
+        """Create InterruptionRate objects from a whole API response array."""
+        parse = _TimestampMemo()
+        return [cls.from_dict(data, parse) for data in items]
@@ -0,0 +1,198 @@
+"""Change detection over latest placement score snapshots.
+
+The fleet service feeds every `/placement-scores/latest` response through a
+`PlacementSnapshotDiffer`. It keeps the last snapshot per request group and
+filter scope (the AZ / target capacity the response was fetched with), keyed by
+(availability zone, target capacity), and reports only what changed:
+
+- a score crossed one or more of the configured thresholds (down or up; one
+  event naming the lowest threshold dropped below / highest risen to),
+- a new (AZ, capacity) pair appeared,
+- a previously reported pair is missing.
+
+The first snapshot of a group in a scope is that scope's baseline and produces
+no events, so a filtered fetch never makes the pairs outside its filter look new
+to an unfiltered one. Responses measured before the held snapshot (a slow request
+overtaken by a newer one) are ignored.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Iterable, Sequence
+
+from src.backend.data.fleet.models import PlacementScore
+from src.config.defaults import DEFAULT_PLACEMENT_SCORE_THRESHOLDS
+
+PlacementKey = tuple[str, int]  # (availability_zone, target_capacity)
+PlacementScope = tuple[str | None, int | None]  # (az filter, target capacity filter)
+
+
+class PlacementChangeKind(StrEnum):
+    DROPPED_BELOW = "dropped_below"
+    ROSE_TO = "rose_to"
+    AZ_ADDED = "az_added"
+    AZ_MISSING = "az_missing"
+
+
+@dataclass(frozen=True, slots=True)
+class PlacementChange:
+    """One change between consecutive latest-score snapshots of a request group."""
+
+    group_id: int
+    kind: PlacementChangeKind
+    availability_zone: str
+    target_capacity: int
+    previous_score: float | None
+    score: float | None
+    # Threshold crossed (threshold events only).
+    threshold: float | None = None
+    measured_at: datetime | None = None
+
+
+class PlacementSnapshotDiffer:
+    """Keeps the last latest-score snapshot per group and scope and diffs new ones against it."""
+
+    def __init__(self, thresholds: Sequence[float] = DEFAULT_PLACEMENT_SCORE_THRESHOLDS) -> None:
+        """Initialize the differ.
+
+        Args:
+            thresholds: Score levels whose crossing is reported. A drop from ≥ t to
+                < t is `DROPPED_BELOW`; a rise from < t to ≥ t is `ROSE_TO`.
+        """
+        self.thresholds = tuple(sorted(float(t) for t in thresholds))
+        self._lock = threading.Lock()
+        self._snapshots: dict[tuple[int, PlacementScope], dict[PlacementKey, PlacementScore]] = {}
+
+    def snapshot(
+        self, group_id: int, *, az: str | None = None, target_capacity: int | None = None
+    ) -> dict[PlacementKey, PlacementScore] | None:
+        """Last known latest scores for a group in a scope (None before the first update)."""
+        with self._lock:
+            current = self._snapshots.get((int(group_id), (az, target_capacity)))
+            return dict(current) if current is not None else None
+
+    def forget(self, group_id: int) -> None:
+        """Drop a group's snapshots; its next update in each scope becomes a new baseline."""
+        group_id = int(group_id)
+        with self._lock:
+            for key in [k for k in self._snapshots if k[0] == group_id]:
+                del self._snapshots[key]
+
+    def update(
+        self,
+        group_id: int,
+        scores: Iterable[PlacementScore],
+        *,
+        az: str | None = None,
+        target_capacity: int | None = None,
+    ) -> list[PlacementChange]:
+        """Merge a new latest-score response and return the changes it implies.
+
+        Args:
+            group_id: Request group the scores belong to.
+            scores: Latest placement scores (one per AZ/capacity pair).
+            az: AZ filter the response was fetched with, if any.
+            target_capacity: Capacity filter the response was fetched with, if any.
+                Each (az, target_capacity) scope is diffed against its own
+                previous snapshot.
+
+        Returns:
+            Change events (empty for a baseline snapshot, a response measured
+            before the held snapshot, or when nothing changed).
+        """
+        group_id = int(group_id)
+        incoming: dict[PlacementKey, PlacementScore] = {}
+        for score in scores:
+            key = (score.availability_zone, score.target_capacity)
+            held = incoming.get(key)
+            if held is None or score.measured_at >= held.measured_at:
+                incoming[key] = score
+
+        scope = (group_id, (az, target_capacity))
+        with self._lock:
+            previous = self._snapshots.get(scope)
+            if previous is None:
+                self._snapshots[scope] = incoming
+                return []
+            held_at = max((s.measured_at for s in previous.values()), default=None)
+            incoming_at = max((s.measured_at for s in incoming.values()), default=None)
+            if held_at is not None and incoming_at is not None and incoming_at < held_at:
+                # Overtaken by a newer response; its missing pairs mean nothing.
+                return []
+            # Pairs measured before the held score keep the held one.
+            stale = {
+                key
+                for key, new in incoming.items()
+                if key in previous and new.measured_at < previous[key].measured_at
+            }
+            self._snapshots[scope] = {
+                key: previous[key] if key in stale else new for key, new in incoming.items()
+            }
+
+        changes: list[PlacementChange] = []
+        for key, new in incoming.items():
+            if key in stale:
+                continue
+            old = previous.get(key)
+            if old is None:
+                changes.append(
+                    PlacementChange(
+                        group_id=group_id,
+                        kind=PlacementChangeKind.AZ_ADDED,
+                        availability_zone=key[0],
+                        target_capacity=key[1],
+                        previous_score=None,
+                        score=new.score,
+                        measured_at=new.measured_at,
+                    )
+                )
+                continue
+            changes.extend(self._crossings(group_id, key, old.score, new))
+
+        for key, old in previous.items():
+            if key not in incoming:
+                changes.append(
+                    PlacementChange(
+                        group_id=group_id,
+                        kind=PlacementChangeKind.AZ_MISSING,
+                        availability_zone=key[0],
+                        target_capacity=key[1],
+                        previous_score=old.score,
+                        score=None,
+                        measured_at=old.measured_at,
+                    )
+                )
+        return changes
+
+    def _crossings(
+        self, group_id: int, key: PlacementKey, old: float, new: PlacementScore
+    ) -> list[PlacementChange]:
+        """At most one event per pair, naming the most significant threshold crossed."""
+        if new.score < old:
+            kind = PlacementChangeKind.DROPPED_BELOW
+            crossed = [t for t in self.thresholds if new.score < t <= old]
+            threshold = min(crossed) if crossed else None
+        elif new.score > old:
+            kind = PlacementChangeKind.ROSE_TO
+            crossed = [t for t in self.thresholds if old < t <= new.score]
+            threshold = max(crossed) if crossed else None
+        else:
+            return []
+        if threshold is None:
+            return []
+        return [
+            PlacementChange(
+                group_id=group_id,
+                kind=kind,
+                availability_zone=key[0],
+                target_capacity=key[1],
+                previous_score=old,
+                score=new.score,
+                threshold=threshold,
+                measured_at=new.measured_at,
+            )
+        ]
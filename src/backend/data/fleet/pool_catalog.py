@@ -0,0 +1,187 @@
+"""In-memory, indexed catalog of Spot Fleet instance pools.
+
+The `/pools` list changes rarely, so it is downloaded once, indexed by every key
+hardware selection and scoring filter on, and refreshed on a TTL. Lookups are
+dictionary hits plus set intersections and never touch the network once the
+catalog is loaded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Callable, Iterable
+
+from src.backend.data.fleet.models import InstancePool
+
+_EMPTY: frozenset[int] = frozenset()
+
+
+class PoolCatalog:
+    """Hash-indexed view over all instance pools."""
+
+    def __init__(
+        self,
+        loader: Callable[[], list[InstancePool]],
+        *,
+        ttl: timedelta = timedelta(minutes=30),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the catalog.
+
+        Args:
+            loader: Callable returning the full pool list (e.g. `SpotFleetAPIClient.get_pools`).
+            ttl: Age after which the catalog is refreshed in the background.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self._loader = loader
+        self._ttl_seconds = ttl.total_seconds()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loaded_at: float | None = None
+
+        self._by_id: dict[int, InstancePool] = {}
+        self._by_region: dict[str, frozenset[int]] = {}
+        self._by_instance_type: dict[str, frozenset[int]] = {}
+        self._by_az: dict[str, frozenset[int]] = {}
+        self._by_region_type: dict[tuple[str, str], frozenset[int]] = {}
+
+    # --- Loading ---
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def load(self, pools: Iterable[InstancePool]) -> None:
+        """Replace the catalog contents and rebuild every index."""
+        by_id: dict[int, InstancePool] = {}
+        by_region: dict[str, set[int]] = defaultdict(set)
+        by_type: dict[str, set[int]] = defaultdict(set)
+        by_az: dict[str, set[int]] = defaultdict(set)
+        by_region_type: dict[tuple[str, str], set[int]] = defaultdict(set)
+        for pool in pools:
+            by_id[pool.id] = pool
+            by_region[pool.region].add(pool.id)
+            by_type[pool.instance_type].add(pool.id)
+            by_az[pool.az].add(pool.id)
+            by_region_type[(pool.region, pool.instance_type)].add(pool.id)
+
+        # Swap all indexes in one go so concurrent readers see a consistent snapshot.
+        with self._lock:
+            self._by_id = by_id
+            self._by_region = {k: frozenset(v) for k, v in by_region.items()}
+            self._by_instance_type = {k: frozenset(v) for k, v in by_type.items()}
+            self._by_az = {k: frozenset(v) for k, v in by_az.items()}
+            self._by_region_type = {k: frozenset(v) for k, v in by_region_type.items()}
+            self._loaded_at = self._clock()
+
+    def refresh(self) -> None:
+        """Reload synchronously from the loader."""
+        self.load(self._loader())
+
+    def ensure_loaded(self) -> None:
+        """Load synchronously on first use; refresh in the background once expired."""
+        if self._loaded_at is None:
+            self.refresh()
+            return
+        if self._clock() - self._loaded_at > self._ttl_seconds:
+            self._refresh_in_background()
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _run() -> None:
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the current snapshot; retry on the next expired lookup.
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=_run, name="pool-catalog-refresh", daemon=True).start()
+
+    # --- Lookups ---
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, pool_id: int) -> InstancePool | None:
+        """Return a pool by id (None if unknown)."""
+        self.ensure_loaded()
+        return self._by_id.get(pool_id)
+
+    def ids(
+        self,
+        *,
+        region: str | None = None,
+        instance_type: str | None = None,
+        az: str | None = None,
+    ) -> frozenset[int]:
+        """Return pool ids matching every given filter (no filter means all pools)."""
+        self.ensure_loaded()
+        candidates: list[frozenset[int]] = []
+        if region is not None and instance_type is not None:
+            candidates.append(self._by_region_type.get((region, instance_type), _EMPTY))
+        elif region is not None:
+            candidates.append(self._by_region.get(region, _EMPTY))
+        elif instance_type is not None:
+            candidates.append(self._by_instance_type.get(instance_type, _EMPTY))
+        if az is not None:
+            candidates.append(self._by_az.get(az, _EMPTY))
+
+        if not candidates:
+            return frozenset(self._by_id)
+        # Intersect smallest-first so the work is bounded by the most selective index.
+        candidates.sort(key=len)
+        result = candidates[0]
+        for other in candidates[1:]:
+            if not result:
+                break
+            result = result & other
+        return result
+
+    def find(
+        self,
+        *,
+        region: str | None = None,
+        instance_type: str | None = None,
+        az: str | None = None,
+    ) -> list[InstancePool]:
+        """Return pools matching every given filter, ordered by pool id."""
+        ids = self.ids(region=region, instance_type=instance_type, az=az)
+        by_id = self._by_id
+        # `.get` guards against a background refresh swapping indexes mid-call.
+        return [pool for i in sorted(ids) if (pool := by_id.get(i)) is not None]
+
+    def find_for_instance_types(
+        self,
+        region: str,
+        instance_types: Iterable[str],
+        *,
+        az: str | None = None,
+    ) -> dict[str, list[InstancePool]]:
+        """Return pools per instance type within a region (e.g. for a fleet's type mix)."""
+        return {
+            instance_type: self.find(region=region, instance_type=instance_type, az=az)
+            for instance_type in instance_types
+        }
+
+    def regions(self) -> list[str]:
+        self.ensure_loaded()
+        return sorted(self._by_region)
+
+    def availability_zones(self, region: str | None = None) -> list[str]:
+        """Return AZs known to the catalog (optionally within a region)."""
+        self.ensure_loaded()
+        if region is None:
+            return sorted(self._by_az)
+        by_id = self._by_id
+        return sorted(
+            {pool.az for i in self._by_region.get(region, _EMPTY) if (pool := by_id.get(i)) is not None}
+        )
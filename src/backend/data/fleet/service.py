@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Sequence
 
+from src.backend.data.circuit_breaker import CircuitOpenError
 from src.backend.data.freshness.tracker import get_freshness_tracker
 from src.backend.data.fleet.api_client import SpotFleetAPIClient
+from src.backend.data.fleet.frames import PlacementScoreFrame
+from src.backend.data.fleet.placement_changes import PlacementChange, PlacementSnapshotDiffer
+from src.backend.data.fleet.pool_catalog import PoolCatalog
 from src.backend.data.fleet.models import (
     InstancePool,
     InterruptionRate,
@@ -14,20 +20,68 @@ from src.backend.data.fleet.models import (
     RequestGroup,
     SpotPrice,
 )
+from src.config.defaults import DEFAULT_FLEET_CATALOG_REVALIDATE_SECONDS
+from src.storage.fleet_catalog_store import FleetCatalogStore
+
+FleetCatalogListener = Callable[[list[RequestGroup]], None]
+PlacementChangeListener = Callable[[list[PlacementChange]], None]
 
 
 class SpotFleetDataService:
     """High-level service for accessing Spot Fleet data with freshness tracking."""
 
-    def __init__(self, api_client: SpotFleetAPIClient | None = None) -> None:
+    def __init__(
+        self,
+        api_client: SpotFleetAPIClient | None = None,
+        *,
+        catalog_store: FleetCatalogStore | None = None,
+        catalog_revalidate_after: timedelta = timedelta(
+            seconds=DEFAULT_FLEET_CATALOG_REVALIDATE_SECONDS
+        ),
+    ) -> None:
         """Initialize the service.
 
         Args:
             api_client: Optional API client instance. Creates new one if not provided.
+            catalog_store: Optional on-disk cache for the request-group catalog.
+                Defaults to `data/cache/` under the repo root.
+            catalog_revalidate_after: Age after which a served catalog is
+                revalidated in the background.
         """
         self._client = api_client or SpotFleetAPIClient()
         self._freshness_tracker = get_freshness_tracker()
 
+        if catalog_store is None:
+            repo_root = Path(__file__).resolve().parents[4]
+            catalog_store = FleetCatalogStore(repo_root / "data" / "cache")
+        self._catalog_store = catalog_store
+        self._catalog_revalidate_after = catalog_revalidate_after
+        self._catalog_lock = threading.Lock()
+        self._catalog: list[RequestGroup] | None = None
+        self._catalog_fetched_at: datetime | None = None
+        self._catalog_loaded_from_disk = False
+        self._catalog_revalidating = False
+        self._catalog_revalidated_this_session = False
+        self._catalog_listeners: list[FleetCatalogListener] = []
+
+        self._pool_catalog = PoolCatalog(self._load_pools)
+
+        self._placement_differ = PlacementSnapshotDiffer()
+        self._placement_listeners_lock = threading.Lock()
+        self._placement_listeners: list[PlacementChangeListener] = []
+
+    @property
+    def api_client(self) -> SpotFleetAPIClient:
+        return self._client
+
+    def set_api_client(self, api_client: SpotFleetAPIClient) -> None:
+        """Replace the API client (e.g. after credentials change).
+
+        Cached request-group and pool catalogs are kept; they are revalidated
+        through the new client on their normal schedule.
+        """
+        self._client = api_client
+
     def _update_freshness(self, timestamp: datetime | None = None) -> None:
         """Update the availability data freshness timestamp.
 
@@ -38,13 +92,122 @@ class SpotFleetDataService:
     def list_available_fleets(self) -> list[RequestGroup]:
         """List all available request groups (fleets).
 
+        Serves the cached catalog immediately when one exists (stale-while-revalidate)
+        and refreshes it in the background; subscribers are notified if it changed.
+        Only fetches synchronously when nothing has been cached yet.
+
         Returns:
             List of RequestGroup objects
         """
-        fleets = self._client.get_request_groups()
+        cached = self.get_cached_fleets()
+        if cached is None:
+            return self.refresh_fleet_catalog()
+        if self._catalog_needs_revalidation():
+            self.revalidate_fleet_catalog()
+        return cached
+
+    # --- Request-group catalog cache ---
+    @property
+    def catalog_fetched_at(self) -> datetime | None:
+        """When the currently held catalog was fetched from the API."""
+        return self._catalog_fetched_at
+
+    def get_cached_fleets(self) -> list[RequestGroup] | None:
+        """Return the cached request-group catalog without any network access."""
+        with self._catalog_lock:
+            if self._catalog is None and not self._catalog_loaded_from_disk:
+                self._catalog_loaded_from_disk = True
+                cached = self._catalog_store.load()
+                if cached is not None:
+                    try:
+                        self._catalog = [RequestGroup.from_dict(item) for item in cached.items]
+                        self._catalog_fetched_at = cached.fetched_at
+                    except Exception:
+                        # Corrupted/incompatible cache: ignore and fetch fresh.
+                        self._catalog = None
+            return list(self._catalog) if self._catalog is not None else None
+
+    def refresh_fleet_catalog(self) -> list[RequestGroup]:
+        """Fetch the catalog from the API, persist it, and notify on change.
+
+        Returns:
+            List of RequestGroup objects
+        """
+        payload = self._client.get_request_groups_payload()
+        fleets = [RequestGroup.from_dict(item) for item in payload]
+        fetched_at = datetime.now(tz=timezone.utc)
         self._update_freshness(None)
+
+        with self._catalog_lock:
+            changed = self._catalog != fleets
+            self._catalog = fleets
+            self._catalog_fetched_at = fetched_at
+            self._catalog_loaded_from_disk = True
+            self._catalog_revalidated_this_session = True
+            listeners = list(self._catalog_listeners)
+        try:
+            self._catalog_store.save(payload, fetched_at=fetched_at)
+        except Exception:
+            # The on-disk cache is an optimisation; never fail the fetch over it.
+            pass
+
+        if changed:
+            for listener in listeners:
+                try:
+                    listener(list(fleets))
+                except Exception:
+                    continue
         return fleets
 
+    def revalidate_fleet_catalog(self) -> None:
+        """Refresh the catalog on a background thread (no-op if one is running)."""
+        with self._catalog_lock:
+            if self._catalog_revalidating:
+                return
+            self._catalog_revalidating = True
+
+        def _run() -> None:
+            try:
+                self.refresh_fleet_catalog()
+            except Exception:
+                # Keep serving the cached catalog; the next call will retry.
+                pass
+            finally:
+                with self._catalog_lock:
+                    self._catalog_revalidating = False
+
+        threading.Thread(target=_run, name="fleet-catalog-revalidate", daemon=True).start()
+
+    def subscribe_fleet_catalog(self, listener: FleetCatalogListener) -> Callable[[], None]:
+        """Register a callback for catalog changes.
+
+        Listeners are invoked from the thread that performed the refresh (usually a
+        background thread), so UI code must marshal back onto its event loop.
+
+        Returns:
+            A function that removes the listener.
+        """
+        with self._catalog_lock:
+            self._catalog_listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._catalog_lock:
+                try:
+                    self._catalog_listeners.remove(listener)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def _catalog_needs_revalidation(self) -> bool:
+        if not self._catalog_revalidated_this_session:
+            # Always revalidate a catalog that was loaded from disk at least once.
+            return True
+        fetched_at = self._catalog_fetched_at
+        if fetched_at is None:
+            return True
+        return datetime.now(tz=timezone.utc) - fetched_at > self._catalog_revalidate_after
+
     def get_fleet_details(self, fleet_id: str | int) -> RequestGroup:
         """Get full details for a specific fleet.
 
@@ -53,8 +216,19 @@ class SpotFleetDataService:
 
         Returns:
             RequestGroup object
+
+        Raises:
+            CircuitOpenError: If the API is short-circuited and the fleet is not in
+                the cached catalog.
         """
-        fleet = self._client.get_request_group(fleet_id)
+        try:
+            fleet = self._client.get_request_group(fleet_id)
+        except CircuitOpenError:
+            # Upstream is failing fast; the cached catalog carries the same fields.
+            for cached in self.get_cached_fleets() or []:
+                if str(cached.id) == str(fleet_id) or cached.name == str(fleet_id):
+                    return cached
+            raise
         self._update_freshness(None)
         return fleet
 
@@ -80,8 +254,123 @@ class SpotFleetDataService:
         )
         if scores:
             self._update_freshness(max(score.measured_at for score in scores))
+        group_id = self._resolve_group_id(fleet_id, scores)
+        if group_id is not None:
+            self._freshness_tracker.track_availability_group(group_id)
+            self._diff_latest_scores(group_id, scores, az=az, target_capacity=target_capacity)
         return scores
 
+    def get_latest_placement_scores_bulk(
+        self,
+        fleet_ids: Sequence[int],
+        *,
+        az: str | None = None,
+        target_capacity: int | None = None,
+    ) -> dict[int, list[PlacementScore]]:
+        """Get latest placement scores for many fleets in one pass.
+
+        Args:
+            fleet_ids: Request group IDs (e.g. every candidate fleet in a region)
+            az: Optional availability zone filter
+            target_capacity: Optional target capacity filter
+
+        Returns:
+            Mapping of group ID → PlacementScore objects
+        """
+        by_group = self._client.get_latest_placement_scores_bulk(
+            fleet_ids, az=az, target_capacity=target_capacity
+        )
+        latest = max(
+            (score.measured_at for scores in by_group.values() for score in scores), default=None
+        )
+        self._update_freshness(latest)
+        for group_id, scores in by_group.items():
+            self._freshness_tracker.track_availability_group(group_id)
+            self._diff_latest_scores(group_id, scores, az=az, target_capacity=target_capacity)
+        return by_group
+
+    def probe_freshness(self, group_ids: Sequence[int] = ()) -> datetime | None:
+        """Cheapest call that reveals how fresh upstream placement data is.
+
+        Fetches the latest scores of the most recently used request group, or of
+        the first group in the cached catalog. The catalog is only downloaded if
+        nothing is cached at all.
+
+        Args:
+            group_ids: Request groups in use, most recent first.
+
+        Returns:
+            Newest placement-score timestamp, or None if there is nothing to probe.
+        """
+        group_id = group_ids[0] if group_ids else None
+        if group_id is None:
+            fleets = self.get_cached_fleets() or self.list_available_fleets()
+            if not fleets:
+                return None
+            group_id = fleets[0].id
+        scores = self.get_latest_placement_scores(group_id)
+        return max((score.measured_at for score in scores), default=None)
+
+    # --- Latest-score change detection ---
+    @property
+    def placement_differ(self) -> PlacementSnapshotDiffer:
+        return self._placement_differ
+
+    def subscribe_placement_changes(
+        self, listener: PlacementChangeListener
+    ) -> Callable[[], None]:
+        """Register a callback for placement score change events.
+
+        Every latest-score fetch is diffed against the previous snapshot of the same
+        group fetched with the same AZ / capacity filter. The listener gets the non-empty list of changes, on the thread that
+        made the fetch.
+
+        Returns:
+            A function that removes the listener.
+        """
+        with self._placement_listeners_lock:
+            self._placement_listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._placement_listeners_lock:
+                try:
+                    self._placement_listeners.remove(listener)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def _resolve_group_id(self, fleet_id: str | int, scores: list[PlacementScore]) -> int | None:
+        if scores:
+            return scores[0].request_group_id
+        if isinstance(fleet_id, int) or str(fleet_id).isdigit():
+            return int(fleet_id)
+        for fleet in self.get_cached_fleets() or []:
+            if fleet.name == fleet_id:
+                return fleet.id
+        return None
+
+    def _diff_latest_scores(
+        self,
+        group_id: int,
+        scores: list[PlacementScore],
+        *,
+        az: str | None,
+        target_capacity: int | None,
+    ) -> None:
+        changes = self._placement_differ.update(
+            group_id, scores, az=az, target_capacity=target_capacity
+        )
+        if not changes:
+            return
+        with self._placement_listeners_lock:
+            listeners = list(self._placement_listeners)
+        for listener in listeners:
+            try:
+                listener(list(changes))
+            except Exception:
+                continue
+
     def get_placement_score_history(
         self,
         fleet_id: str | int,
@@ -120,8 +409,60 @@ class SpotFleetDataService:
         )
         if scores:
             self._update_freshness(max(score.measured_at for score in scores))
+            self._freshness_tracker.track_availability_group(scores[0].request_group_id)
         return scores
 
+    def get_placement_score_frame(
+        self,
+        fleet_id: str | int,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        az: str | None = None,
+        target_capacity: int | None = None,
+        limit: int = 500,
+        max_points: int | None = None,
+    ) -> PlacementScoreFrame:
+        """Get placement score history as a columnar frame (forecasting/charts).
+
+        Args:
+            fleet_id: Request group ID or name
+            since: Start time (defaults to 24 hours ago)
+            until: End time (defaults to now)
+            az: Optional availability zone filter
+            target_capacity: Optional target capacity filter
+            limit: Maximum number of results
+            max_points: If set, min/max-downsample each (AZ, capacity) series to at
+                most this many rows (e.g. a chart's width in columns)
+
+        Returns:
+            PlacementScoreFrame built straight from the API payload
+        """
+        if until is None:
+            until = datetime.now(tz=timezone.utc)
+        if since is None:
+            since = until - timedelta(hours=24)
+
+        payload = self._client.get_placement_scores_payload(
+            fleet_id,
+            since=since.isoformat(),
+            until=until.isoformat(),
+            az=az,
+            target_capacity=target_capacity,
+            limit=limit,
+        )
+        frame = PlacementScoreFrame.from_payload(payload)
+        self._update_freshness(frame.latest_measured_at())
+        group_id = self._resolve_group_id(fleet_id, [])
+        if group_id is not None:
+            self._freshness_tracker.track_availability_group(group_id)
+        if max_points is not None:
+            # Lazy import: the downsampling module imports the fleet package.
+            from src.backend.data.downsampling import downsample_frame
+
+            frame = downsample_frame(frame, max_points)
+        return frame
+
     def get_pool_interruption_history(
         self,
         pool_id: int,
@@ -155,28 +496,34 @@ class SpotFleetDataService:
         self._update_freshness()
         return rates
 
+    def _load_pools(self) -> list[InstancePool]:
+        pools = self._client.get_pools()
+        self._update_freshness()
+        return pools
+
+    @property
+    def pool_catalog(self) -> PoolCatalog:
+        """Indexed pool catalog (loaded on first use, refreshed on a TTL)."""
+        return self._pool_catalog
+
     def get_available_pools(
-        self, *, region: str | None = None, instance_type: str | None = None
+        self,
+        *,
+        region: str | None = None,
+        instance_type: str | None = None,
+        az: str | None = None,
     ) -> list[InstancePool]:
         """Get available instance pools (for hardware selection).
 
         Args:
             region: Optional region filter
             instance_type: Optional instance type filter
+            az: Optional availability zone filter
 
         Returns:
             List of InstancePool objects
         """
-        pools = self._client.get_pools()
-        self._update_freshness()
-
-        # Apply filters if provided
-        if region:
-            pools = [p for p in pools if p.region == region]
-        if instance_type:
-            pools = [p for p in pools if p.instance_type == instance_type]
-
-        return pools
+        return self._pool_catalog.find(region=region, instance_type=instance_type, az=az)
 
     def get_pool(self, pool_id: int) -> InstancePool:
         """Get details for a specific instance pool.
@@ -187,6 +534,10 @@ class SpotFleetDataService:
         Returns:
             InstancePool object
         """
+        pool = self._pool_catalog.get(pool_id)
+        if pool is not None:
+            return pool
+        # Pool created since the catalog was loaded: fall back to the API.
         pool = self._client.get_pool(pool_id)
         self._update_freshness()
         return pool
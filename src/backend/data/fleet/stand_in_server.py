@@ -0,0 +1,610 @@
+"""Local stand-in for the Spot Fleet API (load and latency testing).
+
+Serves every endpoint `SpotFleetAPIClient` uses, with synthetic but plausible
+data, so benchmarks and the UI can drive the real client code paths:
+
+    python -m src.backend.data.fleet.stand_in_server --port 8787
+    SPOT_FLEET_API_BASE_URL=http://127.0.0.1:8787 python -m src
+
+Catalogs (pools, request groups) are built up front. Time series are never
+stored: each row is a pure function of (seed, entity, timestamp), so a query
+only materialises the ticks it returns. That makes millions of rows of history
+cheap, and repeated queries return identical data.
+
+Latency and error injection apply to every request (see `StandInConfig`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import numpy as np
+from aiohttp import web
+
+_FAMILIES: tuple[tuple[str, float], ...] = (
+    # (family, on-demand $/hour for a `.large`)
+    ("m5", 0.096),
+    ("m6i", 0.096),
+    ("m7g", 0.082),
+    ("c5", 0.085),
+    ("c6i", 0.085),
+    ("c7g", 0.072),
+    ("r5", 0.126),
+    ("r6i", 0.126),
+    ("r7g", 0.107),
+    ("t3", 0.083),
+    ("g5", 1.006),
+    ("p4d", 4.096),
+)
+_SIZES: tuple[tuple[str, float], ...] = (
+    ("large", 1),
+    ("xlarge", 2),
+    ("2xlarge", 4),
+    ("4xlarge", 8),
+    ("8xlarge", 16),
+    ("12xlarge", 24),
+    ("16xlarge", 32),
+    ("24xlarge", 48),
+)
+_TARGET_CAPACITIES = (1, 2, 4, 8, 16, 32, 64)
+# Spot Advisor style "frequency of interruption" buckets (probability per month).
+_INTERRUPTION_BUCKETS = np.array([0.025, 0.075, 0.125, 0.175, 0.25])
+
+_DAY = 86_400
+_WEEK = 7 * _DAY
+
+
+@dataclass(frozen=True, slots=True)
+class StandInConfig:
+    """Scale and fault-injection settings for the stand-in server."""
+
+    seed: int = 7
+    regions: tuple[str, ...] = ("eu-west-1", "eu-west-2", "us-east-1", "us-west-2")
+    azs_per_region: int = 3
+    instance_types: int = 96
+    request_groups: int = 200
+    history_days: int = 30
+    placement_interval_seconds: int = 600
+    price_interval_seconds: int = 3600
+    interruption_interval_seconds: int = _DAY
+    # Fault injection.
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    # If set, requests must send it as `x-api-key`.
+    api_key: str | None = None
+    # Serve the multi-group `/placement-scores/latest?group_ids=...` endpoint.
+    bulk_latest: bool = True
+
+
+# --- Deterministic noise ---
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finaliser over uint64 arrays (wrapping arithmetic)."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _uniform(seed: int, *parts: np.ndarray | int) -> np.ndarray:
+    """Uniform [0, 1) values that depend only on `seed` and `parts` (broadcast)."""
+    with np.errstate(over="ignore"):
+        h = np.asarray(np.uint64(seed & 0xFFFFFFFFFFFFFFFF))
+        for part in parts:
+            p = np.asarray(part, dtype=np.int64).astype(np.uint64)
+            h = _mix(h ^ (p + np.uint64(0x9E3779B97F4A7C15)))
+        return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _iso(epoch_seconds: np.ndarray) -> np.ndarray:
+    return np.datetime_as_string(epoch_seconds.astype("datetime64[s]"), unit="s", timezone="UTC")
+
+
+def _parse_epoch(value: str | None) -> int | None:
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+class SyntheticFleetData:
+    """Deterministic synthetic catalog and time series."""
+
+    def __init__(self, config: StandInConfig, *, clock: Callable[[], float] | None = None) -> None:
+        self.config = config
+        self._clock = clock or (lambda: datetime.now(tz=timezone.utc).timestamp())
+        rng = random.Random(config.seed)
+
+        # Sizes vary fastest across families, so small catalogs still mix families.
+        base_types = [
+            (f"{family}.{size}", price * mult) for size, mult in _SIZES for family, price in _FAMILIES
+        ]
+        types = list(base_types)
+        generation = 2
+        while len(types) < config.instance_types:
+            # Beyond the built-in catalog, add numbered variants of every type.
+            for name, price in base_types:
+                family, size = name.split(".", 1)
+                types.append((f"{family}v{generation}.{size}", price))
+            generation += 1
+        types = types[: config.instance_types]
+
+        pools: list[dict[str, Any]] = []
+        for region in config.regions:
+            for a in range(config.azs_per_region):
+                az = f"{region}{'abcdefghij'[a]}"
+                for instance_type, _ in types:
+                    pools.append(
+                        {"id": len(pools) + 1, "instance_type": instance_type, "region": region, "az": az}
+                    )
+        self.pools = pools
+        self.pool_ids = np.array([p["id"] for p in pools], dtype=np.int64)
+        self._pool_by_id = {p["id"]: i for i, p in enumerate(pools)}
+        type_price = dict(types)
+        self._pool_on_demand = np.array([type_price[p["instance_type"]] for p in pools])
+        self._pool_type = np.array([p["instance_type"] for p in pools], dtype=object)
+        self._pool_region = np.array([p["region"] for p in pools], dtype=object)
+        self._pool_az = np.array([p["az"] for p in pools], dtype=object)
+
+        created_at = str(_iso(np.array([self._history_start()]))[0])
+        groups: list[dict[str, Any]] = []
+        type_names = [t for t, _ in types]
+        for g in range(config.request_groups):
+            gid = g + 1
+            region = config.regions[g % len(config.regions)]
+            k = rng.randint(1, min(6, len(type_names)))
+            instance_types = rng.sample(type_names, k)
+            caps = sorted(rng.sample(_TARGET_CAPACITIES, rng.randint(2, 4)))
+            family = instance_types[0].split(".", 1)[0]
+            groups.append(
+                {
+                    "id": gid,
+                    "name": f"{family}-{region}-{gid:04d}",
+                    "instance_request_mode": "instance-types",
+                    "region": region,
+                    "include_azs": True,
+                    "instance_types": instance_types,
+                    "instance_requirements": None,
+                    "target_capacities": caps,
+                    "metadata": {"synthetic": True},
+                    "created_at": created_at,
+                }
+            )
+        self.groups = groups
+        self._group_by_key = {str(gr["id"]): gr for gr in groups}
+        self._group_by_key.update({gr["name"]: gr for gr in groups})
+
+    # --- Catalog lookups ---
+    def group(self, id_or_name: str) -> dict[str, Any] | None:
+        return self._group_by_key.get(id_or_name)
+
+    def pool(self, pool_id: int) -> dict[str, Any] | None:
+        idx = self._pool_by_id.get(pool_id)
+        return self.pools[idx] if idx is not None else None
+
+    def group_azs(self, group: dict[str, Any]) -> list[str]:
+        region = group["region"]
+        return [f"{region}{'abcdefghij'[a]}" for a in range(self.config.azs_per_region)]
+
+    def select_pools(
+        self,
+        *,
+        pool_id: int | None = None,
+        instance_type: str | None = None,
+        region: str | None = None,
+        az: str | None = None,
+    ) -> np.ndarray:
+        """Row indexes of pools matching the filters."""
+        mask = np.ones(len(self.pools), dtype=bool)
+        if pool_id is not None:
+            mask &= self.pool_ids == pool_id
+        if instance_type:
+            mask &= self._pool_type == instance_type
+        if region:
+            mask &= self._pool_region == region
+        if az:
+            mask &= self._pool_az == az
+        return np.flatnonzero(mask)
+
+    # --- Time axis ---
+    def _now(self) -> int:
+        return int(self._clock())
+
+    def _history_start(self) -> int:
+        return self._now() - self.config.history_days * _DAY
+
+    def _ticks(
+        self,
+        interval: int,
+        n_keys: int,
+        *,
+        since: int | None,
+        until: int | None,
+        order: str,
+        limit: int | None,
+    ) -> np.ndarray:
+        """Tick timestamps needed to answer a query over `n_keys` series."""
+        last = (self._now() // interval) * interval
+        first = -(-self._history_start() // interval) * interval
+        lo = first if since is None else max(first, -(-since // interval) * interval)
+        hi = last if until is None else min(last, (until // interval) * interval)
+        if hi < lo or n_keys == 0:
+            return np.empty(0, dtype=np.int64)
+        n = (hi - lo) // interval + 1
+        if limit is not None:
+            n = min(n, -(-limit // n_keys))
+        if order == "asc":
+            return lo + interval * np.arange(n, dtype=np.int64)
+        return hi - interval * np.arange(n, dtype=np.int64)
+
+    @staticmethod
+    def _rows(ticks: np.ndarray, n_keys: int, limit: int | None) -> tuple[np.ndarray, np.ndarray]:
+        """Tick-major (time, key index) pairs, truncated to `limit`."""
+        t = np.repeat(ticks, n_keys)
+        k = np.tile(np.arange(n_keys, dtype=np.int64), ticks.shape[0])
+        if limit is not None:
+            t, k = t[:limit], k[:limit]
+        return t, k
+
+    # --- Series models ---
+    def _placement_values(
+        self, group_id: int, az_idx: np.ndarray, caps: np.ndarray, t: np.ndarray
+    ) -> np.ndarray:
+        seed = self.config.seed
+        base = 4.0 + 6.0 * _uniform(seed, 1, group_id, az_idx)
+        penalty = 0.6 * np.log2(caps)
+        phase = 24.0 * _uniform(seed, 2, group_id, az_idx)
+        diurnal = np.sin(2 * np.pi * ((t % _DAY) / 3600.0 - phase) / 24.0)
+        period = (2 + 5 * _uniform(seed, 3, group_id, az_idx)) * _DAY
+        wander = 1.2 * np.sin(2 * np.pi * t / period + 6.283 * _uniform(seed, 4, group_id, az_idx))
+        noise = 1.6 * (_uniform(seed, 5, group_id, az_idx, caps, t) - 0.5)
+        return np.clip(np.rint(base - penalty + diurnal + wander + noise), 1, 10)
+
+    def _price_values(self, rows: np.ndarray, t: np.ndarray) -> np.ndarray:
+        seed = self.config.seed
+        pid = self.pool_ids[rows]
+        discount = 0.25 + 0.4 * _uniform(seed, 10, pid)
+        daily = 0.06 * np.sin(2 * np.pi * (t % _DAY) / _DAY + 6.283 * _uniform(seed, 11, pid))
+        weekly = 0.1 * np.sin(2 * np.pi * t / _WEEK + 6.283 * _uniform(seed, 12, pid))
+        noise = 0.04 * (_uniform(seed, 13, pid, t) - 0.5)
+        price = self._pool_on_demand[rows] * discount * (1 + daily + weekly + noise)
+        return np.round(price, 5)
+
+    def _interruption_values(self, rows: np.ndarray, t: np.ndarray) -> np.ndarray:
+        seed = self.config.seed
+        pid = self.pool_ids[rows]
+        base = np.floor(_uniform(seed, 20, pid) * len(_INTERRUPTION_BUCKETS)).astype(np.int64)
+        shift = _uniform(seed, 21, pid, t // _WEEK)
+        idx = base + (shift > 0.85).astype(np.int64) - (shift < 0.1).astype(np.int64)
+        return _INTERRUPTION_BUCKETS[np.clip(idx, 0, len(_INTERRUPTION_BUCKETS) - 1)]
+
+    # --- Queries ---
+    def placement_scores(
+        self,
+        group: dict[str, Any],
+        *,
+        since: int | None = None,
+        until: int | None = None,
+        az: str | None = None,
+        target_capacity: int | None = None,
+        order: str = "desc",
+        limit: int | None = 500,
+        latest: bool = False,
+    ) -> list[dict[str, Any]]:
+        azs = self.group_azs(group)
+        az_idx = [i for i, name in enumerate(azs) if az is None or name == az]
+        caps = [c for c in group["target_capacities"] if target_capacity is None or c == target_capacity]
+        key_az = np.repeat(np.asarray(az_idx, dtype=np.int64), len(caps))
+        key_cap = np.tile(np.asarray(caps, dtype=np.int64), len(az_idx))
+        n_keys = key_az.shape[0]
+
+        if latest:
+            ticks = self._ticks(
+                self.config.placement_interval_seconds, n_keys, since=None, until=None, order="desc", limit=1
+            )
+            limit = None
+        else:
+            ticks = self._ticks(
+                self.config.placement_interval_seconds,
+                n_keys,
+                since=since,
+                until=until,
+                order=order,
+                limit=limit,
+            )
+        t, k = self._rows(ticks, n_keys, limit)
+        scores = self._placement_values(group["id"], key_az[k], key_cap[k], t)
+        stamps = _iso(t)
+        az_names = np.asarray(azs, dtype=object)[key_az[k]]
+        return [
+            {
+                "measured_at": str(stamps[i]),
+                "placement_score": float(scores[i]),
+                "availability_zone": str(az_names[i]),
+                "target_capacity": int(key_cap[k[i]]),
+                "group_id": group["id"],
+            }
+            for i in range(t.shape[0])
+        ]
+
+    def _pool_series(
+        self,
+        field: str,
+        interval: int,
+        values: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        pool_rows: np.ndarray,
+        *,
+        since: int | None,
+        until: int | None,
+        order: str,
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        n_keys = pool_rows.shape[0]
+        ticks = self._ticks(interval, n_keys, since=since, until=until, order=order, limit=limit)
+        t, k = self._rows(ticks, n_keys, limit)
+        rows = pool_rows[k]
+        vals = values(rows, t)
+        stamps = _iso(t)
+        pids = self.pool_ids[rows]
+        return [
+            {"measured_at": str(stamps[i]), field: float(vals[i]), "pool_id": int(pids[i])}
+            for i in range(t.shape[0])
+        ]
+
+    def spot_prices(self, pool_rows: np.ndarray, **query: Any) -> list[dict[str, Any]]:
+        return self._pool_series(
+            "price", self.config.price_interval_seconds, self._price_values, pool_rows, **query
+        )
+
+    def interruption_rates(self, pool_rows: np.ndarray, **query: Any) -> list[dict[str, Any]]:
+        return self._pool_series(
+            "rate",
+            self.config.interruption_interval_seconds,
+            self._interruption_values,
+            pool_rows,
+            **query,
+        )
+
+
+# --- HTTP layer ---
+def _query_args(request: web.Request) -> dict[str, Any]:
+    q = request.query
+    order = q.get("order", "desc")
+    if order not in ("asc", "desc"):
+        raise web.HTTPBadRequest(text="order must be 'asc' or 'desc'")
+    try:
+        limit = int(q.get("limit", "500"))
+        since = _parse_epoch(q.get("since"))
+        until = _parse_epoch(q.get("until"))
+    except ValueError as exc:
+        raise web.HTTPBadRequest(text=str(exc)) from None
+    if limit <= 0:
+        raise web.HTTPBadRequest(text="limit must be positive")
+    return {"since": since, "until": until, "order": order, "limit": limit}
+
+
+def _optional_int(request: web.Request, name: str) -> int | None:
+    raw = request.query.get(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        raise web.HTTPBadRequest(text=f"{name} must be an integer") from None
+
+
+def create_app(config: StandInConfig | None = None, *, data: SyntheticFleetData | None = None) -> web.Application:
+    """Build the aiohttp application.
+
+    Args:
+        config: Scale and fault-injection settings.
+        data: Optional prebuilt dataset (defaults to one built from `config`).
+    """
+    config = config or StandInConfig()
+    data = data or SyntheticFleetData(config)
+    injector = random.Random(config.seed)
+
+    @web.middleware
+    async def fault_injection(request: web.Request, handler: Callable) -> web.StreamResponse:
+        if config.api_key and request.headers.get("x-api-key") != config.api_key:
+            raise web.HTTPForbidden(text='{"message": "Forbidden"}', content_type="application/json")
+        delay_ms = config.latency_ms + config.latency_jitter_ms * injector.random()
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+        if config.error_rate > 0 and injector.random() < config.error_rate:
+            return web.json_response({"message": "Injected failure"}, status=config.error_status)
+        return await handler(request)
+
+    def _group_or_404(request: web.Request) -> dict[str, Any]:
+        group = data.group(request.match_info["group"])
+        if group is None:
+            raise web.HTTPNotFound(text='{"message": "Not Found"}', content_type="application/json")
+        return group
+
+    def _pool_or_404(request: web.Request) -> int:
+        try:
+            pool_id = int(request.match_info["pool_id"])
+        except ValueError:
+            raise web.HTTPBadRequest(text="pool_id must be an integer") from None
+        if data.pool(pool_id) is None:
+            raise web.HTTPNotFound(text='{"message": "Not Found"}', content_type="application/json")
+        return pool_id
+
+    async def list_groups(request: web.Request) -> web.Response:
+        return web.json_response(data.groups)
+
+    async def get_group(request: web.Request) -> web.Response:
+        return web.json_response(_group_or_404(request))
+
+    async def placement_scores(request: web.Request) -> web.Response:
+        group = _group_or_404(request)
+        query = _query_args(request)
+        rows = await asyncio.to_thread(
+            data.placement_scores,
+            group,
+            az=request.query.get("az") or None,
+            target_capacity=_optional_int(request, "target_capacity"),
+            **query,
+        )
+        return web.json_response(rows)
+
+    async def latest_placement_scores(request: web.Request) -> web.Response:
+        group = _group_or_404(request)
+        rows = await asyncio.to_thread(
+            data.placement_scores,
+            group,
+            az=request.query.get("az") or None,
+            target_capacity=_optional_int(request, "target_capacity"),
+            latest=True,
+        )
+        return web.json_response(rows)
+
+    async def bulk_latest_placement_scores(request: web.Request) -> web.Response:
+        raw = request.query.get("group_ids", "")
+        groups = [data.group(part.strip()) for part in raw.split(",") if part.strip()]
+        if not groups:
+            raise web.HTTPBadRequest(text="group_ids is required")
+        az = request.query.get("az") or None
+        target_capacity = _optional_int(request, "target_capacity")
+
+        def _collect() -> list[dict[str, Any]]:
+            rows: list[dict[str, Any]] = []
+            for group in groups:
+                if group is not None:
+                    rows.extend(
+                        data.placement_scores(
+                            group, az=az, target_capacity=target_capacity, latest=True
+                        )
+                    )
+            return rows
+
+        return web.json_response(await asyncio.to_thread(_collect))
+
+    async def list_pools(request: web.Request) -> web.Response:
+        return web.json_response(data.pools)
+
+    async def get_pool(request: web.Request) -> web.Response:
+        return web.json_response(data.pool(_pool_or_404(request)))
+
+    def _global_pool_rows(request: web.Request) -> np.ndarray:
+        q = request.query
+        return data.select_pools(
+            pool_id=_optional_int(request, "pool_id"),
+            instance_type=q.get("instance_type") or None,
+            region=q.get("region") or None,
+            az=q.get("az") or None,
+        )
+
+    def _series_handlers(series: Callable[..., list[dict[str, Any]]]):
+        async def global_series(request: web.Request) -> web.Response:
+            rows = await asyncio.to_thread(series, _global_pool_rows(request), **_query_args(request))
+            return web.json_response(rows)
+
+        async def pool_series(request: web.Request) -> web.Response:
+            pool_rows = data.select_pools(pool_id=_pool_or_404(request))
+            rows = await asyncio.to_thread(series, pool_rows, **_query_args(request))
+            return web.json_response(rows)
+
+        async def latest(request: web.Request) -> web.Response:
+            pool_rows = data.select_pools(pool_id=_pool_or_404(request))
+            rows = series(pool_rows, since=None, until=None, order="desc", limit=1)
+            if not rows:
+                raise web.HTTPNotFound(text='{"message": "Not Found"}', content_type="application/json")
+            return web.json_response(rows[0])
+
+        return global_series, pool_series, latest
+
+    prices, pool_prices, latest_price = _series_handlers(data.spot_prices)
+    rates, pool_rates, latest_rate = _series_handlers(data.interruption_rates)
+
+    app = web.Application(middlewares=[fault_injection])
+    app.router.add_get("/request-groups", list_groups)
+    app.router.add_get("/request-groups/{group}", get_group)
+    app.router.add_get("/request-groups/{group}/placement-scores", placement_scores)
+    app.router.add_get("/request-groups/{group}/placement-scores/latest", latest_placement_scores)
+    if config.bulk_latest:
+        app.router.add_get("/placement-scores/latest", bulk_latest_placement_scores)
+    app.router.add_get("/pools", list_pools)
+    app.router.add_get("/pools/{pool_id}", get_pool)
+    app.router.add_get("/pools/{pool_id}/spot-prices", pool_prices)
+    app.router.add_get("/pools/{pool_id}/spot-prices/latest", latest_price)
+    app.router.add_get("/pools/{pool_id}/interruption-rates", pool_rates)
+    app.router.add_get("/pools/{pool_id}/interruption-rates/latest", latest_rate)
+    app.router.add_get("/spot-prices", prices)
+    app.router.add_get("/interruption-rates", rates)
+    return app
+
+
+def _parse_args(argv: list[str] | None = None) -> tuple[argparse.Namespace, StandInConfig]:
+    defaults = StandInConfig()
+    parser = argparse.ArgumentParser(description="Local Spot Fleet API stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--regions", default=",".join(defaults.regions), help="Comma-separated regions")
+    parser.add_argument("--azs-per-region", type=int, default=defaults.azs_per_region)
+    parser.add_argument("--instance-types", type=int, default=defaults.instance_types)
+    parser.add_argument("--request-groups", type=int, default=defaults.request_groups)
+    parser.add_argument("--history-days", type=int, default=defaults.history_days)
+    parser.add_argument(
+        "--placement-interval", type=int, default=defaults.placement_interval_seconds, help="Seconds"
+    )
+    parser.add_argument("--price-interval", type=int, default=defaults.price_interval_seconds, help="Seconds")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-jitter-ms", type=float, default=defaults.latency_jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="0-1")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument(
+        "--no-bulk-latest",
+        action="store_true",
+        help="Disable /placement-scores/latest?group_ids=... (clients fall back to fan-out)",
+    )
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.azs_per_region <= 10:
+        parser.error("--azs-per-region must be between 1 and 10")
+    config = StandInConfig(
+        seed=args.seed,
+        regions=tuple(r.strip() for r in args.regions.split(",") if r.strip()),
+        azs_per_region=args.azs_per_region,
+        instance_types=args.instance_types,
+        request_groups=args.request_groups,
+        history_days=args.history_days,
+        placement_interval_seconds=args.placement_interval,
+        price_interval_seconds=args.price_interval,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        api_key=args.api_key,
+        bulk_latest=not args.no_bulk_latest,
+    )
+    return args, config
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entrypoint."""
+    args, config = _parse_args(argv)
+    data = SyntheticFleetData(config)
+    rows_per_day = sum(
+        len(data.group_azs(g)) * len(g["target_capacities"]) for g in data.groups
+    ) * math.ceil(_DAY / config.placement_interval_seconds)
+    print(
+        f"Spot Fleet stand-in: {len(data.pools)} pools, {len(data.groups)} request groups, "
+        f"~{rows_per_day * config.history_days:,} placement-score rows over {config.history_days}d"
+    )
+    print(f"Set SPOT_FLEET_API_BASE_URL=http://{args.host}:{args.port}")
+    web.run_app(create_app(config, data=data), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,308 @@
-"""Availability/spot placement score forecast interface (scaffold)."""
+"""Availability/spot placement score forecast interface.
 
+Learns seasonal placement-score profiles per (request group, AZ, target capacity)
+from stored history and projects them forward (48h by default) with an
+uncertainty band.
+
+Model, per key:
+- level: mean score over the history window
+- hour-of-day profile, shrunk towards the level when a bin has few samples
+- hour-of-week (day-of-week × hour) profile, shrunk towards the hour-of-day profile
+- the latest observed deviation from the profile, decaying with horizon
+
+Every step is a `bincount` or a broadcast over (keys × horizon), so refitting
+all groups of a region is a handful of NumPy calls regardless of key count.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.frames import PlacementScoreFrame
+
+# EC2 Spot placement scores are reported on a 1–10 scale.
+SCORE_MIN = 1.0
+SCORE_MAX = 10.0
+
+_HOURS_PER_DAY = 24
+_HOURS_PER_WEEK = 24 * 7
+# 1970-01-01 was a Thursday; shift so hour-of-week 0 is Monday 00:00 UTC.
+_EPOCH_WEEKDAY_OFFSET_HOURS = 3 * 24
+
+
+def _hour_of_day(epoch_seconds: np.ndarray) -> np.ndarray:
+    return (epoch_seconds // 3600) % _HOURS_PER_DAY
+
+
+def _hour_of_week(epoch_seconds: np.ndarray) -> np.ndarray:
+    return (epoch_seconds // 3600 + _EPOCH_WEEKDAY_OFFSET_HOURS) % _HOURS_PER_WEEK
+
+
+def _to_epoch_seconds(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+@dataclass(frozen=True, slots=True)
+class AvailabilityForecast:
+    """Placement score forecast for many keys on a shared time grid.
+
+    Row `k` of `mean`/`lower`/`upper` belongs to
+    (`group_id[k]`, `availability_zone[k]`, `target_capacity[k]`).
+    """
+
+    times: np.ndarray  # datetime64[s], shape (T,)
+    group_id: np.ndarray  # (K,)
+    availability_zone: np.ndarray  # (K,) object
+    target_capacity: np.ndarray  # (K,)
+    mean: np.ndarray  # (K, T)
+    lower: np.ndarray  # (K, T)
+    upper: np.ndarray  # (K, T)
+    generated_at: datetime
+    version: str
+
+    def __len__(self) -> int:
+        return int(self.group_id.shape[0])
+
+    @property
+    def epoch_seconds(self) -> np.ndarray:
+        return self.times.astype(np.int64)
+
+    def index_of(self, group_id: int, availability_zone: str, target_capacity: int) -> int | None:
+        """Return the row index for a key (None if it has no forecast)."""
+        hits = np.flatnonzero(
+            (self.group_id == group_id)
+            & (self.availability_zone == availability_zone)
+            & (self.target_capacity == target_capacity)
+        )
+        return int(hits[0]) if hits.size else None
+
+    def rows_for_group(self, group_id: int, target_capacity: int | None = None) -> np.ndarray:
+        """Return row indexes for every AZ of a group (optionally one capacity)."""
+        mask = self.group_id == group_id
+        if target_capacity is not None:
+            mask &= self.target_capacity == target_capacity
+        return np.flatnonzero(mask)
+
+    def keys(self) -> list[tuple[int, str, int]]:
+        """(group, AZ, capacity) of every row, in row order."""
+        return list(
+            zip(
+                self.group_id.astype(np.int64).tolist(),
+                self.availability_zone.tolist(),
+                self.target_capacity.astype(np.int64).tolist(),
+            )
+        )
+
+    def merged(self, newer: AvailabilityForecast) -> AvailabilityForecast:
+        """This forecast updated with `newer`, which may cover only some keys.
+
+        Rows of `newer` replace rows with the same (group, AZ, capacity). Other
+        rows are kept, resampled onto `newer`'s time grid (latest step at or
+        before each time, as lookups read them).
+        """
+        fresh = set(newer.keys())
+        kept = np.array([key not in fresh for key in self.keys()], dtype=bool)
+        if not kept.any():
+            return newer
+        t = np.searchsorted(self.epoch_seconds, newer.epoch_seconds, side="right") - 1
+        t = np.clip(t, 0, max(self.times.shape[0] - 1, 0))
+        return AvailabilityForecast(
+            times=newer.times,
+            group_id=np.concatenate([newer.group_id, self.group_id[kept]]),
+            availability_zone=np.concatenate([newer.availability_zone, self.availability_zone[kept]]),
+            target_capacity=np.concatenate([newer.target_capacity, self.target_capacity[kept]]),
+            mean=np.vstack([newer.mean, self.mean[kept][:, t]]),
+            lower=np.vstack([newer.lower, self.lower[kept][:, t]]),
+            upper=np.vstack([newer.upper, self.upper[kept][:, t]]),
+            generated_at=newer.generated_at,
+            version=f"{newer.version}+{self.version}",
+        )
+
+
+class AvailabilityForecaster:
+    """Fits seasonal placement-score profiles and emits forecasts."""
+
+    def __init__(
+        self,
+        *,
+        shrinkage: float = 4.0,
+        deviation_half_life: timedelta = timedelta(hours=3),
+        interval_z: float = 1.2816,
+    ) -> None:
+        """Initialize the forecaster.
+
+        Args:
+            shrinkage: Pseudo-count pulling sparse profile bins towards their parent
+                (hour-of-week → hour-of-day → level).
+            deviation_half_life: How quickly the latest observed deviation from the
+                profile fades out of the forecast.
+            interval_z: Normal quantile for the `lower`/`upper` band (default ≈ 80%).
+        """
+        self.shrinkage = float(shrinkage)
+        self.deviation_half_life_s = deviation_half_life.total_seconds()
+        self.interval_z = float(interval_z)
+
+        self._keys: dict[str, np.ndarray] | None = None
+        self._hod: np.ndarray | None = None  # (K, 24)
+        self._how: np.ndarray | None = None  # (K, 168)
+        self._resid_std: np.ndarray | None = None  # (K,)
+        self._last_t: np.ndarray | None = None  # (K,)
+        self._last_dev: np.ndarray | None = None  # (K,)
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._keys is not None
+
+    def fit(self, frame: PlacementScoreFrame) -> AvailabilityForecaster:
+        """Fit profiles for every (group, AZ, capacity) key in `frame`."""
+        if not len(frame):
+            self._keys = {
+                "group_id": np.empty(0, dtype=np.int64),
+                "availability_zone": np.empty(0, dtype=object),
+                "target_capacity": np.empty(0, dtype=np.int32),
+            }
+            self._hod = np.empty((0, _HOURS_PER_DAY))
+            self._how = np.empty((0, _HOURS_PER_WEEK))
+            self._resid_std = np.empty(0)
+            self._last_t = np.empty(0, dtype=np.int64)
+            self._last_dev = np.empty(0)
+            return self
+
+        by: Sequence = ("group", "az", "capacity")
+        codes, unique_rows = frame.key_codes(by)
+        n_keys = unique_rows.shape[0]
+        t = frame.epoch_seconds
+        y = frame.score
+        k = self.shrinkage
+
+        count = np.bincount(codes, minlength=n_keys)
+        level = np.bincount(codes, weights=y, minlength=n_keys) / count
+
+        hod_idx = codes * _HOURS_PER_DAY + _hour_of_day(t)
+        hod_n = np.bincount(hod_idx, minlength=n_keys * _HOURS_PER_DAY).reshape(n_keys, -1)
+        hod_sum = np.bincount(hod_idx, weights=y, minlength=n_keys * _HOURS_PER_DAY).reshape(n_keys, -1)
+        hod = (hod_sum + k * level[:, None]) / (hod_n + k)
+
+        how_idx = codes * _HOURS_PER_WEEK + _hour_of_week(t)
+        how_n = np.bincount(how_idx, minlength=n_keys * _HOURS_PER_WEEK).reshape(n_keys, -1)
+        how_sum = np.bincount(how_idx, weights=y, minlength=n_keys * _HOURS_PER_WEEK).reshape(n_keys, -1)
+        # Parent for hour-of-week bin h is hour-of-day bin h % 24.
+        hod_parent = np.tile(hod, (1, 7))
+        how = (how_sum + k * hod_parent) / (how_n + k)
+
+        fitted = how[codes, _hour_of_week(t)]
+        resid = y - fitted
+        resid_var = np.bincount(codes, weights=resid * resid, minlength=n_keys) / np.maximum(count - 1, 1)
+
+        # Latest observation per key (ties on timestamp resolved by row order).
+        order = np.lexsort((t, codes))
+        sorted_codes = codes[order]
+        is_last = np.ones(order.shape[0], dtype=bool)
+        is_last[:-1] = sorted_codes[1:] != sorted_codes[:-1]
+        last_rows = order[is_last]
+
+        keys = frame.decode_keys(by, unique_rows)
+        self._keys = keys
+        self._hod = hod
+        self._how = how
+        self._resid_std = np.sqrt(resid_var)
+        self._last_t = t[last_rows]
+        self._last_dev = resid[last_rows]
+        return self
+
+    def forecast(
+        self,
+        *,
+        start: datetime | None = None,
+        horizon: timedelta = timedelta(hours=48),
+        step: timedelta = timedelta(minutes=15),
+    ) -> AvailabilityForecast:
+        """Project the fitted profiles onto a regular grid.
+
+        Args:
+            start: First forecast timestamp (defaults to now, floored to `step`).
+            horizon: Forecast length.
+            step: Grid resolution.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("AvailabilityForecaster.forecast() called before fit().")
+        assert self._keys is not None and self._how is not None
+
+        step_s = int(step.total_seconds())
+        if step_s <= 0:
+            raise ValueError("step must be positive")
+        now = start or datetime.now(tz=timezone.utc)
+        t0 = (_to_epoch_seconds(now) // step_s) * step_s
+        n_steps = max(int(horizon.total_seconds() // step_s), 1)
+        grid = t0 + step_s * np.arange(n_steps, dtype=np.int64)
+
+        profile = self._how[:, _hour_of_week(grid)]  # (K, T)
+        lead = np.maximum(grid[None, :] - self._last_t[:, None], 0)  # (K, T)
+        decay = np.power(0.5, lead / self.deviation_half_life_s)
+        mean = np.clip(profile + self._last_dev[:, None] * decay, SCORE_MIN, SCORE_MAX)
+
+        # Uncertainty grows from ~0 at the last observation to the residual spread.
+        sigma = self._resid_std[:, None] * np.sqrt(1.0 - decay * decay)
+        lower = np.clip(mean - self.interval_z * sigma, SCORE_MIN, SCORE_MAX)
+        upper = np.clip(mean + self.interval_z * sigma, SCORE_MIN, SCORE_MAX)
+
+        digest = hashlib.blake2b(digest_size=8)
+        for arr in (grid, self._keys["group_id"], self._keys["target_capacity"], np.round(mean, 3)):
+            digest.update(np.ascontiguousarray(arr).tobytes())
+        digest.update("|".join(str(a) for a in self._keys["availability_zone"]).encode())
+
+        return AvailabilityForecast(
+            times=grid.astype("datetime64[s]"),
+            group_id=self._keys["group_id"],
+            availability_zone=self._keys["availability_zone"],
+            target_capacity=self._keys["target_capacity"],
+            mean=mean,
+            lower=lower,
+            upper=upper,
+            generated_at=datetime.now(tz=timezone.utc),
+            version=digest.hexdigest(),
+        )
+
+
+def forecast_region_availability(
+    region: str,
+    *,
+    history: timedelta = timedelta(days=14),
+    horizon: timedelta = timedelta(hours=48),
+    step: timedelta = timedelta(minutes=15),
+    limit: int = 50_000,
+) -> AvailabilityForecast:
+    """Fetch placement history for every fleet in `region` and forecast it.
+
+    Args:
+        region: AWS region (e.g. "eu-west-2")
+        history: How much placement history to learn from
+        horizon: Forecast length
+        step: Forecast grid resolution
+        limit: Per-fleet row limit for the history query
+
+    Returns:
+        AvailabilityForecast covering every (group, AZ, capacity) seen in history
+    """
+    # Local import: keeps this module usable offline (e.g. backtesting on stored frames).
+    from src.backend.data.availability_data import (
+        get_available_fleets,
+        get_fleet_placement_score_frame,
+    )
+
+    until = datetime.now(tz=timezone.utc)
+    since = until - history
+    frames = [
+        get_fleet_placement_score_frame(fleet.id, since=since, until=until, limit=limit)
+        for fleet in get_available_fleets()
+        if fleet.region == region
+    ]
+    forecaster = AvailabilityForecaster().fit(PlacementScoreFrame.concat(frames))
+    return forecaster.forecast(start=until, horizon=horizon, step=step)
@@ -1,2 +1,85 @@
-"""Carbon intensity forecast interface (scaffold)."""
+"""Carbon intensity forecast interface.
 
+Wraps the provider forecast in a `CarbonForecast` that carries a content
+version, so consumers (the scheduler's plan cache) can tell whether a re-fetch
+actually changed anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.models.carbon_intensity import CarbonIntensitySeries
+
+# Carbon grid regions for AWS regions whose grid has a dedicated provider.
+# Anything else is passed through unchanged (the default provider resolves it).
+CARBON_REGION_BY_AWS_REGION: dict[str, str] = {
+    "eu-west-2": "GB",  # London
+}
+
+
+def carbon_region_for(region: str) -> str:
+    """Carbon provider region for an AWS region (identity when unmapped)."""
+    return CARBON_REGION_BY_AWS_REGION.get(region.strip().lower(), region)
+
+
+def series_version(series: CarbonIntensitySeries) -> str:
+    """Stable content hash of a series (timestamps and values, rounded)."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{series.provider_id}|{series.kind.value}|{series.region}".encode())
+    for point in series.points:
+        digest.update(f"{int(point.timestamp.timestamp())}:{point.value_g_per_kwh:.1f};".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CarbonForecast:
+    """A carbon intensity forecast and its content version."""
+
+    series: CarbonIntensitySeries
+    start: datetime
+    horizon: timedelta
+    fetched_at: datetime
+    version: str
+
+    @property
+    def end(self) -> datetime:
+        return self.start + self.horizon
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.series.points
+
+
+def get_carbon_forecast(
+    region: str,
+    *,
+    start: datetime | None = None,
+    horizon: timedelta = timedelta(hours=48),
+) -> CarbonForecast:
+    """Fetch the carbon intensity forecast for an AWS (or grid) region.
+
+    Args:
+        region: AWS region (e.g. "eu-west-2") or carbon grid region (e.g. "GB")
+        start: Forecast start (defaults to now)
+        horizon: Forecast length
+
+    Returns:
+        CarbonForecast
+    """
+    # Local import: the carbon service pulls in provider/auth modules.
+    from src.backend.data.carbon_data import CarbonDataService
+
+    start = start or datetime.now(tz=timezone.utc)
+    series = CarbonDataService().get_forecast(
+        region=carbon_region_for(region), start=start, horizon=horizon
+    )
+    return CarbonForecast(
+        series=series,
+        start=start,
+        horizon=horizon,
+        fetched_at=datetime.now(tz=timezone.utc),
+        version=series_version(series),
+    )
@@ -12,6 +12,8 @@ class DataFreshness:
 
     last_updated: datetime | None
     stale_after_seconds: int = 3600
+    # True while the upstream's circuit breaker is not closed (failing fast).
+    degraded: bool = False
 
     def format_age(self) -> str:
         """Format the age in a human-readable way."""
@@ -32,6 +34,12 @@ class DataFreshness:
             return f"{int(age.total_seconds() / 3600)}h ago"
         return f"{int(age.days)}d ago"
 
+    def format_status(self) -> str:
+        """Age for a healthy upstream, "degraded" while its breaker is open."""
+        if self.degraded:
+            return "degraded"
+        return self.format_age()
+
     @property
     def age_seconds(self) -> float | None:
         if self.last_updated is None:
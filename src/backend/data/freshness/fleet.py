@@ -2,21 +2,58 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Sequence
 
+from src.backend.data.circuit_breaker import SPOT_FLEET_UPSTREAM, get_circuit_breaker
 from src.backend.data.freshness.base import DataFreshness
+from src.config.defaults import (
+    DEFAULT_FLEET_FRESHNESS_PASSIVE_SECONDS,
+    DEFAULT_FLEET_FRESHNESS_PROBE_INTERVAL_SECONDS,
+)
 
 if TYPE_CHECKING:
     from src.backend.data.fleet.api_client import SpotFleetAPIClient
 
+# Given the request groups in use (most recent first), return the newest
+# placement-score timestamp upstream has, or None.
+FleetFreshnessProbe = Callable[[Sequence[int]], "datetime | None"]
+
 
 class FleetFreshnessTracker:
-    """Tracks freshness of Spot Fleet availability data."""
+    """Tracks freshness of Spot Fleet availability data.
+
+    Freshness is derived passively from data other calls already fetched (the
+    fleet service reports every placement-score timestamp it sees). The active
+    probe in `check_from_api` only runs when that passive data is older than
+    `passive_max_age`. It asks for the latest scores of a request group actually
+    in use, or of a group from the cached catalog, and is rate-limited across
+    callers.
+    """
 
-    def __init__(self, api_client: SpotFleetAPIClient | None = None) -> None:
+    def __init__(
+        self,
+        api_client: SpotFleetAPIClient | None = None,
+        *,
+        passive_max_age: timedelta = timedelta(seconds=DEFAULT_FLEET_FRESHNESS_PASSIVE_SECONDS),
+        probe_interval: timedelta = timedelta(seconds=DEFAULT_FLEET_FRESHNESS_PROBE_INTERVAL_SECONDS),
+        max_tracked_groups: int = 8,
+    ) -> None:
         self._last_updated: datetime | None = None
         self._api_client = api_client
+        self._passive_max_age = passive_max_age
+        self._probe_interval = probe_interval
+        self._max_tracked_groups = max_tracked_groups
+
+        self._lock = threading.Lock()
+        # Wall-clock time we last received upstream data (passively or by probe).
+        self._observed_at: datetime | None = None
+        self._last_probe_at: datetime | None = None
+        self._probing = False
+        self._groups: OrderedDict[int, None] = OrderedDict()
+        self._probe: FleetFreshnessProbe | None = None
 
     def update(self, timestamp: datetime | None = None) -> None:
         # Important: don't overwrite a previously-known freshness timestamp with None.
@@ -26,32 +63,91 @@ class FleetFreshnessTracker:
             return
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=timezone.utc)
-        self._last_updated = timestamp
+        with self._lock:
+            if self._last_updated is None or timestamp >= self._last_updated:
+                self._last_updated = timestamp
+            self._observed_at = datetime.now(tz=timezone.utc)
 
     def get(self) -> DataFreshness:
-        return DataFreshness(last_updated=self._last_updated)
+        return DataFreshness(
+            last_updated=self._last_updated,
+            degraded=get_circuit_breaker(SPOT_FLEET_UPSTREAM).is_degraded,
+        )
+
+    # --- Groups in use ---
+    def track_group(self, group_id: int) -> None:
+        """Record that a request group's placement data is being used."""
+        with self._lock:
+            self._groups[int(group_id)] = None
+            self._groups.move_to_end(int(group_id), last=False)
+            while len(self._groups) > self._max_tracked_groups:
+                self._groups.popitem(last=True)
+
+    @property
+    def tracked_groups(self) -> list[int]:
+        """Request groups in use, most recently used first."""
+        with self._lock:
+            return list(self._groups)
+
+    def set_probe(self, probe: FleetFreshnessProbe | None) -> None:
+        """Override how the active probe fetches a timestamp (None restores the default)."""
+        self._probe = probe
 
+    def has_recent_data(self) -> bool:
+        """Whether upstream data arrived within `passive_max_age`."""
+        observed_at = self._observed_at
+        if observed_at is None:
+            return False
+        return datetime.now(tz=timezone.utc) - observed_at <= self._passive_max_age
+
+    # --- Active probe ---
     def check_from_api(self) -> datetime | None:
-        """Determine last updated time from the Spot Fleet API."""
-        # Lazy import to avoid circular dependency
-        from src.backend.data.fleet.api_client import SpotFleetAPIClient
+        """Determine last updated time, probing the API only if passive data is stale."""
+        if self.has_recent_data():
+            return self._last_updated
 
+        now = datetime.now(tz=timezone.utc)
+        with self._lock:
+            recently_probed = (
+                self._last_probe_at is not None and now - self._last_probe_at < self._probe_interval
+            )
+            if self._probing or recently_probed:
+                return self._last_updated
+            self._probing = True
+            self._last_probe_at = now
         try:
-            api_client = self._api_client or SpotFleetAPIClient()
-            fleets = api_client.get_request_groups()
-            if not fleets:
-                return None
-            latest_scores = api_client.get_latest_placement_scores(fleets[0].id)
-            if not latest_scores:
-                return None
-            return max(score.measured_at for score in latest_scores)
+            return (self._probe or self._default_probe)(self.tracked_groups)
         except Exception:
             return None
+        finally:
+            with self._lock:
+                self._probing = False
+
+    def _default_probe(self, group_ids: Sequence[int]) -> datetime | None:
+        if self._api_client is not None:
+            group_id = group_ids[0] if group_ids else None
+            if group_id is None:
+                fleets = self._api_client.get_request_groups()
+                if not fleets:
+                    return None
+                group_id = fleets[0].id
+            scores = self._api_client.get_latest_placement_scores(group_id)
+            ts = max((score.measured_at for score in scores), default=None)
+            self.update(ts)
+            return ts
+
+        # Lazy import to avoid circular dependency; goes through the shared service so
+        # the cached catalog is reused and the result feeds passive tracking.
+        from src.backend.data.availability_data import get_service
+
+        return get_service().probe_freshness(group_ids)
 
     def refresh_from_api(self) -> bool:
         ts = self.check_from_api()
         if ts is None:
             return False
-        self.update(ts)
+        # Probes record what they observe themselves; re-recording a timestamp we
+        # already hold would make stale data look recently observed.
+        if ts != self._last_updated:
+            self.update(ts)
         return True
-
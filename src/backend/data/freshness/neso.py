@@ -4,6 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+from src.backend.data.circuit_breaker import (
+    NESO_UPSTREAM,
+    get_circuit_breaker,
+    is_upstream_failure,
+)
 from src.backend.data.freshness.base import DataFreshness
 
 
@@ -17,18 +22,26 @@ class NesoFreshnessTracker:
         self._last_updated = timestamp or datetime.now(tz=timezone.utc)
 
     def get(self) -> DataFreshness:
-        return DataFreshness(last_updated=self._last_updated)
+        return DataFreshness(
+            last_updated=self._last_updated,
+            degraded=get_circuit_breaker(NESO_UPSTREAM).is_degraded,
+        )
 
     def check_from_api(self) -> datetime | None:
         """Return a representative timestamp from the API response."""
         import requests
         from dateutil.parser import isoparse
 
-        try:
+        breaker = get_circuit_breaker(NESO_UPSTREAM)
+
+        def _request() -> dict:
             url = "https://api.carbonintensity.org.uk/intensity"
-            resp = requests.get(url, timeout=30)
+            resp = requests.get(url, timeout=breaker.timeout(30))
             resp.raise_for_status()
-            payload = resp.json()
+            return resp.json()
+
+        try:
+            payload = breaker.call(_request, is_failure=is_upstream_failure)
 
             items = payload.get("data", []) or []
             if not items:
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from src.backend.data.freshness.base import DataFreshness
-from src.backend.data.freshness.fleet import FleetFreshnessTracker
+from src.backend.data.freshness.fleet import FleetFreshnessProbe, FleetFreshnessTracker
 from src.backend.data.freshness.neso import NesoFreshnessTracker
 from src.backend.data.freshness.watttime import WattTimeFreshnessTracker
 
@@ -52,6 +52,12 @@ class DataFreshnessTracker:
     def get_availability_freshness(self) -> DataFreshness:
         return self._fleet.get()
 
+    def track_availability_group(self, group_id: int) -> None:
+        self._fleet.track_group(group_id)
+
+    def set_availability_probe(self, probe: FleetFreshnessProbe | None) -> None:
+        self._fleet.set_probe(probe)
+
     # --- Legacy / convenience ---
     def update_carbon_freshness(self, timestamp: datetime | None = None) -> None:
         """Legacy: update both carbon sources as 'refreshed'."""
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
+from src.backend.data.circuit_breaker import (
+    WATTTIME_UPSTREAM,
+    get_circuit_breaker,
+    is_upstream_failure,
+)
 from src.backend.data.freshness.base import DataFreshness
 
 
@@ -18,15 +22,16 @@ class WattTimeFreshnessTracker:
         self._last_updated = timestamp or datetime.now(tz=timezone.utc)
 
     def get(self) -> DataFreshness:
-        return DataFreshness(last_updated=self._last_updated)
+        return DataFreshness(
+            last_updated=self._last_updated,
+            degraded=get_circuit_breaker(WATTTIME_UPSTREAM).is_degraded,
+        )
 
     @staticmethod
     def _load_local_credentials():
-        from src.storage.config_store import ConfigStore
+        from src.config.settings import get_settings
 
-        repo_root = Path(__file__).resolve().parents[4]
-        store = ConfigStore(repo_root / "data" / "configs")
-        return store.load_credentials()
+        return get_settings().credentials
 
     def check_from_api(self) -> datetime | None:
         """Return most recent point_time from a small historical query."""
@@ -52,9 +57,16 @@ class WattTimeFreshnessTracker:
             }
             headers = {"Authorization": f"Bearer {token}"}
 
-            resp = requests.get(url, headers=headers, params=params, timeout=30)
-            resp.raise_for_status()
-            payload = resp.json()
+            breaker = get_circuit_breaker(WATTTIME_UPSTREAM)
+
+            def _request() -> dict:
+                resp = requests.get(
+                    url, headers=headers, params=params, timeout=breaker.timeout(30)
+                )
+                resp.raise_for_status()
+                return resp.json()
+
+            payload = breaker.call(_request, is_failure=is_upstream_failure)
 
             items = payload.get("data", []) or []
             if not items:
@@ -0,0 +1,342 @@
+"""Anytime planning under a wall-clock budget.
+
+`Scheduler.plan` scores every candidate before it returns, which can take a
+while for long windows over many fleet options. `AnytimePlanner` scores the
+same candidates in an order that finds good plans early and reports the best
+plan so far whenever asked:
+
+1. start slots are visited coarse to fine: first an evenly spaced sample of
+   the window, so early plans already cover it, then the remaining slots in
+   ascending order of a carbon lower bound (the window's carbon at the
+   smallest capacity of any option);
+2. each batch is scored and merged into a running Pareto front under the risk
+   mode, exactly as `Scheduler.rank` would filter it;
+3. a plan is picked from the current front with the mode's weights. Its
+   quality bound is the lowest carbon any candidate not yet scored could
+   have, so the gap to the lowest-carbon plan found only shrinks.
+
+Once every candidate is scored the result is identical to `Scheduler.plan`,
+and the scored candidates and plan are memoised by the scheduler so switching
+risk mode afterwards only re-ranks them.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator
+
+import numpy as np
+
+from src.backend.scheduling.candidates import CandidateSpace, start_window
+from src.backend.scheduling.pareto_algorithm import pareto_front_mask
+from src.backend.scheduling.risk_modes import (
+    RISK_PROFILES,
+    RiskMode,
+    auto_risk_mode,
+    deadline_slack_seconds,
+)
+from src.backend.scheduling.scheduler import (
+    PLAN_OBJECTIVES,
+    PlanningInputs,
+    Scheduler,
+    ScoredCandidates,
+    ScoringModel,
+    get_scheduler,
+    running_front,
+)
+from src.config.defaults import (
+    DEFAULT_ANYTIME_BATCH_SIZE,
+    DEFAULT_ANYTIME_BUDGET_SECONDS,
+    DEFAULT_ANYTIME_UPDATE_SECONDS,
+)
+from src.models.schedule import Schedule
+from src.models.workload_config import WorkloadConfig
+
+# Start slots sampled across the window before the best-first pass.
+_COARSE_SLOTS = 32
+
+
+@dataclass(frozen=True, slots=True)
+class AnytimePlan:
+    """Best plan found so far, with how far the search got."""
+
+    schedule: Schedule
+    evaluated: int
+    total: int
+    # Lowest carbon (g) any candidate not yet scored could have; None when the
+    # search is complete or there is no carbon forecast.
+    carbon_floor_g: float | None
+    # Fraction by which a candidate not yet scored could still undercut the
+    # lowest-carbon plan found (0 once that cannot happen; None without carbon).
+    carbon_gap: float | None
+    # Set while candidates remain to be scored.
+    improving: bool
+    elapsed_seconds: float
+
+    @property
+    def coverage(self) -> float:
+        return self.evaluated / self.total if self.total else 1.0
+
+
+class _Search:
+    """Incremental scoring and Pareto front of one draft's candidate space."""
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        model: ScoringModel,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+        batch_size: int,
+    ) -> None:
+        self.scheduler = scheduler
+        self.config = config
+        self.inputs = inputs
+        self.model = model
+        self.risk_mode = risk_mode
+        self.now = now
+
+        space = model.space
+        self.space = space
+        n_options = max(space.n_options, 1)
+        self.objectives = np.full((space.size, len(PLAN_OBJECTIVES)), np.nan)
+        self.placement = np.full(space.size, np.nan)
+        self.ranked = np.full((space.size, len(PLAN_OBJECTIVES)), np.nan)
+        self.scored = np.zeros(space.size, dtype=bool)
+        self.slack = deadline_slack_seconds(space, config.deadline_at)
+        self.front_index = np.empty(0, dtype=np.int64)
+        self.front_obj = np.empty((0, len(PLAN_OBJECTIVES)))
+        self.evaluated = 0
+
+        # Flat indexes are slot-major, so not-yet-started candidates are a suffix.
+        first_slot = max(-(-(int(now.timestamp()) - space.first_start) // space.step), 0)
+        self.first_slot = min(first_slot, space.n_slots)
+        self.slot_floor = self._slot_carbon_floor(space)
+        order = _slot_order(self.first_slot, space.n_slots, self.slot_floor)
+        # Lowest carbon floor among the slots from each position of `order` on.
+        floors = self.slot_floor[order]
+        self.remaining_floor = np.append(np.minimum.accumulate(floors[::-1])[::-1], np.inf)
+        self.order = order
+        self.position = 0
+        self.slots_per_batch = max(batch_size // n_options, 1)
+
+    def _slot_carbon_floor(self, space: CandidateSpace) -> np.ndarray:
+        """Lowest carbon objective of any option per start slot (inf: none can be on the front)."""
+        carbon = self.model.carbon
+        if not carbon.has_data or space.n_options == 0:
+            return np.zeros(space.n_slots)
+        starts = space.slot_starts()
+        capacity = np.full(space.n_slots, float(space.target_capacity.min()))
+        floor = carbon.emissions(starts, space.runtime_seconds, capacity, self.model.power_kw)
+        # Candidates with unknown carbon are never on the front.
+        return np.where(np.isfinite(floor), floor, np.inf)
+
+    @property
+    def done(self) -> bool:
+        return self.position >= self.order.shape[0]
+
+    def step(self) -> None:
+        """Score the next batch of slots and merge it into the front."""
+        slots = self.order[self.position : self.position + self.slots_per_batch]
+        self.position += slots.shape[0]
+        n_options = self.space.n_options
+        flat = (slots[:, None] * n_options + np.arange(n_options)).reshape(-1)
+        chunk = self.space.take(flat)
+        objectives = self.model.objectives(chunk)
+        placement = self.model.placement_score(chunk)
+        self.objectives[flat] = objectives
+        self.placement[flat] = placement
+        self.evaluated += flat.shape[0]
+
+        ranked, eligible = RISK_PROFILES[self.risk_mode].apply(
+            objectives, placement, self.slack[flat], self.space.runtime_seconds
+        )
+        eligible &= flat >= self.first_slot * n_options
+        self.ranked[flat] = ranked
+        self.scored[flat] = True
+        if eligible.any():
+            index = np.concatenate([self.front_index, flat[eligible]])
+            obj = np.vstack([self.front_obj, ranked[eligible]])
+            mask = pareto_front_mask(obj)
+            self.front_index, self.front_obj = index[mask], obj[mask]
+
+    def _front(self) -> np.ndarray:
+        """Current front (flat indexes, ascending like `Scheduler.pareto_candidates`)."""
+        if self.front_index.size:
+            return np.sort(self.front_index)
+        # Nothing passes the mode's thresholds yet: rank every started-later
+        # candidate scored so far, as `Scheduler.ranked_candidates` does.
+        first_flat = self.first_slot * self.space.n_options
+        scored = np.flatnonzero(self.scored)
+        scored = scored[scored >= first_flat]
+        index, _ = running_front([(scored, self.ranked[scored])])
+        return np.sort(index)
+
+    def snapshot(self, started: float, clock: Callable[[], float]) -> AnytimePlan:
+        """Best plan from the candidates scored so far."""
+        schedule = self.scheduler.rank(
+            self.config,
+            self.inputs,
+            ScoredCandidates(model=self.model, objectives=self.objectives, placement=self.placement),
+            self.risk_mode,
+            now=self.now,
+            pareto=(self.ranked, self._front()),
+        )
+        if self.done:
+            scored = ScoredCandidates(model=self.model, objectives=self.objectives, placement=self.placement)
+            self.scheduler.remember(
+                self.config, self.inputs, self.risk_mode, now=self.now, scored=scored, schedule=schedule
+            )
+            return _complete(schedule, elapsed=clock() - started)
+
+        schedule = replace(schedule, candidates_evaluated=self.evaluated)
+        floor: float | None = None
+        gap: float | None = None
+        if self.model.carbon.has_data:
+            floor = float(self.remaining_floor[self.position])
+            found = [o.carbon_g for o in schedule.front if o.carbon_g is not None]
+            best = min(found, default=np.inf)
+            gap = float(np.clip((best - floor) / best, 0.0, 1.0)) if 0 < best < np.inf else None
+        return AnytimePlan(
+            schedule=schedule,
+            evaluated=self.evaluated,
+            total=self.space.size,
+            carbon_floor_g=floor,
+            carbon_gap=gap,
+            improving=True,
+            elapsed_seconds=clock() - started,
+        )
+
+
+def _slot_order(first_slot: int, n_slots: int, floor: np.ndarray) -> np.ndarray:
+    """Visit order of start slots: a coarse sample, the rest by carbon floor, started ones last."""
+    upcoming = np.arange(first_slot, n_slots, dtype=np.int64)
+    stride = max(upcoming.shape[0] // _COARSE_SLOTS, 1)
+    coarse = upcoming[::stride]
+    rest = np.setdiff1d(upcoming, coarse, assume_unique=True)
+    rest = rest[np.argsort(floor[rest], kind="stable")]
+    # Already-started slots are never eligible; they are scored only so the
+    # memoised candidates are complete.
+    started = np.arange(0, first_slot, dtype=np.int64)
+    return np.concatenate([coarse, rest, started])
+
+
+def _complete(schedule: Schedule, *, elapsed: float) -> AnytimePlan:
+    return AnytimePlan(
+        schedule=schedule,
+        evaluated=schedule.candidates_evaluated,
+        total=schedule.candidates_evaluated,
+        carbon_floor_g=None,
+        carbon_gap=0.0,
+        improving=False,
+        elapsed_seconds=elapsed,
+    )
+
+
+class AnytimePlanner:
+    """Plans a draft within a wall-clock budget, then keeps refining the plan."""
+
+    def __init__(
+        self,
+        scheduler: Scheduler | None = None,
+        *,
+        batch_size: int = DEFAULT_ANYTIME_BATCH_SIZE,
+        update_interval: timedelta = timedelta(seconds=DEFAULT_ANYTIME_UPDATE_SECONDS),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            scheduler: Scheduler providing inputs, scoring and ranking (defaults
+                to the shared one, whose memo cache the final plan lands in).
+            batch_size: Candidates scored between budget checks.
+            update_interval: Time between two plans yielded while refining.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.scheduler = scheduler or get_scheduler()
+        self.batch_size = batch_size
+        self.update_interval_seconds = update_interval.total_seconds()
+        self._clock = clock
+
+    def plan(
+        self,
+        config: WorkloadConfig,
+        *,
+        budget: timedelta = timedelta(seconds=DEFAULT_ANYTIME_BUDGET_SECONDS),
+        now: datetime | None = None,
+        risk_mode: RiskMode | None = None,
+    ) -> AnytimePlan:
+        """Best plan found within `budget` (see `plans`)."""
+        plans = self.plans(config, budget=budget, now=now, risk_mode=risk_mode)
+        try:
+            return next(plans)
+        finally:
+            plans.close()
+
+    def plans(
+        self,
+        config: WorkloadConfig,
+        *,
+        budget: timedelta = timedelta(seconds=DEFAULT_ANYTIME_BUDGET_SECONDS),
+        now: datetime | None = None,
+        risk_mode: RiskMode | None = None,
+    ) -> Iterator[AnytimePlan]:
+        """Yield the best plan found within `budget`, then progress while refining.
+
+        Loading inputs counts against the budget, and at least one batch is
+        always scored, so the first plan can arrive later than `budget` on a
+        cold cache. After that a plan is yielded every `update_interval`, even
+        when the chosen plan has not changed, so callers see the search advance
+        and can stop between yields. Refining continues only while the caller
+        iterates; closing the iterator stops it.
+
+        Args:
+            config: Workload draft; needs a runtime estimate and a region or fleet.
+            budget: Wall-clock time until the first plan.
+            now: Reference time (defaults to now).
+            risk_mode: Risk mode to rank with (defaults to `auto_risk_mode(config)`).
+
+        Yields:
+            AnytimePlan. The last one has `improving` False and equals
+            `Scheduler.plan` for the same arguments.
+        """
+        started = self._clock()
+        deadline = started + budget.total_seconds()
+        now = now or datetime.now(tz=timezone.utc)
+        risk_mode = risk_mode or auto_risk_mode(config)
+        scheduler = self.scheduler
+
+        inputs = scheduler.inputs_for(config, now=now, until_epoch=scheduler.horizon_end(config, now))
+        cached, scored = scheduler.cached(config, inputs, risk_mode, now=now)
+        space = None
+        if cached is None and scored is None and start_window(config, now=now) is not None:
+            space = scheduler.build_space(config, inputs, now=now)
+        if space is None or space.size == 0:
+            # Memoised, or nothing to search: the regular plan is immediate.
+            schedule = scheduler.plan(config, now=now, risk_mode=risk_mode)
+            yield _complete(schedule, elapsed=self._clock() - started)
+            return
+
+        model = ScoringModel.build(space, inputs, power_kw=scheduler.instance_power_kw)
+        search = _Search(scheduler, config, inputs, model, risk_mode, now=now, batch_size=self.batch_size)
+        search.step()
+        while not search.done and self._clock() < deadline:
+            search.step()
+        latest = search.snapshot(started, self._clock)
+        yield latest
+
+        next_update = self._clock() + self.update_interval_seconds
+        while latest.improving:
+            search.step()
+            if not search.done and self._clock() < next_update:
+                continue
+            # Yield at every update even when the plan is unchanged: the progress
+            # is new, and callers get a regular point to stop at.
+            latest = search.snapshot(started, self._clock)
+            next_update = self._clock() + self.update_interval_seconds
+            yield latest
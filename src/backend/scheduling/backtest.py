@@ -0,0 +1,893 @@
+"""Offline backtesting of scheduling policies.
+
+A backtest replays a workload stream (synthetic or recorded) through the
+scheduler at simulated time and reports what each policy would have realised:
+
+1. `BacktestHistory` holds one region's recorded inputs: carbon actuals and
+   optionally the carbon forecasts as issued ("vintages"), placement-score
+   history, spot prices and interruption rates.
+2. Workloads are planned at the first decision tick after they are submitted.
+   At each tick the planner only sees history up to that time: the latest
+   carbon vintage (or the actuals, without vintages), the usual trailing
+   windows of prices, rates and placement scores, and a placement-score
+   forecast fitted on them. Inputs and scoring engines are built once per tick
+   and shared by every workload and policy. Policies that only differ in risk
+   mode or weights share scored candidates as well and just re-rank them.
+3. Chosen plans are evaluated against what actually happened, for all
+   workloads of a policy at once. Carbon and cost come from the actual carbon
+   intensity and prices. A run is not placed with probability given by the
+   actual placement score at its start, and it is interrupted according to the
+   actual pool hazards. Either way it waits `restart_delay`. An interrupted
+   run then starts over, or resumes if the workload is interruptible.
+   Random draws are shared by all policies, so differences between policies
+   are not sampling noise.
+
+Policies are split across worker processes (started with "spawn", like
+`ParallelPlanner`). Each worker gets the history once through the pool
+initializer and replays its policies tick by tick.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.frames import PlacementScoreFrame
+from src.backend.data.fleet.models import (
+    InstancePool,
+    InterruptionRate,
+    PlacementScore,
+    RequestGroup,
+    SpotPrice,
+)
+from src.backend.data.fleet.pool_catalog import PoolCatalog
+from src.backend.data.forecasts.availability_forecast import (
+    SCORE_MAX,
+    SCORE_MIN,
+    AvailabilityForecast,
+    AvailabilityForecaster,
+)
+from src.backend.data.forecasts.carbon_forecast import (
+    CarbonForecast,
+    carbon_region_for,
+    series_version,
+)
+from src.backend.scheduling.candidates import start_window
+from src.backend.scheduling.carbon_model import CarbonIntensityEngine
+from src.backend.scheduling.cost_model import SpotCostEngine
+from src.backend.scheduling.interruption_risk import InterruptionSurvivalEngine
+from src.backend.scheduling.risk_modes import RiskMode, auto_risk_mode
+from src.backend.scheduling.scheduler import (
+    PLACEMENT_HISTORY,
+    PRICE_HISTORY,
+    RATE_HISTORY,
+    PlanningInputs,
+    Scheduler,
+    ScoredCandidates,
+    ScoringTables,
+)
+from src.backend.scheduling.time_grid import TimeGrid, to_epoch_seconds, window_integral
+from src.config.defaults import (
+    DEFAULT_BACKTEST_DECISION_INTERVAL_SECONDS,
+    DEFAULT_BACKTEST_RESTART_DELAY_SECONDS,
+    DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,
+    DEFAULT_INSTANCE_POWER_KW,
+    DEFAULT_SCHEDULING_SLOT_SECONDS,
+)
+from src.models.carbon_intensity import CarbonIntensitySeries
+from src.models.schedule import PlanOption
+from src.models.workload_config import DelayTolerance, WorkloadConfig
+
+_SECONDS_PER_HOUR = 3600.0
+# Placement probability assumed where no placement score was recorded.
+_NEUTRAL_PLACEMENT_SCORE = (SCORE_MIN + SCORE_MAX) / 2
+# Most rows requested per history call when loading a backtest period.
+_MAX_HISTORY_ROWS = 1_000_000
+
+
+# --- Inputs ---
+@dataclass(frozen=True, slots=True)
+class BacktestHistory:
+    """Recorded planning inputs for one region over a period."""
+
+    region: str
+    start: datetime
+    end: datetime
+    fleets: tuple[RequestGroup, ...]
+    pools: tuple[InstancePool, ...]
+    carbon_actual: CarbonIntensitySeries | None
+    # Carbon forecasts as issued, any order. Without any, the planner sees the
+    # actuals (perfect foresight, so savings are an upper bound).
+    carbon_vintages: tuple[CarbonForecast, ...] = ()
+    # Trailing history before `start` is needed for the first decisions.
+    placement: PlacementScoreFrame = field(default_factory=PlacementScoreFrame.empty)
+    spot_prices: tuple[SpotPrice, ...] = ()
+    interruption_rates: tuple[InterruptionRate, ...] = ()
+
+    @classmethod
+    def load(
+        cls,
+        region: str,
+        *,
+        start: datetime,
+        end: datetime,
+        carbon_vintages: Sequence[CarbonForecast] = (),
+    ) -> BacktestHistory:
+        """Fetch a period of history from the data services.
+
+        Each source is best-effort, like the live scheduler's inputs: a
+        missing one leaves that objective uninformed.
+
+        Args:
+            region: AWS region to replay.
+            start: First decision time.
+            end: Last decision time.
+            carbon_vintages: Recorded carbon forecasts to plan with.
+        """
+        # Local import: keeps backtests runnable offline on stored history.
+        from src.backend.data import availability_data
+        from src.backend.data.carbon_data import CarbonDataService
+
+        fleets: list[RequestGroup] = []
+        pools: list[InstancePool] = []
+        frames: list[PlacementScoreFrame] = []
+        prices: list[SpotPrice] = []
+        rates: list[InterruptionRate] = []
+        carbon: CarbonIntensitySeries | None = None
+        try:
+            fleets = [f for f in availability_data.get_available_fleets() if f.region == region]
+        except Exception:
+            fleets = []
+        try:
+            catalog = availability_data.get_pool_catalog()
+            catalog.ensure_loaded()
+            pools = catalog.find(region=region)
+        except Exception:
+            pools = []
+        for fleet in fleets:
+            try:
+                frames.append(
+                    availability_data.get_fleet_placement_score_frame(
+                        fleet.id, since=start - PLACEMENT_HISTORY, until=end, limit=_MAX_HISTORY_ROWS
+                    )
+                )
+            except Exception:
+                continue
+        try:
+            prices = availability_data.get_spot_prices(
+                region=region, since=start - PRICE_HISTORY, until=end, limit=_MAX_HISTORY_ROWS
+            )
+        except Exception:
+            prices = []
+        instance_types = {t for fleet in fleets for t in fleet.instance_types or ()}
+        for pool in pools:
+            if pool.instance_type not in instance_types:
+                continue
+            try:
+                rates.extend(
+                    availability_data.get_pool_interruption_rates(
+                        pool.id, since=start - RATE_HISTORY, until=end, limit=_MAX_HISTORY_ROWS
+                    )
+                )
+            except Exception:
+                continue
+        try:
+            carbon = CarbonDataService().get_actual(region=carbon_region_for(region), start=start, end=end)
+        except Exception:
+            carbon = None
+
+        return cls(
+            region=region,
+            start=start,
+            end=end,
+            fleets=tuple(fleets),
+            pools=tuple(pools),
+            carbon_actual=carbon,
+            carbon_vintages=tuple(carbon_vintages),
+            placement=PlacementScoreFrame.concat(frames),
+            spot_prices=tuple(prices),
+            interruption_rates=tuple(rates),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestWorkload:
+    """A workload of the replayed stream."""
+
+    submitted_at: datetime
+    config: WorkloadConfig
+
+
+def synthetic_workloads(
+    region: str,
+    *,
+    start: datetime,
+    end: datetime,
+    per_day: float = 24.0,
+    runtime_hours: tuple[float, float] = (0.5, 8.0),
+    interruptible_share: float = 0.5,
+    deadline_slack: float = 0.5,
+    fleet_ids: Sequence[int] = (),
+    seed: int = 0,
+) -> list[BacktestWorkload]:
+    """A random workload stream with Poisson arrivals.
+
+    Args:
+        region: Region every workload runs in.
+        start: First submission time.
+        end: Submissions stop here.
+        per_day: Mean submissions per day.
+        runtime_hours: Runtime range (log-uniform, whole minutes).
+        interruptible_share: Fraction of interruptible workloads.
+        deadline_slack: Deadline after the latest start the delay tolerance
+            allows, as a fraction of the runtime.
+        fleet_ids: Pin each workload to one of these fleets (default: the region).
+        seed: Random seed.
+    """
+    rng = np.random.default_rng(seed)
+    t0, t1 = to_epoch_seconds(start), to_epoch_seconds(end)
+    count = int(rng.poisson(per_day * max(t1 - t0, 0) / 86_400))
+    submitted = np.sort(rng.integers(t0, max(t1, t0 + 1), size=count))
+    lo, hi = np.log(runtime_hours[0] * 60), np.log(runtime_hours[1] * 60)
+    runtime_minutes = np.maximum(np.round(np.exp(rng.uniform(lo, hi, size=count))), 1).astype(np.int64)
+    tolerances = list(DelayTolerance)
+    tolerance = rng.integers(0, len(tolerances), size=count)
+    interruptible = rng.random(count) < interruptible_share
+    fleet = rng.integers(0, max(len(fleet_ids), 1), size=count)
+
+    workloads: list[BacktestWorkload] = []
+    for i in range(count):
+        at = datetime.fromtimestamp(int(submitted[i]), tz=timezone.utc)
+        runtime = int(runtime_minutes[i]) * 60
+        delay_tolerance = tolerances[int(tolerance[i])]
+        deadline = at + delay_tolerance.max_delay() + timedelta(seconds=runtime * (1.0 + deadline_slack))
+        workloads.append(
+            BacktestWorkload(
+                submitted_at=at,
+                config=WorkloadConfig(
+                    version=1,
+                    config_id=f"backtest-{i:06d}",
+                    created_at=at,
+                    updated_at=at,
+                    interruptible=bool(interruptible[i]),
+                    delay_tolerance=delay_tolerance,
+                    deadline_at=deadline,
+                    earliest_start_at=at,
+                    region=region,
+                    fleet_id=int(fleet_ids[int(fleet[i])]) if fleet_ids else None,
+                    runtime_estimate_seconds=runtime,
+                ),
+            )
+        )
+    return workloads
+
+
+def recorded_workloads(configs: Iterable[WorkloadConfig]) -> list[BacktestWorkload]:
+    """Replay stored workload configs, each submitted at its earliest start (or creation)."""
+    workloads = [
+        BacktestWorkload(submitted_at=config.earliest_start_at or config.created_at, config=config)
+        for config in configs
+        if config.runtime_estimate_seconds
+    ]
+    return sorted(workloads, key=lambda w: to_epoch_seconds(w.submitted_at))
+
+
+# --- Policies ---
+@dataclass(frozen=True, slots=True)
+class BacktestPolicy:
+    """Scheduler settings replayed as one scenario."""
+
+    name: str
+    # None picks `auto_risk_mode` per workload, as the wizard does.
+    risk_mode: RiskMode | None = None
+    weights: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    slot: timedelta = timedelta(seconds=DEFAULT_SCHEDULING_SLOT_SECONDS)
+    score_floor: float | None = DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR
+    # Start at the earliest time instead of shifting (the no-scheduling baseline).
+    immediate: bool = False
+
+    def configure(self, config: WorkloadConfig) -> WorkloadConfig:
+        """The config as this policy plans it."""
+        if self.immediate:
+            return replace(config, delay_tolerance=DelayTolerance.NOT_DELAY_TOLERANT)
+        return config
+
+    def scoring_key(self) -> tuple:
+        """Settings that change scored candidates (the rest only re-ranks them)."""
+        return (self.slot, self.score_floor, self.immediate)
+
+
+def policy_grid(
+    *,
+    risk_modes: Sequence[RiskMode | None] = (None,),
+    weights: Sequence[tuple[float, float, float]] = ((1.0, 1.0, 1.0),),
+    slots: Sequence[timedelta] = (timedelta(seconds=DEFAULT_SCHEDULING_SLOT_SECONDS),),
+    score_floors: Sequence[float | None] = (DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,),
+    baseline: bool = True,
+) -> list[BacktestPolicy]:
+    """Every combination of the given settings, plus an immediate-start baseline."""
+    policies = [BacktestPolicy(name="immediate", immediate=True)] if baseline else []
+    for mode, w, slot, floor in itertools.product(risk_modes, weights, slots, score_floors):
+        name = (
+            f"{mode.value if mode is not None else 'auto'}"
+            f" w={w[0]:g}/{w[1]:g}/{w[2]:g}"
+            f" slot={int(slot.total_seconds()) // 60}m"
+            f" floor={floor if floor is not None else '-'}"
+        )
+        policies.append(
+            BacktestPolicy(name=name, risk_mode=mode, weights=tuple(w), slot=slot, score_floor=floor)
+        )
+    return policies
+
+
+# --- Results ---
+@dataclass(frozen=True, slots=True)
+class BacktestOutcomes:
+    """Realised per-workload results of one policy, as parallel arrays."""
+
+    planned: np.ndarray  # bool
+    start_epoch: np.ndarray  # realised start (later than planned if not placed)
+    end_epoch: np.ndarray
+    carbon_g: np.ndarray  # NaN without carbon actuals
+    cost_usd: np.ndarray  # NaN for fleets without prices
+    interrupted: np.ndarray  # bool
+    placement_failed: np.ndarray  # bool
+    deadline_missed: np.ndarray  # bool; unplanned workloads count as missed
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyReport:
+    """Totals of one policy over the replayed stream."""
+
+    policy: BacktestPolicy
+    outcomes: BacktestOutcomes
+
+    @property
+    def workloads(self) -> int:
+        return int(self.outcomes.planned.shape[0])
+
+    @property
+    def planned(self) -> int:
+        return int(self.outcomes.planned.sum())
+
+    @property
+    def carbon_g(self) -> float:
+        return float(np.nansum(self.outcomes.carbon_g))
+
+    @property
+    def cost_usd(self) -> float:
+        return float(np.nansum(self.outcomes.cost_usd))
+
+    @property
+    def deadline_misses(self) -> int:
+        return int(self.outcomes.deadline_missed.sum())
+
+    @property
+    def interruptions(self) -> int:
+        return int(self.outcomes.interrupted.sum())
+
+    @property
+    def placement_failures(self) -> int:
+        return int(self.outcomes.placement_failed.sum())
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy.name,
+            "workloads": self.workloads,
+            "planned": self.planned,
+            "carbon_kg": self.carbon_g / 1000,
+            "cost_usd": self.cost_usd,
+            "deadline_misses": self.deadline_misses,
+            "interruptions": self.interruptions,
+            "placement_failures": self.placement_failures,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestReport:
+    """Results of every policy of a backtest, in the order given."""
+
+    start: datetime
+    end: datetime
+    policies: list[PolicyReport]
+    elapsed_seconds: float
+
+    def by_name(self) -> dict[str, PolicyReport]:
+        return {report.policy.name: report for report in self.policies}
+
+    def summary(self) -> list[dict[str, Any]]:
+        return [report.summary() for report in self.policies]
+
+
+# --- Replay ---
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    step: int
+    decision_interval: int
+    restart_delay: int
+    power_kw: float
+
+
+class _Replay:
+    """A history indexed by time, for point-in-time inputs and realised outcomes."""
+
+    def __init__(self, history: BacktestHistory, step: int) -> None:
+        self.history = history
+        self.step = step
+        pools = list(history.pools)
+        self.catalog: PoolCatalog | None = None
+        if pools:
+            self.catalog = PoolCatalog(loader=lambda: pools)
+            self.catalog.load(pools)
+
+        self.prices = sorted(history.spot_prices, key=lambda p: p.measured_at)
+        self.price_epochs = [to_epoch_seconds(p.measured_at) for p in self.prices]
+        self.rates = sorted(history.interruption_rates, key=lambda r: r.measured_at)
+        self.rate_epochs = [to_epoch_seconds(r.measured_at) for r in self.rates]
+        # The same observations as columns, so engines are built without objects.
+        self.price_columns = (
+            np.array([p.pool_id for p in self.prices], dtype=np.int64),
+            np.array(self.price_epochs, dtype=np.int64),
+            np.array([p.price for p in self.prices], dtype=np.float64),
+        )
+        self.rate_columns = (
+            np.array([r.pool_id for r in self.rates], dtype=np.int64),
+            np.array(self.rate_epochs, dtype=np.int64),
+            np.array([r.rate for r in self.rates], dtype=np.float64),
+        )
+        frame = history.placement
+        self.placement = frame.take(np.argsort(frame.epoch_seconds, kind="stable"))
+        self.vintages = sorted(history.carbon_vintages, key=lambda v: v.fetched_at)
+        self.vintage_epochs = [to_epoch_seconds(v.fetched_at) for v in self.vintages]
+
+        self.actual: CarbonForecast | None = None
+        if history.carbon_actual is not None:
+            self.actual = CarbonForecast(
+                series=history.carbon_actual,
+                start=history.start,
+                horizon=history.end - history.start,
+                fetched_at=history.start,
+                version=series_version(history.carbon_actual),
+            )
+
+        # What actually happened: every price, rate and actual on one grid.
+        t0 = (to_epoch_seconds(history.start) // step) * step
+        t1 = to_epoch_seconds(history.end)
+        self.truth = self._tables(
+            self.actual,
+            slice(0, len(self.prices)),
+            slice(0, len(self.rates)),
+            TimeGrid(start=t0, step=step, size=max(-(-(t1 - t0) // step), 1)),
+        )
+        self._placement_index()
+
+    def _tables(
+        self, carbon: CarbonForecast | None, prices: slice, rates: slice, grid: TimeGrid
+    ) -> ScoringTables:
+        """What `ScoringTables.build` makes of these observations, built from the columns."""
+        cost = survival = None
+        if prices.stop > prices.start:
+            cost = SpotCostEngine.from_arrays(*(column[prices] for column in self.price_columns), grid)
+        if rates.stop > rates.start:
+            survival = InterruptionSurvivalEngine.from_arrays(
+                *(column[rates] for column in self.rate_columns), grid
+            )
+        return ScoringTables(
+            grid=grid,
+            carbon=CarbonIntensityEngine.from_series(carbon.series if carbon is not None else None, grid),
+            cost=cost,
+            survival=survival,
+        )
+
+    def _inputs(
+        self,
+        *,
+        latest_scores: dict[int, list[PlacementScore]],
+        carbon: CarbonForecast | None,
+        prices: Sequence[SpotPrice],
+        rates: Sequence[InterruptionRate],
+        version: str,
+        availability: AvailabilityForecast | None = None,
+    ) -> PlanningInputs:
+        return PlanningInputs(
+            region=self.history.region,
+            fleets=self.history.fleets,
+            latest_scores=latest_scores,
+            carbon=carbon,
+            availability=availability,
+            catalog=self.catalog,
+            spot_prices=tuple(prices),
+            interruption_rates=tuple(rates),
+            carbon_version=carbon.version if carbon is not None else "",
+            availability_version=version,
+            loaded_at=0.0,
+        )
+
+    def inputs_at(self, now: int, until: int) -> tuple[PlanningInputs, ScoringTables]:
+        """What the live scheduler would have loaded at `now`, and its engines up to `until`."""
+        epochs = self.placement.epoch_seconds
+        lo = int(np.searchsorted(epochs, now - int(PLACEMENT_HISTORY.total_seconds()), side="left"))
+        hi = int(np.searchsorted(epochs, now, side="right"))
+        recent = self.placement.take(np.arange(lo, hi))
+        latest: dict[int, list[PlacementScore]] = {}
+        for score in recent.latest_per_key().to_scores():
+            latest.setdefault(score.request_group_id, []).append(score)
+        availability = None
+        if len(recent):
+            availability = AvailabilityForecaster().fit(recent).forecast(
+                start=datetime.fromtimestamp(now, tz=timezone.utc),
+                horizon=timedelta(seconds=max(until - now, self.step)),
+                step=timedelta(seconds=self.step),
+            )
+
+        prices = slice(
+            bisect.bisect_left(self.price_epochs, now - int(PRICE_HISTORY.total_seconds())),
+            bisect.bisect_right(self.price_epochs, now),
+        )
+        rates = slice(
+            bisect.bisect_left(self.rate_epochs, now - int(RATE_HISTORY.total_seconds())),
+            bisect.bisect_right(self.rate_epochs, now),
+        )
+        carbon = self.actual
+        if self.vintages:
+            issued = bisect.bisect_right(self.vintage_epochs, now) - 1
+            carbon = self.vintages[issued] if issued >= 0 else None
+
+        inputs = self._inputs(
+            latest_scores=latest,
+            carbon=carbon,
+            prices=self.prices[prices],
+            rates=self.rates[rates],
+            version=f"backtest@{now}",
+            availability=availability,
+        )
+        start = (now // self.step) * self.step
+        grid = TimeGrid(start=start, step=self.step, size=max(-(-(until - start) // self.step), 1))
+        return inputs, self._tables(carbon, prices, rates, grid)
+
+    # --- Realised placement ---
+    def _placement_index(self) -> None:
+        frame = self.placement
+        self._placement_keys: dict[tuple[int, str | None, int], int] = {}
+        if not len(frame):
+            self._placement_sorted = np.empty(0, dtype=np.int64)
+            self._placement_scores = np.empty(0)
+            return
+        by = ("group", "az", "capacity")
+        codes, unique_rows = frame.key_codes(by)
+        keys = frame.decode_keys(by, unique_rows)
+        columns = (keys["group_id"], keys["availability_zone"], keys["target_capacity"])
+        for code, key in enumerate(zip(*(column.tolist() for column in columns))):
+            self._placement_keys[key] = code
+        # One sorted (key, time) axis: a lookup is one searchsorted for all runs.
+        packed = (codes << 34) + frame.epoch_seconds
+        order = np.argsort(packed, kind="stable")
+        self._placement_sorted = packed[order]
+        self._placement_scores = frame.score[order]
+
+    def placement_at(self, options: Sequence[PlanOption], start: np.ndarray) -> np.ndarray:
+        """Latest recorded placement score at each start (neutral where unrecorded)."""
+        code = np.array(
+            [
+                self._placement_keys.get((o.fleet_id, o.availability_zone, o.target_capacity), -1)
+                for o in options
+            ],
+            dtype=np.int64,
+        )
+        scores = np.full(len(options), _NEUTRAL_PLACEMENT_SCORE)
+        known = code >= 0
+        if not known.any():
+            return scores
+        query = (code[known] << 34) + start[known]
+        row = np.searchsorted(self._placement_sorted, query, side="right") - 1
+        valid = (row >= 0) & ((self._placement_sorted[np.maximum(row, 0)] >> 34) == code[known])
+        scores[np.flatnonzero(known)[valid]] = self._placement_scores[row[valid]]
+        return scores
+
+    # --- Realised outcomes ---
+    def realise(
+        self,
+        chosen: Sequence[PlanOption | None],
+        workloads: Sequence[BacktestWorkload],
+        draws: np.ndarray,
+        settings: _Settings,
+    ) -> BacktestOutcomes:
+        """Evaluate chosen plans against the actual history, all at once."""
+        n = len(workloads)
+        planned = np.array([option is not None for option in chosen], dtype=bool)
+        index = np.flatnonzero(planned)
+        options = [option for option in chosen if option is not None]
+        m = len(options)
+
+        start = np.array([to_epoch_seconds(o.start_at) for o in options], dtype=np.int64)
+        capacity = np.array([o.target_capacity for o in options], dtype=np.float64)
+        configs = [workloads[i].config for i in index]
+        runtime = np.array([int(c.runtime_estimate_seconds or 0) for c in configs], dtype=np.int64)
+        resumable = np.array([bool(c.interruptible) for c in configs], dtype=bool)
+        deadline = np.array(
+            [to_epoch_seconds(c.deadline_at) if c.deadline_at is not None else np.inf for c in configs],
+            dtype=np.float64,
+        )
+        u = draws[index]
+
+        fleets = {f.id: f for f in self.history.fleets}
+        pairs: dict[tuple[int, str | None], int] = {}
+        pair = np.array(
+            [pairs.setdefault((o.fleet_id, o.availability_zone), len(pairs)) for o in options],
+            dtype=np.int64,
+        )
+        known_pairs = [(fleets[fid], az) for fid, az in pairs if fid in fleets]
+        truth = self.truth
+        cost_prefix, cost_known, hazard_prefix = (None, np.zeros(len(pairs), dtype=bool), None)
+        if len(known_pairs) == len(pairs):
+            cost_prefix, cost_known, hazard_prefix = truth.option_prefixes(known_pairs, self.catalog)
+
+        # Not placed: wait and start again (assumed to succeed).
+        placed_p = np.clip(self.placement_at(options, start) / SCORE_MAX, 0.0, 1.0)
+        placement_failed = u[:, 0] >= placed_p
+        begin = start + np.where(placement_failed, settings.restart_delay, 0)
+
+        hazard = np.zeros(m)
+        if hazard_prefix is not None:
+            hazard = capacity * window_integral(hazard_prefix, truth.grid, begin, runtime, rows=pair)
+        p_interrupt = -np.expm1(-hazard)
+        interrupted = u[:, 1] < p_interrupt
+        # When within the run: inverse CDF of the first interruption under a
+        # constant hazard, conditioned on it happening before the end.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.where(hazard > 0, -np.log1p(-u[:, 2] * p_interrupt) / hazard, 0.0)
+        done = np.where(interrupted, np.clip(fraction, 0.0, 1.0) * runtime, runtime).astype(np.int64)
+        resume = begin + done + settings.restart_delay
+        remaining = np.where(interrupted, runtime - np.where(resumable, done, 0), 0)
+        end = np.where(interrupted, resume + remaining, begin + runtime)
+
+        def _over_run(prefix: np.ndarray | None, rows: np.ndarray | None) -> np.ndarray:
+            """Integral of a prefix over the run (both parts of an interrupted one)."""
+            if prefix is None:
+                return np.full(m, np.nan)
+            first = window_integral(prefix, truth.grid, begin, done, rows=rows)
+            second = window_integral(prefix, truth.grid, resume, remaining, rows=rows)
+            return first + second
+
+        carbon = np.full(m, np.nan)
+        if truth.carbon.has_data:
+            carbon = (
+                _over_run(truth.carbon.cumulative, None)
+                * capacity
+                * settings.power_kw
+                / _SECONDS_PER_HOUR
+            )
+        cost = _over_run(cost_prefix, pair) * capacity
+        cost = np.where(cost_known[pair], cost, np.nan)
+
+        def _full(values: np.ndarray, fill: Any, dtype: Any) -> np.ndarray:
+            out = np.full(n, fill, dtype=dtype)
+            out[index] = values
+            return out
+
+        return BacktestOutcomes(
+            planned=planned,
+            start_epoch=_full(begin, 0, np.int64),
+            end_epoch=_full(end, 0, np.int64),
+            carbon_g=_full(carbon, np.nan, np.float64),
+            cost_usd=_full(cost, np.nan, np.float64),
+            interrupted=_full(interrupted, False, bool),
+            placement_failed=_full(placement_failed, False, bool),
+            deadline_missed=~planned | _full(end > deadline, False, bool),
+        )
+
+
+def _decision_ticks(
+    workloads: Sequence[BacktestWorkload], interval: int
+) -> list[tuple[int, list[int]]]:
+    """Workload indexes grouped by the first decision tick at or after submission."""
+    ticks: dict[int, list[int]] = {}
+    for i, workload in enumerate(workloads):
+        tick = -(-to_epoch_seconds(workload.submitted_at) // interval) * interval
+        ticks.setdefault(tick, []).append(i)
+    return sorted(ticks.items())
+
+
+def _replay_policies(
+    replay: _Replay,
+    workloads: Sequence[BacktestWorkload],
+    draws: np.ndarray,
+    policies: Sequence[BacktestPolicy],
+    settings: _Settings,
+) -> list[PolicyReport]:
+    """Plan every workload under every policy, then realise each policy's plans."""
+    schedulers = [
+        Scheduler(
+            slot=policy.slot,
+            score_floor=policy.score_floor,
+            weights=policy.weights,
+            instance_power_kw=settings.power_kw,
+        )
+        for policy in policies
+    ]
+    chosen: list[list[PlanOption | None]] = [[None] * len(workloads) for _ in policies]
+
+    for tick, indexes in _decision_ticks(workloads, settings.decision_interval):
+        now = datetime.fromtimestamp(tick, tz=timezone.utc)
+        until = tick + settings.step
+        for i in indexes:
+            config = workloads[i].config
+            window = start_window(config, now=now)
+            if window is not None:
+                until = max(until, window[1] + int(config.runtime_estimate_seconds or 0))
+        inputs, tables = replay.inputs_at(tick, until)
+
+        for i in indexes:
+            config = workloads[i].config
+            scored: dict[tuple, ScoredCandidates] = {}
+            fronts: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+            for p, policy in enumerate(policies):
+                planned = policy.configure(config)
+                if start_window(planned, now=now) is None:
+                    continue
+                scheduler = schedulers[p]
+                # Best-effort: a workload that cannot be planned counts as unplanned.
+                try:
+                    key = policy.scoring_key()
+                    if key not in scored:
+                        scored[key] = scheduler.score(planned, inputs, now=now, tables=tables)
+                    mode = policy.risk_mode or auto_risk_mode(config)
+                    # Policies that differ only in weights share the Pareto front too.
+                    if scored[key].model.space.size and (key, mode) not in fronts:
+                        fronts[key, mode] = scheduler.pareto_candidates(planned, scored[key], mode, now=now)
+                    schedule = scheduler.rank(
+                        planned, inputs, scored[key], mode, now=now, pareto=fronts.get((key, mode))
+                    )
+                except Exception:
+                    continue
+                chosen[p][i] = schedule.chosen
+
+    return [
+        PolicyReport(policy=policy, outcomes=replay.realise(chosen[p], workloads, draws, settings))
+        for p, policy in enumerate(policies)
+    ]
+
+
+# --- Worker side ---
+@dataclass(slots=True)
+class _WorkerState:
+    replay: _Replay
+    workloads: list[BacktestWorkload]
+    draws: np.ndarray
+    settings: _Settings
+
+
+_worker: _WorkerState | None = None
+
+
+def _init_worker(
+    history: BacktestHistory,
+    workloads: list[BacktestWorkload],
+    draws: np.ndarray,
+    settings: _Settings,
+) -> None:
+    global _worker
+    _worker = _WorkerState(
+        replay=_Replay(history, settings.step), workloads=workloads, draws=draws, settings=settings
+    )
+
+
+def _replay_in_worker(policies: list[BacktestPolicy]) -> list[PolicyReport]:
+    assert _worker is not None, "worker not initialised"
+    w = _worker
+    return _replay_policies(w.replay, w.workloads, w.draws, policies, w.settings)
+
+
+# --- Parent side ---
+class Backtester:
+    """Replays workload streams through scheduling policies over recorded history."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        step: timedelta = timedelta(seconds=DEFAULT_SCHEDULING_SLOT_SECONDS),
+        decision_interval: timedelta = timedelta(seconds=DEFAULT_BACKTEST_DECISION_INTERVAL_SECONDS),
+        restart_delay: timedelta = timedelta(seconds=DEFAULT_BACKTEST_RESTART_DELAY_SECONDS),
+        instance_power_kw: float = DEFAULT_INSTANCE_POWER_KW,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the backtester.
+
+        Args:
+            max_workers: Worker processes (defaults to the CPU count). With one
+                worker, policies are replayed in the calling thread.
+            step: Resolution of the input and outcome grids.
+            decision_interval: How often the simulated scheduler plans new workloads.
+            restart_delay: Wait after a failed placement or an interruption.
+            instance_power_kw: Assumed draw per instance.
+            seed: Seed of the shared placement and interruption draws.
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.settings = _Settings(
+            step=int(step.total_seconds()),
+            decision_interval=max(int(decision_interval.total_seconds()), 1),
+            restart_delay=int(restart_delay.total_seconds()),
+            power_kw=float(instance_power_kw),
+        )
+        self.seed = seed
+
+    def run(
+        self,
+        history: BacktestHistory,
+        workloads: Sequence[BacktestWorkload],
+        policies: Sequence[BacktestPolicy],
+    ) -> BacktestReport:
+        """Replay a workload stream under every policy.
+
+        Args:
+            history: Recorded inputs to replay.
+            workloads: Stream to replay. Workloads submitted outside the
+                history's period, or without a runtime and a region or fleet,
+                are skipped.
+            policies: Scenarios to compare.
+
+        Returns:
+            BacktestReport, with policies in the order given.
+        """
+        started = time.perf_counter()
+        t0, t1 = to_epoch_seconds(history.start), to_epoch_seconds(history.end)
+        stream = [
+            w
+            for w in workloads
+            if t0 <= to_epoch_seconds(w.submitted_at) < t1
+            and w.config.runtime_estimate_seconds
+            and (w.config.region is not None or w.config.fleet_id is not None)
+        ]
+        draws = np.random.default_rng(self.seed).random((len(stream), 3))
+        policies = list(policies)
+
+        groups = min(self.max_workers, len(policies))
+        if groups <= 1:
+            reports = _replay_policies(
+                _Replay(history, self.settings.step), stream, draws, policies, self.settings
+            )
+        else:
+            # Policies sharing scored candidates stay together (largest sets
+            # first, each to the smallest batch) unless that leaves workers idle.
+            by_key: dict[tuple, list[int]] = {}
+            for i, policy in enumerate(policies):
+                by_key.setdefault(policy.scoring_key(), []).append(i)
+            members = sorted(by_key.values(), key=len, reverse=True)
+            if len(members) < groups:
+                members = [[i] for i in range(len(policies))]
+            batches: list[list[int]] = [[] for _ in range(groups)]
+            for member in members:
+                min(batches, key=len).extend(member)
+            batches = [batch for batch in batches if batch]
+
+            slots: list[PolicyReport | None] = [None] * len(policies)
+            with ProcessPoolExecutor(
+                max_workers=len(batches),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(history, stream, draws, self.settings),
+            ) as executor:
+                futures = [
+                    executor.submit(_replay_in_worker, [policies[i] for i in batch]) for batch in batches
+                ]
+                for batch, future in zip(batches, futures):
+                    for i, report in zip(batch, future.result()):
+                        slots[i] = report
+            reports = [report for report in slots if report is not None]
+
+        return BacktestReport(
+            start=history.start,
+            end=history.end,
+            policies=reports,
+            elapsed_seconds=time.perf_counter() - started,
+        )
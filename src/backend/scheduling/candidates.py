@@ -0,0 +1,321 @@
+"""Candidate plan enumeration for a workload draft.
+
+A candidate is (start slot, fleet, AZ, target capacity). The candidate space is
+the product of
+
+- start slots: every `slot` seconds from the earliest start, up to the last start
+  that still meets the delay tolerance and finishes (start + runtime) by the
+  deadline. Infeasible slots are never generated;
+- options: (fleet, AZ, capacity) triples from the pinned fleet or every fleet of
+  the region. Options whose latest placement score is below a floor are dropped,
+  and fleets left without options are skipped.
+
+The space itself only stores the option columns and the slot arithmetic. Flat
+candidate indexes are slot-major (`flat = slot * n_options + option`), and
+`chunks()` materialises them lazily in fixed-size pieces. Memory stays bounded
+even for 24h tolerance at 5-minute resolution across hundreds of fleets. The
+flat index is stable, so scorers and selectors can refer to candidates across
+chunks and re-materialise winners with `take()`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Mapping, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.models import PlacementScore, RequestGroup
+from src.backend.scheduling.time_grid import to_epoch_seconds
+from src.config.defaults import (
+    DEFAULT_CANDIDATE_CHUNK_SIZE,
+    DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,
+    DEFAULT_SCHEDULING_SLOT_SECONDS,
+)
+from src.models.workload_config import WorkloadConfig
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateChunk:
+    """A slice of the candidate space as parallel arrays."""
+
+    space: CandidateSpace
+    flat_index: np.ndarray  # (n,) int64, stable across chunks
+    start_epoch: np.ndarray  # (n,) int64
+    option: np.ndarray  # (n,) row into the space's option columns
+
+    def __len__(self) -> int:
+        return int(self.flat_index.shape[0])
+
+    @property
+    def end_epoch(self) -> np.ndarray:
+        return self.start_epoch + self.space.runtime_seconds
+
+    @property
+    def fleet_id(self) -> np.ndarray:
+        return self.space.fleet_id[self.option]
+
+    @property
+    def availability_zone(self) -> np.ndarray:
+        return self.space.availability_zone[self.option]
+
+    @property
+    def target_capacity(self) -> np.ndarray:
+        return self.space.target_capacity[self.option]
+
+    @property
+    def placement_score(self) -> np.ndarray:
+        return self.space.placement_score[self.option]
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateSpace:
+    """Start slots × (fleet, AZ, capacity) options for one workload."""
+
+    first_start: int  # epoch seconds
+    step: int  # seconds between slots
+    n_slots: int
+    runtime_seconds: int
+
+    # Option columns, shape (n_options,). AZ is None when the fleet picks it.
+    fleet_id: np.ndarray
+    availability_zone: np.ndarray
+    target_capacity: np.ndarray
+    placement_score: np.ndarray  # latest score; NaN when unknown
+
+    fleets: tuple[RequestGroup, ...] = ()
+    # Fleets dropped because every option scored below the floor.
+    skipped_fleet_ids: tuple[int, ...] = ()
+
+    @property
+    def n_options(self) -> int:
+        return int(self.fleet_id.shape[0])
+
+    @property
+    def size(self) -> int:
+        return self.n_slots * self.n_options
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def last_start(self) -> int:
+        return self.first_start + self.step * max(self.n_slots - 1, 0)
+
+    def slot_starts(self) -> np.ndarray:
+        return self.first_start + self.step * np.arange(self.n_slots, dtype=np.int64)
+
+    def fleet(self, fleet_id: int) -> RequestGroup | None:
+        return next((f for f in self.fleets if f.id == fleet_id), None)
+
+    def take(self, flat_index: np.ndarray | Sequence[int]) -> CandidateChunk:
+        """Materialise arbitrary candidates by flat index."""
+        flat = np.asarray(flat_index, dtype=np.int64)
+        n_options = max(self.n_options, 1)
+        return CandidateChunk(
+            space=self,
+            flat_index=flat,
+            start_epoch=self.first_start + self.step * (flat // n_options),
+            option=flat % n_options,
+        )
+
+    def chunks(self, chunk_size: int = DEFAULT_CANDIDATE_CHUNK_SIZE) -> Iterator[CandidateChunk]:
+        """Yield the whole space in slot-major chunks of at most `chunk_size`."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        total = self.size
+        for lo in range(0, total, chunk_size):
+            yield self.take(np.arange(lo, min(lo + chunk_size, total), dtype=np.int64))
+
+
+def start_window(
+    config: WorkloadConfig,
+    *,
+    now: datetime | None = None,
+) -> tuple[int, int] | None:
+    """Feasible start range [earliest, latest] in epoch seconds.
+
+    The start may not be before `now` or `earliest_start_at`, nor later than the
+    delay tolerance allows, and the run must finish by `deadline_at`. Without a
+    delay tolerance the start is only bounded by the deadline (or fixed at the
+    earliest start when there is no deadline either).
+
+    Returns:
+        (earliest, latest), or None when no start satisfies the constraints.
+    """
+    runtime = config.runtime_estimate_seconds
+    if runtime is None or runtime <= 0:
+        raise ValueError("runtime_estimate_seconds is required to schedule a workload")
+
+    now_s = to_epoch_seconds(now or datetime.now(tz=timezone.utc))
+    earliest = now_s
+    if config.earliest_start_at is not None:
+        earliest = max(earliest, to_epoch_seconds(config.earliest_start_at))
+
+    latest: int | None = None
+    if config.delay_tolerance is not None:
+        latest = earliest + int(config.delay_tolerance.max_delay().total_seconds())
+    if config.deadline_at is not None:
+        by_deadline = to_epoch_seconds(config.deadline_at) - int(runtime)
+        latest = by_deadline if latest is None else min(latest, by_deadline)
+    if latest is None:
+        latest = earliest
+    return (earliest, latest) if latest >= earliest else None
+
+
+def _options_for_fleet(
+    fleet: RequestGroup,
+    scores: Sequence[PlacementScore],
+    *,
+    az: str | None,
+    target_capacity: int | None,
+) -> list[tuple[str | None, int, float]]:
+    """(AZ, capacity, latest score) options for one fleet."""
+    latest: dict[tuple[str, int], PlacementScore] = {}
+    for score in scores:
+        key = (score.availability_zone, score.target_capacity)
+        held = latest.get(key)
+        if held is None or score.measured_at >= held.measured_at:
+            latest[key] = score
+
+    if target_capacity is not None:
+        capacities = [int(target_capacity)]
+    elif fleet.target_capacities:
+        capacities = sorted({int(c) for c in fleet.target_capacities})
+    else:
+        capacities = sorted({key[1] for key in latest})
+
+    options: list[tuple[str | None, int, float]] = []
+    for capacity in capacities:
+        if az is not None:
+            hit = latest.get((az, capacity))
+            options.append((az, capacity, hit.score if hit is not None else np.nan))
+            continue
+        scored = sorted((k[0], s.score) for k, s in latest.items() if k[1] == capacity)
+        if scored:
+            options.extend((zone, capacity, value) for zone, value in scored)
+        else:
+            # No placement data for this capacity: let the fleet choose the AZ.
+            options.append((None, capacity, np.nan))
+    return options
+
+
+def build_candidate_space(
+    config: WorkloadConfig,
+    *,
+    fleets: Sequence[RequestGroup] | None = None,
+    latest_scores: Mapping[int, Sequence[PlacementScore]] | None = None,
+    now: datetime | None = None,
+    slot: timedelta = timedelta(seconds=DEFAULT_SCHEDULING_SLOT_SECONDS),
+    score_floor: float | None = DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,
+) -> CandidateSpace:
+    """Enumerate the feasible candidate space for a workload draft.
+
+    Args:
+        config: Workload draft. Uses region, availability_zone, fleet_id,
+            fleet_target_capacity, earliest_start_at, deadline_at,
+            delay_tolerance and runtime_estimate_seconds.
+        fleets: Fleet catalog (defaults to the cached catalog, fetched if empty).
+        latest_scores: Latest placement scores per fleet id (defaults to one bulk
+            fetch for the fleets considered).
+        now: Reference time (defaults to now).
+        slot: Spacing of candidate start times.
+        score_floor: Drop options whose latest placement score is below this
+            (None disables the filter). Options without a score are kept.
+
+    Returns:
+        CandidateSpace, possibly empty (check `size`).
+    """
+    step = int(slot.total_seconds())
+    if step <= 0:
+        raise ValueError("slot must be positive")
+
+    window = start_window(config, now=now)
+    if window is None:
+        first_start, n_slots = to_epoch_seconds(now or datetime.now(tz=timezone.utc)), 0
+    else:
+        earliest, latest = window
+        # Align slots to the grid, unless that would leave no slot at all.
+        first_start = -(-earliest // step) * step
+        if first_start > latest:
+            first_start = earliest
+        n_slots = (latest - first_start) // step + 1
+
+    if fleets is None:
+        # Local import: keeps this module usable offline (e.g. backtesting).
+        from src.backend.data.availability_data import get_available_fleets, get_cached_fleets
+
+        fleets = get_cached_fleets() or get_available_fleets()
+
+    if config.fleet_id is not None:
+        chosen = [f for f in fleets if f.id == config.fleet_id]
+        if not chosen:
+            raise ValueError(f"Fleet {config.fleet_id} is not in the fleet catalog")
+    else:
+        if config.region is None:
+            raise ValueError("A region or fleet is required to schedule a workload")
+        chosen = [f for f in fleets if f.region == config.region]
+
+    if latest_scores is None and chosen and n_slots:
+        latest_scores = _fetch_latest_scores(
+            [f.id for f in chosen],
+            az=config.availability_zone,
+            target_capacity=config.fleet_target_capacity,
+        )
+    latest_scores = latest_scores or {}
+
+    fleet_ids: list[int] = []
+    zones: list[str | None] = []
+    capacities: list[int] = []
+    scores: list[float] = []
+    kept: list[RequestGroup] = []
+    skipped: list[int] = []
+    for fleet in chosen:
+        options = _options_for_fleet(
+            fleet,
+            latest_scores.get(fleet.id, ()),
+            az=config.availability_zone,
+            target_capacity=config.fleet_target_capacity,
+        )
+        if score_floor is not None:
+            options = [o for o in options if math.isnan(o[2]) or o[2] >= score_floor]
+        if not options:
+            skipped.append(fleet.id)
+            continue
+        kept.append(fleet)
+        for zone, capacity, score in options:
+            fleet_ids.append(fleet.id)
+            zones.append(zone)
+            capacities.append(capacity)
+            scores.append(score)
+
+    return CandidateSpace(
+        first_start=int(first_start),
+        step=step,
+        n_slots=int(n_slots),
+        runtime_seconds=int(config.runtime_estimate_seconds or 0),
+        fleet_id=np.asarray(fleet_ids, dtype=np.int64),
+        availability_zone=np.asarray(zones, dtype=object),
+        target_capacity=np.asarray(capacities, dtype=np.int64),
+        placement_score=np.asarray(scores, dtype=np.float64),
+        fleets=tuple(kept),
+        skipped_fleet_ids=tuple(skipped),
+    )
+
+
+def _fetch_latest_scores(
+    fleet_ids: Sequence[int],
+    *,
+    az: str | None,
+    target_capacity: int | None,
+) -> dict[int, list[PlacementScore]]:
+    # Best-effort: without scores every option is kept (unscored), which is
+    # better than failing to plan while the Spot Fleet API is unavailable.
+    try:
+        from src.backend.data.availability_data import get_fleet_placement_scores_bulk
+
+        return get_fleet_placement_scores_bulk(fleet_ids, az=az, target_capacity=target_capacity)
+    except Exception:
+        return {}
@@ -0,0 +1,70 @@
+"""Carbon emissions for runtime windows.
+
+The carbon intensity forecast becomes a step function on the scheduling
+`TimeGrid`; its prefix integral turns "mean gCO₂/kWh over [start, start + R)"
+into two lookups for any number of candidates, like the cost and interruption
+engines.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.backend.scheduling.time_grid import (
+    TimeGrid,
+    prefix_integral,
+    step_function_on_grid,
+    window_integral,
+)
+from src.models.carbon_intensity import CarbonIntensitySeries
+
+_SECONDS_PER_HOUR = 3600.0
+
+
+class CarbonIntensityEngine:
+    """Carbon intensity curve with a prefix integral."""
+
+    def __init__(self, grid: TimeGrid, intensity: np.ndarray) -> None:
+        """Initialize from per-slot intensity.
+
+        Args:
+            grid: Grid the intensity is sampled on.
+            intensity: gCO₂/kWh per slot, shape (grid.size,). All-NaN means no data.
+        """
+        if intensity.shape != (grid.size,):
+            raise ValueError("intensity must have shape (grid.size,)")
+        self.grid = grid
+        self.intensity = intensity
+        self.has_data = bool(np.isfinite(intensity).any())
+        # gCO₂/kWh · seconds accumulated since grid start.
+        self.cumulative = prefix_integral(np.nan_to_num(intensity, nan=0.0), grid)
+
+    @classmethod
+    def from_series(cls, series: CarbonIntensitySeries | None, grid: TimeGrid) -> CarbonIntensityEngine:
+        """Sample a forecast (or actual) series onto `grid`, holding the last value."""
+        if series is None or not series.points:
+            return cls(grid, np.full(grid.size, np.nan))
+        times = np.array([int(p.timestamp.timestamp()) for p in series.points], dtype=np.int64)
+        values = np.array([p.value_g_per_kwh for p in series.points], dtype=np.float64)
+        return cls(grid, step_function_on_grid(times, values, grid))
+
+    def mean_intensity(self, start_epoch: np.ndarray, duration_seconds: np.ndarray | int) -> np.ndarray:
+        """Mean gCO₂/kWh over each [start, start + duration) window (NaN without data)."""
+        starts = np.asarray(start_epoch, dtype=np.int64)
+        if not self.has_data:
+            return np.full(starts.shape, np.nan)
+        duration = np.asarray(duration_seconds, dtype=np.float64)
+        return window_integral(self.cumulative, self.grid, starts, duration_seconds) / duration
+
+    def emissions(
+        self,
+        start_epoch: np.ndarray,
+        duration_seconds: np.ndarray | int,
+        capacity: np.ndarray,
+        power_kw: float,
+    ) -> np.ndarray:
+        """Grams of CO₂ for `capacity` instances drawing `power_kw` each."""
+        energy_kwh = np.asarray(capacity, dtype=np.float64) * power_kw * (
+            np.asarray(duration_seconds, dtype=np.float64) / _SECONDS_PER_HOUR
+        )
+        return self.mean_intensity(start_epoch, duration_seconds) * energy_kwh
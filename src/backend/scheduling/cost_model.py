@@ -0,0 +1,226 @@
+"""Expected spot cost for runtime windows.
+
+Turns `SpotPrice` history into "expected dollars for this runtime on this fleet
+at this target capacity" for every candidate start slot.
+
+- Each pool's price series becomes a step function on a shared `TimeGrid`;
+  after the last observation it is extended with a forecast (caller-supplied,
+  an hour-of-day profile of the pool's own history, or the last price).
+- Prefix integrals of $/second turn any [start, start + R) window into two
+  lookups.
+- A fleet is a weighted mix of pools, derived from its `instance_types` and the
+  `PoolCatalog`. Integration is linear, so fleet prefixes are `W @ pool_prefix`
+  and the (fleet × capacity × start) cost cube is a single broadcast.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Literal, Mapping, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.models import RequestGroup, SpotPrice
+from src.backend.data.fleet.pool_catalog import PoolCatalog
+from src.backend.scheduling.time_grid import (
+    TimeGrid,
+    prefix_integral,
+    series_by_key,
+    step_function_on_grid,
+    to_epoch_seconds,
+    window_integral,
+)
+
+PriceExtension = Literal["hold", "daily_profile"]
+
+_SECONDS_PER_HOUR = 3600.0
+
+
+def _daily_profile_extension(times: np.ndarray, values: np.ndarray, grid: TimeGrid) -> np.ndarray:
+    """Per-slot price from the pool's mean price at each hour of day."""
+    hours = (times // 3600) % 24
+    count = np.bincount(hours, minlength=24)
+    total = np.bincount(hours, weights=values, minlength=24)
+    overall = float(values.mean())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        profile = np.where(count > 0, total / np.maximum(count, 1), overall)
+    return profile[(grid.slot_starts() // 3600) % 24]
+
+
+class SpotCostEngine:
+    """Per-pool spot price curves with prefix integrals."""
+
+    def __init__(self, grid: TimeGrid, pool_ids: Sequence[int], price_per_hour: np.ndarray) -> None:
+        """Initialize from a precomputed price matrix.
+
+        Args:
+            grid: Grid the prices are sampled on.
+            pool_ids: Pool id for each price row.
+            price_per_hour: $/instance-hour, shape (len(pool_ids), grid.size). NaN
+                marks pools without any price data.
+        """
+        if price_per_hour.shape != (len(pool_ids), grid.size):
+            raise ValueError("price_per_hour must have shape (len(pool_ids), grid.size)")
+        self.grid = grid
+        self.pool_ids = np.asarray(pool_ids, dtype=np.int64)
+        self._row_by_pool = {int(pid): i for i, pid in enumerate(self.pool_ids)}
+        self.price_per_hour = price_per_hour
+        self.has_price = ~np.isnan(price_per_hour).any(axis=1)
+        # Dollars accumulated per instance since grid start.
+        self.cumulative_cost = prefix_integral(
+            np.nan_to_num(price_per_hour, nan=0.0) / _SECONDS_PER_HOUR, grid
+        )
+
+    @classmethod
+    def from_history(
+        cls,
+        prices: Iterable[SpotPrice],
+        grid: TimeGrid,
+        *,
+        pool_ids: Sequence[int] | None = None,
+        extension: PriceExtension = "daily_profile",
+        forecasts: Mapping[int, np.ndarray] | None = None,
+    ) -> SpotCostEngine:
+        """Build price curves from raw `SpotPrice` observations.
+
+        Args:
+            prices: Spot price history for any number of pools.
+            grid: Grid to evaluate on (typically the scheduling horizon).
+            pool_ids: Pools to include (defaults to every pool seen).
+            extension: How to extend a pool's prices past its last observation
+                when no explicit forecast is given.
+            forecasts: Optional per-pool price forecasts on `grid` ($/hour), used
+                after each pool's last observation.
+
+        Returns:
+            SpotCostEngine
+        """
+        rows = list(prices)
+        return cls.from_arrays(
+            np.array([p.pool_id for p in rows], dtype=np.int64),
+            np.array([to_epoch_seconds(p.measured_at) for p in rows], dtype=np.int64),
+            np.array([p.price for p in rows], dtype=np.float64),
+            grid,
+            pool_ids=pool_ids,
+            extension=extension,
+            forecasts=forecasts,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        pool_id: np.ndarray,
+        measured_at: np.ndarray,
+        price: np.ndarray,
+        grid: TimeGrid,
+        *,
+        pool_ids: Sequence[int] | None = None,
+        extension: PriceExtension = "daily_profile",
+        forecasts: Mapping[int, np.ndarray] | None = None,
+    ) -> SpotCostEngine:
+        """Build price curves from observation columns (see `from_history`).
+
+        Args:
+            pool_id: Pool of each observation.
+            measured_at: Observation epoch seconds.
+            price: Observed $/instance-hour.
+            grid: Grid to evaluate on.
+            pool_ids: Pools to include (defaults to every pool seen).
+            extension: How to extend prices past a pool's last observation.
+            forecasts: Optional per-pool price forecasts on `grid` ($/hour).
+
+        Returns:
+            SpotCostEngine
+        """
+        series = series_by_key(pool_id, measured_at, price)
+        ids = list(pool_ids) if pool_ids is not None else sorted(series)
+        matrix = np.full((len(ids), grid.size), np.nan)
+        for row, pid in enumerate(ids):
+            if pid not in series:
+                if forecasts is not None and pid in forecasts:
+                    matrix[row] = forecasts[pid]
+                continue
+            times, values = series[pid]
+            if forecasts is not None and pid in forecasts:
+                extend = np.asarray(forecasts[pid], dtype=np.float64)
+            elif extension == "daily_profile":
+                extend = _daily_profile_extension(times, values, grid)
+            else:
+                extend = None
+            matrix[row] = step_function_on_grid(times, values, grid, extend=extend)
+        return cls(grid, ids, matrix)
+
+    # --- Fleet mixes ---
+    def fleet_mix(
+        self,
+        fleets: Sequence[RequestGroup],
+        catalog: PoolCatalog,
+        *,
+        az: str | None = None,
+    ) -> np.ndarray:
+        """Per-instance pool weights for each fleet, shape (F, P).
+
+        A fleet's capacity is split evenly across its `instance_types` that have
+        priced pools in its region (optionally restricted to `az`), and evenly
+        across AZ pools within a type. Fleets with no priced pools get a zero row.
+        """
+        weights = np.zeros((len(fleets), len(self.pool_ids)))
+        for f, fleet in enumerate(fleets):
+            if not fleet.region or not fleet.instance_types:
+                continue
+            per_type: list[list[int]] = []
+            by_type = catalog.find_for_instance_types(fleet.region, fleet.instance_types, az=az)
+            for pools in by_type.values():
+                rows = [
+                    self._row_by_pool[pool.id]
+                    for pool in pools
+                    if pool.id in self._row_by_pool and self.has_price[self._row_by_pool[pool.id]]
+                ]
+                if rows:
+                    per_type.append(rows)
+            for rows in per_type:
+                weights[f, rows] += 1.0 / (len(per_type) * len(rows))
+        return weights
+
+    def fleet_cumulative_cost(self, mix: np.ndarray) -> np.ndarray:
+        """Prefix integral of $/instance for each fleet mix, shape (F, grid.size + 1)."""
+        return mix @ self.cumulative_cost
+
+    # --- Costs ---
+    def expected_cost(
+        self,
+        mix: np.ndarray,
+        capacities: Sequence[int] | np.ndarray,
+        start_epoch: np.ndarray,
+        duration_seconds: int,
+    ) -> np.ndarray:
+        """Expected dollars for every (fleet, capacity, start) combination.
+
+        Args:
+            mix: Output of `fleet_mix`, shape (F, P).
+            capacities: Target capacities (instances), shape (C,).
+            start_epoch: Candidate start times (epoch seconds), shape (S,).
+            duration_seconds: Runtime R.
+
+        Returns:
+            Array of shape (F, C, S); NaN for fleets without priced pools.
+        """
+        fleet_prefix = self.fleet_cumulative_cost(mix)
+        starts = np.asarray(start_epoch, dtype=np.int64)
+        per_instance = window_integral(fleet_prefix, self.grid, starts, duration_seconds)  # (F, S)
+        per_instance[mix.sum(axis=1) == 0] = np.nan
+        caps = np.asarray(capacities, dtype=np.float64)
+        return per_instance[:, None, :] * caps[None, :, None]
+
+    def cost_at(
+        self,
+        fleet_prefix: np.ndarray,
+        fleet_rows: np.ndarray,
+        capacity: np.ndarray,
+        start_epoch: np.ndarray,
+        duration_seconds: np.ndarray | int,
+    ) -> np.ndarray:
+        """Elementwise cost for parallel candidate arrays (fleet row, capacity, start)."""
+        per_instance = window_integral(
+            fleet_prefix, self.grid, start_epoch, duration_seconds, rows=fleet_rows
+        )
+        return per_instance * np.asarray(capacity, dtype=np.float64)
@@ -0,0 +1,219 @@
+"""Interruption survival probabilities for spot runtime windows.
+
+Turns `InterruptionRate` history into P(no interruption over [t, t + R)) per pool.
+
+Each pool's rate series becomes a piecewise-constant hazard on a shared
+`TimeGrid`; the cumulative hazard Λ is precomputed once, so
+
+    S(pool, t, R) = exp(-(Λ(t + R) - Λ(t)))
+
+is an O(1) lookup, and every (pool, start slot) pair is one broadcast.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.models import InterruptionRate
+from src.backend.scheduling.time_grid import (
+    TimeGrid,
+    prefix_integral,
+    series_by_key,
+    step_function_on_grid,
+    to_epoch_seconds,
+    window_integral,
+)
+
+# Cap per-period probabilities just below 1 so the hazard stays finite.
+_MAX_PERIOD_PROBABILITY = 0.999
+
+
+class InterruptionSurvivalEngine:
+    """Per-pool survival curves built from interruption-rate history."""
+
+    def __init__(
+        self,
+        grid: TimeGrid,
+        pool_ids: Sequence[int],
+        hazard: np.ndarray,
+    ) -> None:
+        """Initialize from a precomputed hazard matrix.
+
+        Args:
+            grid: Grid the hazard is sampled on.
+            pool_ids: Pool id for each hazard row.
+            hazard: Per-second hazard, shape (len(pool_ids), grid.size).
+        """
+        if hazard.shape != (len(pool_ids), grid.size):
+            raise ValueError("hazard must have shape (len(pool_ids), grid.size)")
+        self.grid = grid
+        self.pool_ids = np.asarray(pool_ids, dtype=np.int64)
+        self._row_by_pool = {int(pid): i for i, pid in enumerate(self.pool_ids)}
+        self.hazard = hazard
+        self.cumulative_hazard = prefix_integral(hazard, grid)
+
+    @classmethod
+    def from_history(
+        cls,
+        rates: Iterable[InterruptionRate],
+        grid: TimeGrid,
+        *,
+        rate_period: timedelta = timedelta(days=30),
+        percent: bool = False,
+        pool_ids: Sequence[int] | None = None,
+        default_rate: float = 0.0,
+    ) -> InterruptionSurvivalEngine:
+        """Build hazard curves from raw `InterruptionRate` observations.
+
+        Args:
+            rates: Interruption-rate history for any number of pools.
+            grid: Grid to evaluate on (typically the scheduling horizon).
+            rate_period: Period a `rate` value refers to. Spot Advisor style
+                "frequency of interruption" is a per-month probability.
+            percent: Set if `rate` is expressed in percent rather than 0–1.
+            pool_ids: Pools to include (defaults to every pool seen). Pools without
+                history get `default_rate`.
+            default_rate: Rate assumed for pools with no observations.
+
+        Returns:
+            InterruptionSurvivalEngine
+        """
+        rows = list(rates)
+        return cls.from_arrays(
+            np.array([r.pool_id for r in rows], dtype=np.int64),
+            np.array([to_epoch_seconds(r.measured_at) for r in rows], dtype=np.int64),
+            np.array([r.rate for r in rows], dtype=np.float64),
+            grid,
+            rate_period=rate_period,
+            percent=percent,
+            pool_ids=pool_ids,
+            default_rate=default_rate,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        pool_id: np.ndarray,
+        measured_at: np.ndarray,
+        rate: np.ndarray,
+        grid: TimeGrid,
+        *,
+        rate_period: timedelta = timedelta(days=30),
+        percent: bool = False,
+        pool_ids: Sequence[int] | None = None,
+        default_rate: float = 0.0,
+    ) -> InterruptionSurvivalEngine:
+        """Build hazard curves from observation columns (see `from_history`).
+
+        Args:
+            pool_id: Pool of each observation.
+            measured_at: Observation epoch seconds.
+            rate: Observed interruption rates.
+            grid: Grid to evaluate on.
+            rate_period: Period a `rate` value refers to.
+            percent: Set if `rate` is expressed in percent rather than 0–1.
+            pool_ids: Pools to include (defaults to every pool seen).
+            default_rate: Rate assumed for pools with no observations.
+
+        Returns:
+            InterruptionSurvivalEngine
+        """
+        series = series_by_key(pool_id, measured_at, rate)
+        ids = list(pool_ids) if pool_ids is not None else sorted(series)
+        period_rates = np.full((len(ids), grid.size), float(default_rate))
+        for row, pid in enumerate(ids):
+            if pid in series:
+                times, values = series[pid]
+                period_rates[row] = step_function_on_grid(times, values, grid)
+
+        hazard = cls.hazard_from_period_probability(
+            period_rates / 100.0 if percent else period_rates, rate_period
+        )
+        return cls(grid, ids, hazard)
+
+    @staticmethod
+    def hazard_from_period_probability(probability: np.ndarray, period: timedelta) -> np.ndarray:
+        """Convert P(interrupted within `period`) into a constant per-second hazard."""
+        p = np.clip(np.nan_to_num(probability, nan=0.0), 0.0, _MAX_PERIOD_PROBABILITY)
+        return -np.log1p(-p) / period.total_seconds()
+
+    # --- Lookups ---
+    def row_of(self, pool_id: int) -> int:
+        try:
+            return self._row_by_pool[int(pool_id)]
+        except KeyError:
+            raise KeyError(f"No interruption history for pool {pool_id}") from None
+
+    def rows_of(self, pool_ids: Iterable[int]) -> np.ndarray:
+        return np.asarray([self.row_of(pid) for pid in pool_ids], dtype=np.int64)
+
+    def survival(self, pool_id: int, start: datetime, duration: timedelta) -> float:
+        """P(no interruption) for one pool over [start, start + duration)."""
+        row = np.asarray([self.row_of(pool_id)])
+        h = window_integral(
+            self.cumulative_hazard,
+            self.grid,
+            np.asarray([to_epoch_seconds(start)]),
+            int(duration.total_seconds()),
+            rows=row,
+        )
+        return float(np.exp(-h[0]))
+
+    def survival_at(
+        self,
+        rows: np.ndarray,
+        start_epoch: np.ndarray,
+        duration_seconds: np.ndarray | int,
+    ) -> np.ndarray:
+        """Elementwise survival for parallel arrays of (hazard row, start, duration)."""
+        h = window_integral(self.cumulative_hazard, self.grid, start_epoch, duration_seconds, rows=rows)
+        return np.exp(-h)
+
+    def survival_matrix(
+        self,
+        start_epoch: np.ndarray,
+        duration_seconds: int,
+        *,
+        rows: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Survival for every (pool, start) pair.
+
+        Args:
+            start_epoch: Candidate start times (epoch seconds), shape (S,).
+            duration_seconds: Runtime R.
+            rows: Optional subset of hazard rows (defaults to all pools).
+
+        Returns:
+            Array of shape (P, S).
+        """
+        rows = np.arange(len(self.pool_ids)) if rows is None else np.asarray(rows)
+        starts = np.asarray(start_epoch, dtype=np.int64)
+        return self.survival_at(rows[:, None], starts[None, :], duration_seconds)
+
+    def combined_survival(
+        self,
+        rows: np.ndarray,
+        weights: np.ndarray,
+        start_epoch: np.ndarray,
+        duration_seconds: int,
+    ) -> np.ndarray:
+        """Survival of a group of instances spread across pools.
+
+        With independent pools, S_group = exp(-Σ w_p · H_p), where `w_p` is the
+        number of instances placed in pool `p`.
+
+        Returns:
+            Array of shape (S,).
+        """
+        starts = np.asarray(start_epoch, dtype=np.int64)
+        h = window_integral(
+            self.cumulative_hazard,
+            self.grid,
+            starts[None, :],
+            duration_seconds,
+            rows=np.asarray(rows)[:, None],
+        )
+        return np.exp(-(np.asarray(weights, dtype=np.float64)[:, None] * h).sum(axis=0))
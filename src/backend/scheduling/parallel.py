@@ -0,0 +1,394 @@
+"""Parallel planning across a process pool.
+
+Scoring is NumPy plus Python glue, so planning many workloads in the TUI
+process keeps one core busy and stalls the event loop. `ParallelPlanner` plans
+them across worker processes:
+
+- Inputs are loaded once per region in the parent (`Scheduler.shared_inputs_for`)
+  and turned into `ScoringTables` on a grid covering every workload's window.
+- The large arrays (carbon intensity, per-pool prices and hazards, the
+  placement-score forecast) are copied once into one shared-memory block per
+  region. Workers map them as read-only NumPy views. The small remainder (fleets,
+  latest scores, the region's pools, versions) is pickled once per worker
+  through the pool initializer, never per task.
+- Each task carries only a workload config. Results are yielded as they
+  complete, so callers can show progress.
+
+Workers are started with "spawn": forking a process that runs the TUI's threads
+is unsafe.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+from src.backend.data.fleet.models import InstancePool
+from src.backend.data.fleet.pool_catalog import PoolCatalog
+from src.backend.data.forecasts.availability_forecast import AvailabilityForecast
+from src.backend.scheduling.candidates import start_window
+from src.backend.scheduling.carbon_model import CarbonIntensityEngine
+from src.backend.scheduling.cost_model import SpotCostEngine
+from src.backend.scheduling.interruption_risk import InterruptionSurvivalEngine
+from src.backend.scheduling.risk_modes import RiskMode, auto_risk_mode
+from src.backend.scheduling.scheduler import (
+    PlanningInputs,
+    Scheduler,
+    ScoringTables,
+    get_scheduler,
+)
+from src.backend.scheduling.time_grid import TimeGrid
+from src.models.schedule import Schedule
+from src.models.workload_config import WorkloadConfig
+
+# Offsets of arrays inside a shared block are aligned to cache lines.
+_ALIGN = 64
+
+
+@dataclass(frozen=True, slots=True)
+class PlanProgress:
+    """One finished workload of a parallel run."""
+
+    workload_id: str
+    schedule: Schedule | None
+    error: str | None
+    completed: int
+    total: int
+
+    @property
+    def fraction(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+
+# --- Shared memory ---
+@dataclass(frozen=True, slots=True)
+class _ArraySpec:
+    offset: int
+    dtype: str
+    shape: tuple[int, ...]
+
+
+def _pack(arrays: Mapping[str, np.ndarray]) -> tuple[SharedMemory, dict[str, _ArraySpec]]:
+    """Copy numeric arrays into one new shared-memory block."""
+    specs: dict[str, _ArraySpec] = {}
+    offset = 0
+    for key, array in arrays.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        specs[key] = _ArraySpec(offset=offset, dtype=array.dtype.str, shape=tuple(array.shape))
+        offset += array.nbytes
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    for key, array in arrays.items():
+        spec = specs[key]
+        np.ndarray(spec.shape, dtype=array.dtype, buffer=shm.buf, offset=spec.offset)[...] = array
+    return shm, specs
+
+
+def _view(shm: SharedMemory, spec: _ArraySpec) -> np.ndarray:
+    array = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=shm.buf, offset=spec.offset)
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, slots=True)
+class _RegionPayload:
+    """Everything a worker needs for one region, minus the shared arrays."""
+
+    shm_name: str
+    specs: dict[str, _ArraySpec]
+    grid: TimeGrid
+    # Inputs without the raw price/rate history (the tables replace it) and
+    # without the catalog and forecast (rebuilt from `pools` and the arrays).
+    inputs: PlanningInputs
+    pools: tuple[InstancePool, ...]
+    has_catalog: bool
+    # Placement-score forecast fields that are not numeric arrays.
+    availability_zones: tuple[Any, ...] | None
+    availability_generated_at: datetime | None
+    availability_version: str
+
+
+def _region_payload(
+    inputs: PlanningInputs, tables: ScoringTables
+) -> tuple[SharedMemory, _RegionPayload]:
+    arrays: dict[str, np.ndarray] = {"carbon": tables.carbon.intensity}
+    if tables.cost is not None:
+        arrays["cost_pools"] = tables.cost.pool_ids
+        arrays["cost_price"] = tables.cost.price_per_hour
+    if tables.survival is not None:
+        arrays["hazard_pools"] = tables.survival.pool_ids
+        arrays["hazard"] = tables.survival.hazard
+    forecast = inputs.availability
+    if forecast is not None:
+        arrays.update(
+            {
+                "fc_times": forecast.times,
+                "fc_group_id": forecast.group_id,
+                "fc_target_capacity": forecast.target_capacity,
+                "fc_mean": forecast.mean,
+                "fc_lower": forecast.lower,
+                "fc_upper": forecast.upper,
+            }
+        )
+    shm, specs = _pack(arrays)
+
+    pools: tuple[InstancePool, ...] = ()
+    if inputs.catalog is not None and inputs.region is not None:
+        pools = tuple(inputs.catalog.find(region=inputs.region))
+    payload = _RegionPayload(
+        shm_name=shm.name,
+        specs=specs,
+        grid=tables.grid,
+        inputs=replace(
+            inputs, catalog=None, availability=None, spot_prices=(), interruption_rates=()
+        ),
+        pools=pools,
+        has_catalog=inputs.catalog is not None,
+        availability_zones=tuple(forecast.availability_zone.tolist()) if forecast is not None else None,
+        availability_generated_at=forecast.generated_at if forecast is not None else None,
+        availability_version=forecast.version if forecast is not None else "",
+    )
+    return shm, payload
+
+
+# --- Worker side ---
+@dataclass(slots=True)
+class _WorkerState:
+    scheduler: Scheduler
+    regions: dict[int, tuple[PlanningInputs, ScoringTables]]
+    # Keeps the mappings open for as long as the views are in use.
+    blocks: list[SharedMemory]
+
+
+_worker: _WorkerState | None = None
+
+
+def _attach_region(payload: _RegionPayload) -> tuple[SharedMemory, PlanningInputs, ScoringTables]:
+    shm = SharedMemory(name=payload.shm_name)
+    arrays = {key: _view(shm, spec) for key, spec in payload.specs.items()}
+    grid = payload.grid
+
+    catalog: PoolCatalog | None = None
+    if payload.has_catalog:
+        pools = list(payload.pools)
+        catalog = PoolCatalog(loader=lambda: pools)
+        catalog.load(pools)
+
+    availability: AvailabilityForecast | None = None
+    if payload.availability_zones is not None:
+        assert payload.availability_generated_at is not None
+        availability = AvailabilityForecast(
+            times=arrays["fc_times"],
+            group_id=arrays["fc_group_id"],
+            availability_zone=np.array(payload.availability_zones, dtype=object),
+            target_capacity=arrays["fc_target_capacity"],
+            mean=arrays["fc_mean"],
+            lower=arrays["fc_lower"],
+            upper=arrays["fc_upper"],
+            generated_at=payload.availability_generated_at,
+            version=payload.availability_version,
+        )
+
+    tables = ScoringTables(
+        grid=grid,
+        carbon=CarbonIntensityEngine(grid, arrays["carbon"]),
+        cost=(
+            SpotCostEngine(grid, arrays["cost_pools"].tolist(), arrays["cost_price"])
+            if "cost_price" in arrays
+            else None
+        ),
+        survival=(
+            InterruptionSurvivalEngine(grid, arrays["hazard_pools"].tolist(), arrays["hazard"])
+            if "hazard" in arrays
+            else None
+        ),
+    )
+    inputs = replace(payload.inputs, catalog=catalog, availability=availability)
+    return shm, inputs, tables
+
+
+def _init_worker(settings: dict[str, Any], payloads: dict[int, _RegionPayload]) -> None:
+    global _worker
+    regions: dict[int, tuple[PlanningInputs, ScoringTables]] = {}
+    blocks: list[SharedMemory] = []
+    for key, payload in payloads.items():
+        shm, inputs, tables = _attach_region(payload)
+        regions[key] = (inputs, tables)
+        blocks.append(shm)
+    _worker = _WorkerState(scheduler=Scheduler(**settings), regions=regions, blocks=blocks)
+
+
+def _plan_in_worker(
+    region_key: int, config: WorkloadConfig, risk_mode: RiskMode, now: datetime
+) -> Schedule:
+    assert _worker is not None, "worker not initialised"
+    inputs, tables = _worker.regions[region_key]
+    return _plan_with(_worker.scheduler, config, inputs, tables, risk_mode, now)
+
+
+def _plan_with(
+    scheduler: Scheduler,
+    config: WorkloadConfig,
+    inputs: PlanningInputs,
+    tables: ScoringTables,
+    risk_mode: RiskMode,
+    now: datetime,
+) -> Schedule:
+    if start_window(config, now=now) is None:
+        return Schedule(
+            config_id=config.config_id,
+            generated_at=datetime.now(tz=timezone.utc),
+            chosen=None,
+            carbon_version=inputs.carbon_version,
+            availability_version=inputs.availability_version,
+            infeasible_reason="No start time meets the deadline with the estimated runtime.",
+            risk_mode=risk_mode,
+        )
+    scored = scheduler.score(config, inputs, now=now, tables=tables)
+    return scheduler.rank(config, inputs, scored, risk_mode, now=now)
+
+
+# --- Parent side ---
+class ParallelPlanner:
+    """Plans many workloads across a process pool, streaming results."""
+
+    def __init__(self, scheduler: Scheduler | None = None, *, max_workers: int | None = None) -> None:
+        """Initialize the planner.
+
+        Args:
+            scheduler: Scheduler whose settings and input cache are used
+                (defaults to the shared one).
+            max_workers: Worker processes (defaults to the CPU count). With one
+                worker, plans run in the calling thread with the same shared
+                tables and no pool.
+        """
+        self.scheduler = scheduler or get_scheduler()
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+
+    def _settings(self) -> dict[str, Any]:
+        s = self.scheduler
+        return {
+            "slot": s.slot,
+            "score_floor": s.score_floor,
+            "chunk_size": s.chunk_size,
+            "instance_power_kw": s.instance_power_kw,
+            "weights": s.weights,
+            "max_front_size": s.max_front_size,
+        }
+
+    def plan_many(
+        self,
+        workloads: Mapping[str, WorkloadConfig],
+        *,
+        now: datetime | None = None,
+        risk_modes: Mapping[str, RiskMode] | None = None,
+    ) -> Iterator[PlanProgress]:
+        """Plan every workload, yielding each result as soon as it is ready.
+
+        Closing the iterator early cancels pending tasks and releases the
+        shared memory.
+
+        Args:
+            workloads: Configs keyed by workload id.
+            now: Reference time (defaults to now).
+            risk_modes: Per-workload modes (default: `auto_risk_mode`).
+
+        Yields:
+            PlanProgress, in completion order.
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        risk_modes = risk_modes or {}
+        scheduler = self.scheduler
+        total = len(workloads)
+        completed = 0
+
+        # Planning needs a runtime and a region or fleet; report the rest up front.
+        tasks: dict[str, tuple[WorkloadConfig, RiskMode]] = {}
+        until_by_region: dict[str | None, int] = {}
+        pinned_by_region: dict[str | None, set[int]] = {}
+        origin: int | None = None
+        for workload_id, config in workloads.items():
+            if config.runtime_estimate_seconds is None or (config.region is None and config.fleet_id is None):
+                completed += 1
+                yield PlanProgress(
+                    workload_id=workload_id,
+                    schedule=None,
+                    error="Runtime estimate and a region or fleet are required.",
+                    completed=completed,
+                    total=total,
+                )
+                continue
+            tasks[workload_id] = (config, risk_modes.get(workload_id) or auto_risk_mode(config))
+            if config.fleet_id is not None:
+                pinned_by_region.setdefault(config.region, set()).add(config.fleet_id)
+            window = start_window(config, now=now)
+            if window is not None:
+                end = window[1] + int(config.runtime_estimate_seconds)
+                until_by_region[config.region] = max(until_by_region.get(config.region, end), end)
+                origin = window[0] if origin is None else min(origin, window[0])
+
+        # One set of inputs and tables per region.
+        step = int(scheduler.slot.total_seconds())
+        start = ((origin if origin is not None else int(now.timestamp())) // step) * step
+        regions: dict[int, tuple[PlanningInputs, ScoringTables]] = {}
+        region_of: dict[str, int] = {}
+        for workload_id, (config, _) in tasks.items():
+            until = until_by_region.get(config.region, start + step)
+            inputs = scheduler.shared_inputs_for(
+                config, now=now, until_epoch=until, pinned_fleet_ids=pinned_by_region.get(config.region, ())
+            )
+            key = id(inputs)
+            if key not in regions:
+                grid = TimeGrid(start=start, step=step, size=max(-(-(until - start) // step), 1))
+                regions[key] = (inputs, ScoringTables.build(inputs, grid))
+            region_of[workload_id] = key
+
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            for workload_id, (config, mode) in tasks.items():
+                inputs, tables = regions[region_of[workload_id]]
+                completed += 1
+                try:
+                    schedule = _plan_with(scheduler, config, inputs, tables, mode, now)
+                    yield PlanProgress(workload_id, schedule, None, completed, total)
+                except Exception as e:
+                    yield PlanProgress(workload_id, None, str(e), completed, total)
+            return
+
+        blocks: list[SharedMemory] = []
+        executor: ProcessPoolExecutor | None = None
+        try:
+            payloads: dict[int, _RegionPayload] = {}
+            for key, (inputs, tables) in regions.items():
+                shm, payloads[key] = _region_payload(inputs, tables)
+                blocks.append(shm)
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(tasks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._settings(), payloads),
+            )
+            pending: dict[Future[Schedule], str] = {
+                executor.submit(_plan_in_worker, region_of[workload_id], config, mode, now): workload_id
+                for workload_id, (config, mode) in tasks.items()
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    workload_id = pending.pop(future)
+                    completed += 1
+                    try:
+                        yield PlanProgress(workload_id, future.result(), None, completed, total)
+                    except Exception as e:
+                        yield PlanProgress(workload_id, None, str(e), completed, total)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
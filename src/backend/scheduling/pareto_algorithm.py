@@ -1,2 +1,353 @@
-"""Pareto-based multi-objective scheduling algorithm (scaffold)."""
+"""Pareto-based multi-objective scheduling algorithm.
 
+Candidate plans (start time × fleet × AZ × target capacity) are scored on
+several objectives to minimise (carbon, cost, interruption risk). This module
+finds the non-dominated candidates and picks a compromise among them. It works
+on a plain (n, k) objective matrix, so it is independent of how candidates are
+generated.
+
+Front extraction picks the cheapest exact method for the shape:
+
+- k == 1: the minimum (ties kept).
+- k == 2: O(n log n) sweep. Sort by the first objective; a point is on the front
+  if its second objective beats everything earlier.
+- k >= 3 and moderate n: blocked NumPy broadcasting of the full dominance
+  relation.
+- k == 3 and large n: offline divide and conquer in O(n log² n). Rows are
+  sorted lexicographically, so only earlier rows can dominate later ones. At
+  every level of a bottom-up merge, each right-half row asks whether some
+  left-half row is no worse in the last two objectives. All segments of a
+  level are answered by one sort and one running minimum. 10^5 candidates
+  take well under a second whatever the front size.
+- k > 3 and large n: elimination sweep. Candidates are visited in order of
+  normalised objective sum, a batch at a time; the batch's own front points
+  discard everything they dominate. Cost is O(n · front size) comparisons, in
+  broadcasts of a batch of front points rather than one point per step.
+
+For k >= 3 and large n, a first pass drops every row dominated by the front of
+the lowest-sum rows, repeated on the survivors while it at least halves them.
+Candidate sets usually have small fronts that dominate nearly everything, so
+the exact methods above only see what is left.
+
+Rows with NaN in any objective are treated as infeasible and never selected.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+# Above this many candidates (for k >= 3) broadcasting every pair stops paying off.
+_BROADCAST_MAX_CANDIDATES = 2_000
+# Upper bound on elements in one broadcast block (rows × candidates).
+_BROADCAST_BLOCK_ELEMENTS = 4_000_000
+# Candidates the elimination sweep takes front points from per step.
+_ELIMINATION_BATCH = 256
+# Lowest-sum rows whose front prunes large inputs before the exact methods.
+_PRUNE_SAMPLE = 256
+
+
+def _as_objectives(objectives: np.ndarray) -> np.ndarray:
+    obj = np.asarray(objectives, dtype=np.float64)
+    if obj.ndim == 1:
+        obj = obj[:, None]
+    if obj.ndim != 2:
+        raise ValueError("objectives must have shape (n_candidates, n_objectives)")
+    return obj
+
+
+def _front_mask_1d(obj: np.ndarray) -> np.ndarray:
+    col = obj[:, 0]
+    return col == col.min()
+
+
+def _front_mask_2d(obj: np.ndarray) -> np.ndarray:
+    """O(n log n) sweep for two objectives (duplicates of a front point are kept)."""
+    n = obj.shape[0]
+    a, b = obj[:, 0], obj[:, 1]
+    order = np.lexsort((b, a))
+    a_s, b_s = a[order], b[order]
+
+    # Groups of equal first objective; within a group only the minimum b survives.
+    starts = np.flatnonzero(np.concatenate([[True], a_s[1:] != a_s[:-1]]))
+    group_min = np.minimum.reduceat(b_s, starts)
+    # Best b among strictly smaller first objectives.
+    prev_best = np.concatenate([[np.inf], np.minimum.accumulate(group_min)[:-1]])
+    group_of = np.repeat(np.arange(starts.shape[0]), np.diff(np.append(starts, n)))
+
+    keep_sorted = (b_s == group_min[group_of]) & (b_s < prev_best[group_of])
+    mask = np.zeros(n, dtype=bool)
+    mask[order[keep_sorted]] = True
+    return mask
+
+
+def _front_mask_broadcast(obj: np.ndarray) -> np.ndarray:
+    """Exact dominance check of every pair, in row blocks to bound memory."""
+    return ~_dominated_by(obj, obj)
+
+
+def _dense_rank(values: np.ndarray) -> np.ndarray:
+    return np.unique(values, return_inverse=True)[1].reshape(-1).astype(np.int64)
+
+
+def _front_mask_3d(obj: np.ndarray) -> np.ndarray:
+    """Divide and conquer for three objectives (duplicates of a front point are kept)."""
+    # Exact duplicates never dominate each other; after de-duplication any
+    # dominating row is lexicographically smaller, i.e. earlier in `uniq`.
+    uniq, inverse = np.unique(obj, axis=0, return_inverse=True)
+    m = uniq.shape[0]
+    rank_b = _dense_rank(uniq[:, 1])
+    rank_c = _dense_rank(uniq[:, 2])
+    big = m + 1  # exceeds every rank, so per-segment offsets never overlap
+    pos = np.arange(m, dtype=np.int64)
+    dominated = np.zeros(m, dtype=bool)
+
+    half = 1
+    while half < m:
+        seg = pos // (2 * half)
+        right = (pos // half) % 2
+        # Within a segment, order by b with left rows first on ties.
+        order = np.argsort((seg * big + rank_b) * 2 + right)
+        # Left rows contribute their c rank. Right rows contribute a value above
+        # every rank. Each segment is shifted down by `seg * big`, so the running
+        # minimum never carries over from an earlier segment.
+        values = np.where(right == 1, big, rank_c) - seg * big
+        running = np.minimum.accumulate(values[order])
+        is_right = right[order] == 1
+        rows = order[is_right]
+        hit = running[is_right] + seg[rows] * big <= rank_c[rows]
+        dominated[rows[hit]] = True
+        half *= 2
+    return ~dominated[inverse.reshape(-1)]
+
+
+def _dominated_by(rows: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Whether each of `rows` is dominated by some row of `others`, in blocks."""
+    n, k = rows.shape
+    dominated = np.zeros(n, dtype=bool)
+    if n == 0 or others.shape[0] == 0:
+        return dominated
+    # One (block, others) comparison per objective: reducing over a short last
+    # axis of a 3-D broadcast is several times slower.
+    block = max(1, _BROADCAST_BLOCK_ELEMENTS // max(others.shape[0], 1))
+    for lo in range(0, n, block):
+        sub = rows[lo : lo + block]
+        no_worse = np.ones((sub.shape[0], others.shape[0]), dtype=bool)
+        equal = np.ones_like(no_worse)
+        for j in range(k):
+            a, b = others[None, :, j], sub[:, j, None]
+            no_worse &= a <= b
+            equal &= a == b
+        dominated[lo : lo + block] = (no_worse & ~equal).any(axis=1)
+    return dominated
+
+
+def _normalized_sum(obj: np.ndarray) -> np.ndarray:
+    """Row sums of min-max scaled objectives, up to a constant (infinite rows sort last)."""
+    # Column by column and a matrix product: reducing the short axis of a C-ordered
+    # (n, k) array is several times slower.
+    lo = np.array([obj[:, j].min() for j in range(obj.shape[1])])
+    hi = np.array([obj[:, j].max() for j in range(obj.shape[1])])
+    span = np.where(hi > lo, hi - lo, 1.0)
+    with np.errstate(invalid="ignore"):
+        return obj @ (1.0 / span)
+
+
+def _prune_mask(obj: np.ndarray) -> np.ndarray:
+    """Rows not dominated by the front of the `_PRUNE_SAMPLE` lowest-sum rows."""
+    sample = min(_PRUNE_SAMPLE, obj.shape[0])
+    head = np.argpartition(_normalized_sum(obj), sample - 1)[:sample]
+    points = obj[head][_front_mask_broadcast(obj[head])]
+    return ~_dominated_by(obj, points)
+
+
+def _front_mask_elimination(obj: np.ndarray) -> np.ndarray:
+    """Elimination sweep in O(n · front size); duplicates of a front point are kept."""
+    n = obj.shape[0]
+    # Visiting low-sum points first finds strongly dominating points early.
+    order = np.argsort(_normalized_sum(obj), kind="stable")
+
+    remaining = order
+    costs = obj[order]
+    front = np.empty(0, dtype=np.int64)
+    while remaining.shape[0]:
+        # Rows with a lower sum cannot be dominated by later rows, so the front
+        # of the next batch is part of the overall front.
+        head = _front_mask_broadcast(costs[:_ELIMINATION_BATCH])
+        points = costs[:_ELIMINATION_BATCH][head]
+        # Equal sums after rounding: drop earlier front rows a new point dominates.
+        front = front[~_dominated_by(obj[front], points)]
+        front = np.concatenate([front, remaining[:_ELIMINATION_BATCH][head]])
+        rest = costs[_ELIMINATION_BATCH:]
+        keep = ~_dominated_by(rest, points)
+        remaining = remaining[_ELIMINATION_BATCH:][keep]
+        costs = rest[keep]
+
+    mask = np.zeros(n, dtype=bool)
+    mask[front] = True
+    return mask
+
+
+def pareto_front_mask(objectives: np.ndarray) -> np.ndarray:
+    """Boolean mask of non-dominated rows (all objectives minimised).
+
+    Args:
+        objectives: Array of shape (n_candidates, n_objectives).
+
+    Returns:
+        Boolean array of shape (n_candidates,). Rows containing NaN are False.
+    """
+    obj = _as_objectives(objectives)
+    n, k = obj.shape
+    mask = np.zeros(n, dtype=bool)
+    # NaN in any column makes the row sum NaN; abs keeps +inf and -inf from cancelling.
+    finite = ~np.isnan(np.abs(obj) @ np.ones(k))
+    if not finite.any():
+        return mask
+    rows = np.flatnonzero(finite)
+    sub = obj[rows] if rows.shape[0] < n else obj
+
+    if k == 1:
+        sub_mask = _front_mask_1d(sub)
+    elif k == 2:
+        sub_mask = _front_mask_2d(sub)
+    elif sub.shape[0] <= _BROADCAST_MAX_CANDIDATES:
+        sub_mask = _front_mask_broadcast(sub)
+    else:
+        # Pruned rows are dominated, so they do not change the front of the rest.
+        # Each round samples closer to the front; stop once one stops paying off.
+        kept = np.arange(sub.shape[0])
+        while kept.shape[0] > _BROADCAST_MAX_CANDIDATES:
+            survivors = kept[_prune_mask(sub[kept])]
+            done = survivors.shape[0] > kept.shape[0] // 2
+            kept = survivors
+            if done:
+                break
+        rest = sub[kept]
+        if rest.shape[0] <= _BROADCAST_MAX_CANDIDATES:
+            rest_mask = _front_mask_broadcast(rest)
+        elif k == 3:
+            rest_mask = _front_mask_3d(rest)
+        else:
+            rest_mask = _front_mask_elimination(rest)
+        sub_mask = np.zeros(sub.shape[0], dtype=bool)
+        sub_mask[kept[rest_mask]] = True
+    mask[rows[sub_mask]] = True
+    return mask
+
+
+def pareto_front(objectives: np.ndarray) -> np.ndarray:
+    """Indexes of non-dominated rows, ordered by the first objective."""
+    obj = _as_objectives(objectives)
+    idx = np.flatnonzero(pareto_front_mask(obj))
+    return idx[np.lexsort(obj[idx].T[::-1])]
+
+
+def non_dominated_ranks(objectives: np.ndarray, *, max_rank: int | None = None) -> np.ndarray:
+    """Non-dominated sorting: rank 0 is the Pareto front, rank 1 the next front, ...
+
+    Args:
+        objectives: Array of shape (n_candidates, n_objectives).
+        max_rank: Stop after assigning this rank (useful when only the first few
+            fronts matter); remaining rows get -1.
+
+    Returns:
+        Integer ranks of shape (n_candidates,); NaN rows get -1.
+    """
+    obj = _as_objectives(objectives)
+    ranks = np.full(obj.shape[0], -1, dtype=np.int64)
+    remaining = np.flatnonzero(~np.isnan(obj).any(axis=1))
+    rank = 0
+    while remaining.shape[0] and (max_rank is None or rank <= max_rank):
+        front = pareto_front_mask(obj[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+    return ranks
+
+
+def normalize_objectives(objectives: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+    """Min-max scale each objective to [0, 1] over `rows` (default: all finite rows).
+
+    Constant objectives map to 0.
+    """
+    obj = _as_objectives(objectives)
+    ref = obj if rows is None else obj[rows]
+    lo = np.nanmin(ref, axis=0)
+    hi = np.nanmax(ref, axis=0)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    return (obj - lo) / span
+
+
+def compromise_index(
+    objectives: np.ndarray,
+    front: np.ndarray,
+    weights: Sequence[float] | np.ndarray | None = None,
+) -> int | None:
+    """Pick one front member: smallest weighted Chebyshev distance to the ideal point.
+
+    Objectives are normalised over the front, so the weights express relative
+    importance independent of units.
+
+    Args:
+        objectives: Array of shape (n_candidates, n_objectives).
+        front: Indexes of non-dominated rows.
+        weights: Per-objective importance (defaults to equal).
+
+    Returns:
+        Row index of the chosen candidate, or None if `front` is empty.
+    """
+    if len(front) == 0:
+        return None
+    obj = _as_objectives(objectives)
+    front = np.asarray(front, dtype=np.int64)
+    scaled = normalize_objectives(obj[front])
+    w = np.ones(obj.shape[1]) if weights is None else np.asarray(weights, dtype=np.float64)
+    if w.shape != (obj.shape[1],):
+        raise ValueError("weights must have one entry per objective")
+    distance = (scaled * w).max(axis=1)
+    # Tie-break on the weighted sum so the choice is stable.
+    best = np.lexsort(((scaled * w).sum(axis=1), distance))[0]
+    return int(front[best])
+
+
+@dataclass(frozen=True, slots=True)
+class ParetoSelection:
+    """Front of a candidate set and the compromise picked from it."""
+
+    front: np.ndarray  # row indexes, ordered by the first objective
+    chosen: int | None
+    objective_names: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.front.shape[0])
+
+
+def select_pareto(
+    objectives: np.ndarray,
+    *,
+    objective_names: Sequence[str] = ("carbon", "cost", "risk"),
+    weights: Sequence[float] | np.ndarray | None = None,
+) -> ParetoSelection:
+    """Compute the Pareto front and a weighted compromise in one call.
+
+    Args:
+        objectives: Array of shape (n_candidates, n_objectives), all minimised
+            (e.g. gCO₂e, dollars, 1 - survival probability).
+        objective_names: Labels for the objective columns.
+        weights: Per-objective importance for the compromise pick.
+
+    Returns:
+        ParetoSelection
+    """
+    obj = _as_objectives(objectives)
+    if len(objective_names) != obj.shape[1]:
+        raise ValueError("objective_names must have one entry per objective")
+    front = pareto_front(obj)
+    return ParetoSelection(
+        front=front,
+        chosen=compromise_index(obj, front, weights),
+        objective_names=tuple(objective_names),
+    )
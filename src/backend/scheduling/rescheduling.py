@@ -1,2 +1,403 @@
-"""Rescheduling policy logic (scaffold)."""
+"""Rescheduling policy logic.
 
+Re-planning every scheduled workload whenever a forecast lands costs
+O(workloads × candidates). `IncrementalRescheduler` avoids most of that:
+
+- Each tracked workload records what its plan depends on: carbon region,
+  fleets and the time range from its first start to its last possible end.
+  Index maps from carbon region and fleet to workloads pick the affected ones
+  without scanning.
+- An affected workload is only re-scored when the new forecast moves its own
+  inputs by more than a tolerance: carbon intensity over its window (relative),
+  or the placement score of one of its options at one of its slots (absolute).
+- Re-scoring reuses the workload's candidate space and stored objective
+  columns (`ScoredCandidates`). Only the column fed by the changed forecast is
+  recomputed (carbon or risk), then the plan is re-ranked under the workload's
+  risk mode.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from enum import StrEnum
+from typing import Callable, Iterator
+
+import numpy as np
+
+from src.backend.data.forecasts.availability_forecast import AvailabilityForecast
+from src.backend.data.forecasts.carbon_forecast import CarbonForecast, carbon_region_for
+from src.backend.scheduling.candidates import start_window
+from src.backend.scheduling.risk_modes import RiskMode, auto_risk_mode
+from src.backend.scheduling.scheduler import (
+    PlanningInputs,
+    Scheduler,
+    ScoredCandidates,
+    ScoringModel,
+    availability_version,
+    get_scheduler,
+)
+from src.config.defaults import (
+    DEFAULT_RESCHEDULE_CARBON_TOLERANCE,
+    DEFAULT_RESCHEDULE_PLACEMENT_TOLERANCE,
+)
+from src.models.schedule import Schedule
+from src.models.workload_config import WorkloadConfig
+
+
+class RescheduleReason(StrEnum):
+    CARBON_FORECAST = "carbon_forecast"
+    AVAILABILITY_FORECAST = "availability_forecast"
+
+
+@dataclass(frozen=True, slots=True)
+class PlanDependencies:
+    """Inputs a workload's plan was computed from."""
+
+    carbon_region: str | None
+    fleet_ids: frozenset[int]
+    start: int  # epoch seconds: earliest candidate start
+    end: int  # epoch seconds: latest candidate end
+
+    def overlaps(self, start: int, end: int) -> bool:
+        return start < self.end and end > self.start
+
+
+@dataclass(frozen=True, slots=True)
+class RescheduleResult:
+    """A workload that was re-scored after a forecast update."""
+
+    workload_id: str
+    reason: RescheduleReason
+    previous: Schedule
+    schedule: Schedule
+    # Measured input change (relative for carbon, score points for availability).
+    change: float
+
+    @property
+    def plan_changed(self) -> bool:
+        return self.previous.chosen != self.schedule.chosen
+
+
+RescheduleListener = Callable[[list[RescheduleResult]], None]
+
+
+@dataclass(slots=True)
+class _TrackedPlan:
+    config: WorkloadConfig
+    inputs: PlanningInputs
+    scored: ScoredCandidates
+    risk_mode: RiskMode
+    dependencies: PlanDependencies
+    schedule: Schedule
+
+
+def _relative_change(old: np.ndarray, new: np.ndarray) -> float:
+    """Largest absolute difference relative to the old mean level (NaN-aware)."""
+    old_has, new_has = np.isfinite(old).any(), np.isfinite(new).any()
+    if not old_has and not new_has:
+        return 0.0
+    if old_has != new_has:
+        return float("inf")
+    level = max(float(np.nanmean(np.abs(old))), 1.0)
+    return float(np.nanmax(np.abs(new - old))) / level
+
+
+class IncrementalRescheduler:
+    """Keeps scheduled workloads' plans current as forecasts change."""
+
+    def __init__(
+        self,
+        scheduler: Scheduler | None = None,
+        *,
+        carbon_tolerance: float = DEFAULT_RESCHEDULE_CARBON_TOLERANCE,
+        placement_tolerance: float = DEFAULT_RESCHEDULE_PLACEMENT_TOLERANCE,
+    ) -> None:
+        """Initialize the rescheduler.
+
+        Args:
+            scheduler: Scheduler used for inputs, candidates and selection
+                (defaults to the shared one).
+            carbon_tolerance: Relative carbon intensity change over a workload's
+                window below which it is not re-scored.
+            placement_tolerance: Placement score change (points) below which a
+                workload is not re-scored.
+        """
+        self.scheduler = scheduler or get_scheduler()
+        self.carbon_tolerance = float(carbon_tolerance)
+        self.placement_tolerance = float(placement_tolerance)
+
+        self._lock = threading.RLock()
+        self._plans: dict[str, _TrackedPlan] = {}
+        self._by_carbon_region: dict[str, set[str]] = {}
+        self._by_fleet: dict[int, set[str]] = {}
+        self._listeners: list[RescheduleListener] = []
+
+    # --- Tracking ---
+    def track(
+        self,
+        workload_id: str,
+        config: WorkloadConfig,
+        *,
+        now: datetime | None = None,
+        risk_mode: RiskMode | None = None,
+    ) -> Schedule:
+        """Plan a workload and keep its candidate arrays for incremental updates.
+
+        Re-tracking an id replaces its previous plan. Workloads without any
+        candidate are planned normally but not tracked.
+
+        Args:
+            workload_id: Caller's id for the workload.
+            config: Workload config; needs a runtime estimate and a region or fleet.
+            now: Reference time (defaults to now).
+            risk_mode: Mode to rank with (defaults to `auto_risk_mode(config)`).
+
+        Returns:
+            Schedule (check `is_feasible`).
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        risk_mode = risk_mode or auto_risk_mode(config)
+        scheduler = self.scheduler
+        window = start_window(config, now=now)
+        until = window[1] + int(config.runtime_estimate_seconds or 0) if window else None
+        inputs = scheduler.inputs_for(config, now=now, until_epoch=until)
+        space = scheduler.build_space(config, inputs, now=now) if window is not None else None
+        if space is None or space.size == 0:
+            self.untrack(workload_id)
+            # Nothing to re-score later; the scheduler explains why.
+            return scheduler.plan(config, now=now, risk_mode=risk_mode)
+
+        model = ScoringModel.build(space, inputs, power_kw=scheduler.instance_power_kw)
+        tracked = _TrackedPlan(
+            config=config,
+            inputs=inputs,
+            scored=ScoredCandidates.score(model, chunk_size=scheduler.chunk_size),
+            risk_mode=risk_mode,
+            dependencies=PlanDependencies(
+                carbon_region=carbon_region_for(inputs.region) if inputs.region else None,
+                fleet_ids=frozenset(int(f) for f in np.unique(space.fleet_id)),
+                start=space.first_start,
+                end=space.last_start + space.runtime_seconds,
+            ),
+            schedule=Schedule(config_id=config.config_id, generated_at=now, chosen=None),
+        )
+        tracked.schedule = self._rank(tracked, now=now)
+
+        with self._lock:
+            self._forget(workload_id)
+            self._plans[workload_id] = tracked
+            deps = tracked.dependencies
+            if deps.carbon_region is not None:
+                self._by_carbon_region.setdefault(deps.carbon_region, set()).add(workload_id)
+            for fleet_id in deps.fleet_ids:
+                self._by_fleet.setdefault(fleet_id, set()).add(workload_id)
+        return tracked.schedule
+
+    def untrack(self, workload_id: str) -> None:
+        with self._lock:
+            self._forget(workload_id)
+
+    def _forget(self, workload_id: str) -> None:
+        tracked = self._plans.pop(workload_id, None)
+        if tracked is None:
+            return
+        deps = tracked.dependencies
+        if deps.carbon_region is not None:
+            self._by_carbon_region.get(deps.carbon_region, set()).discard(workload_id)
+        for fleet_id in deps.fleet_ids:
+            self._by_fleet.get(fleet_id, set()).discard(workload_id)
+
+    @property
+    def tracked_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._plans)
+
+    def schedule(self, workload_id: str) -> Schedule | None:
+        with self._lock:
+            tracked = self._plans.get(workload_id)
+            return tracked.schedule if tracked is not None else None
+
+    def dependencies(self, workload_id: str) -> PlanDependencies | None:
+        with self._lock:
+            tracked = self._plans.get(workload_id)
+            return tracked.dependencies if tracked is not None else None
+
+    def set_risk_mode(
+        self, workload_id: str, risk_mode: RiskMode, *, now: datetime | None = None
+    ) -> Schedule | None:
+        """Re-rank a tracked workload under another risk mode (no re-scoring)."""
+        now = now or datetime.now(tz=timezone.utc)
+        with self._lock:
+            tracked = self._plans.get(workload_id)
+        if tracked is None:
+            return None
+        tracked.risk_mode = risk_mode
+        tracked.schedule = self._rank(tracked, now=now)
+        return tracked.schedule
+
+    def subscribe(self, listener: RescheduleListener) -> Callable[[], None]:
+        """Register a listener for re-scored workloads; returns an unsubscribe function."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    # --- Forecast updates ---
+    def on_carbon_forecast(
+        self,
+        forecast: CarbonForecast,
+        *,
+        region: str,
+        now: datetime | None = None,
+    ) -> list[RescheduleResult]:
+        """Re-score workloads whose carbon inputs changed materially.
+
+        Args:
+            forecast: The newly landed carbon forecast.
+            region: AWS or grid region the forecast is for.
+            now: Reference time; candidates starting earlier are not considered.
+
+        Returns:
+            Results for every workload that was re-scored (also sent to listeners).
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        start, end = int(forecast.start.timestamp()), int(forecast.end.timestamp())
+        with self._lock:
+            ids = list(self._by_carbon_region.get(carbon_region_for(region), ()))
+
+        results: list[RescheduleResult] = []
+        for workload_id, tracked in self._affected(ids, start, end, now):
+            model = tracked.scored.model.with_carbon(forecast)
+            change = _relative_change(tracked.scored.model.carbon.intensity, model.carbon.intensity)
+            if change <= self.carbon_tolerance:
+                continue
+            objectives = tracked.scored.objectives
+            for chunk in model.space.chunks(self.scheduler.chunk_size):
+                objectives[chunk.flat_index, 0] = model.carbon_objective(chunk)
+            tracked.scored = replace(tracked.scored, model=model)
+            tracked.inputs = replace(tracked.inputs, carbon=forecast, carbon_version=forecast.version)
+            results.append(self._reselect(workload_id, tracked, RescheduleReason.CARBON_FORECAST, change, now))
+        self._emit(results)
+        return results
+
+    def on_availability_forecast(
+        self,
+        forecast: AvailabilityForecast,
+        *,
+        now: datetime | None = None,
+    ) -> list[RescheduleResult]:
+        """Re-score workloads whose placement-score inputs changed materially.
+
+        Args:
+            forecast: The newly landed placement-score forecast.
+            now: Reference time; candidates starting earlier are not considered.
+
+        Returns:
+            Results for every workload that was re-scored (also sent to listeners).
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        times = forecast.epoch_seconds
+        if times.size == 0:
+            return []
+        start, end = int(times[0]), int(times[-1]) + (int(times[1] - times[0]) if times.size > 1 else 1)
+        with self._lock:
+            ids = sorted({wid for g in np.unique(forecast.group_id) for wid in self._by_fleet.get(int(g), ())})
+
+        fresh = set(forecast.keys())
+        results: list[RescheduleResult] = []
+        for workload_id, tracked in self._affected(ids, start, end, now):
+            # The new forecast may cover only some fleets; the others keep theirs.
+            previous = tracked.scored.model.forecast
+            merged = previous.merged(forecast) if previous is not None else forecast
+            model = tracked.scored.model.with_availability(merged)
+            space = model.space
+            covered = np.array(
+                [
+                    (int(g), az, int(c)) in fresh
+                    for g, az, c in zip(space.fleet_id, space.availability_zone, space.target_capacity)
+                ],
+                dtype=bool,
+            )
+            placement = np.empty(space.size)
+            change = 0.0
+            for chunk in space.chunks(self.scheduler.chunk_size):
+                scores = model.placement_score(chunk)
+                placement[chunk.flat_index] = scores
+                moved = np.abs(scores - tracked.scored.placement[chunk.flat_index])[covered[chunk.option]]
+                if moved.size:
+                    change = max(change, float(moved.max()))
+            if change <= self.placement_tolerance:
+                continue
+            objectives = tracked.scored.objectives
+            for chunk in space.chunks(self.scheduler.chunk_size):
+                objectives[chunk.flat_index, 2] = model.risk_objective(chunk)
+            tracked.scored = replace(tracked.scored, model=model, placement=placement)
+            inputs = tracked.inputs
+            tracked.inputs = replace(
+                inputs,
+                availability=merged,
+                availability_version=availability_version(
+                    inputs.latest_scores, merged, inputs.spot_prices, inputs.interruption_rates
+                ),
+            )
+            results.append(
+                self._reselect(workload_id, tracked, RescheduleReason.AVAILABILITY_FORECAST, change, now)
+            )
+        self._emit(results)
+        return results
+
+    # --- Internals ---
+    def _affected(
+        self, ids: list[str], start: int, end: int, now: datetime
+    ) -> Iterator[tuple[str, _TrackedPlan]]:
+        """Tracked plans among `ids` whose window overlaps [start, end) and has not started."""
+        now_s = int(now.timestamp())
+        for workload_id in ids:
+            with self._lock:
+                tracked = self._plans.get(workload_id)
+            if tracked is None or not tracked.dependencies.overlaps(start, end):
+                continue
+            chosen = tracked.schedule.chosen
+            if chosen is not None and chosen.start_at.timestamp() <= now_s:
+                continue
+            yield workload_id, tracked
+
+    def _rank(self, tracked: _TrackedPlan, *, now: datetime) -> Schedule:
+        return self.scheduler.rank(tracked.config, tracked.inputs, tracked.scored, tracked.risk_mode, now=now)
+
+    def _reselect(
+        self,
+        workload_id: str,
+        tracked: _TrackedPlan,
+        reason: RescheduleReason,
+        change: float,
+        now: datetime,
+    ) -> RescheduleResult:
+        previous = tracked.schedule
+        tracked.schedule = self._rank(tracked, now=now)
+        return RescheduleResult(
+            workload_id=workload_id,
+            reason=reason,
+            previous=previous,
+            schedule=tracked.schedule,
+            change=change,
+        )
+
+    def _emit(self, results: list[RescheduleResult]) -> None:
+        if not results:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(results)
+            except Exception:
+                # Listener errors must not break forecast ingestion.
+                continue
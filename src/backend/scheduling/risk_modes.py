@@ -1,2 +1,136 @@
-"""Risk mode implementations and selection rules (scaffold)."""
+"""Risk modes and selection rules.
 
+A risk mode is a data-only `RiskProfile`: compromise weights for
+(carbon, cost, risk), hard thresholds on interruption probability, placement
+score and deadline slack, and a penalty on tight deadline slack. The scheduler
+applies a profile to a plan's whole candidate arrays with a few vectorised
+operations. Switching mode re-ranks the candidates already scored; nothing is
+refetched or regenerated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+import numpy as np
+
+from src.backend.scheduling.candidates import CandidateSpace
+from src.models.workload_config import WorkloadConfig
+
+
+class RiskMode(StrEnum):
+    CONSERVATIVE = "conservative"
+    BALANCED = "balanced"
+    AGGRESSIVE = "aggressive"
+
+    def label(self) -> str:
+        return {
+            RiskMode.CONSERVATIVE: "Conservative",
+            RiskMode.BALANCED: "Balanced",
+            RiskMode.AGGRESSIVE: "Aggressive",
+        }[self]
+
+
+@dataclass(frozen=True, slots=True)
+class RiskProfile:
+    """How a risk mode ranks candidates."""
+
+    # Compromise weights for (carbon, cost, risk), applied on top of the scheduler's.
+    weights: tuple[float, float, float]
+    # Candidates above this P(not placed or interrupted) are excluded.
+    max_interruption_risk: float
+    # Candidates whose placement score at the start is below this are excluded.
+    placement_score_floor: float
+    # Minimum time left before the deadline when the run ends, as a fraction of
+    # the runtime (room to retry after an interruption).
+    min_slack_fraction: float
+    # Added to the risk objective in proportion to how tight the slack is
+    # (0 with a full runtime of slack or no deadline, 1 with none).
+    slack_weight: float
+
+    def apply(
+        self,
+        objectives: np.ndarray,
+        placement_score: np.ndarray,
+        slack_seconds: np.ndarray,
+        runtime_seconds: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rank objectives and eligibility for every candidate at once.
+
+        Args:
+            objectives: (carbon, cost, risk) per candidate, shape (n, 3).
+            placement_score: Placement score at each start, shape (n,).
+            slack_seconds: Deadline minus end per candidate (inf without a deadline).
+            runtime_seconds: Run length.
+
+        Returns:
+            (ranking objectives of shape (n, 3), eligible mask of shape (n,)).
+        """
+        runtime = float(max(runtime_seconds, 1))
+        risk = objectives[:, 2]
+        tightness = np.clip(1.0 - slack_seconds / runtime, 0.0, 1.0)
+        ranked = objectives.copy()
+        ranked[:, 2] = risk + self.slack_weight * tightness
+        eligible = (
+            (risk <= self.max_interruption_risk)
+            & (placement_score >= self.placement_score_floor)
+            & (slack_seconds >= self.min_slack_fraction * runtime)
+        )
+        return ranked, eligible
+
+
+RISK_PROFILES: dict[RiskMode, RiskProfile] = {
+    RiskMode.CONSERVATIVE: RiskProfile(
+        weights=(0.5, 0.5, 2.0),
+        max_interruption_risk=0.10,
+        placement_score_floor=7.0,
+        min_slack_fraction=0.5,
+        slack_weight=0.5,
+    ),
+    RiskMode.BALANCED: RiskProfile(
+        weights=(1.0, 1.0, 1.0),
+        max_interruption_risk=0.35,
+        placement_score_floor=5.0,
+        min_slack_fraction=0.1,
+        slack_weight=0.2,
+    ),
+    RiskMode.AGGRESSIVE: RiskProfile(
+        weights=(1.5, 1.5, 0.5),
+        max_interruption_risk=1.0,
+        placement_score_floor=0.0,
+        min_slack_fraction=0.0,
+        slack_weight=0.0,
+    ),
+}
+
+# Delay tolerance from which a workload has room to retry after an interruption.
+_RETRY_TOLERANCE = timedelta(hours=6)
+
+
+def auto_risk_mode(config: WorkloadConfig) -> RiskMode:
+    """Pick a risk mode from the draft's job semantics.
+
+    - Not interruptible: an interruption loses the run, so conservative, or
+      balanced when the delay tolerance leaves room to retry.
+    - Interruptible with room to retry: aggressive.
+    - Anything else (including unanswered questions): balanced.
+    """
+    can_retry = (
+        config.delay_tolerance is not None and config.delay_tolerance.max_delay() >= _RETRY_TOLERANCE
+    )
+    if config.interruptible is False:
+        return RiskMode.BALANCED if can_retry else RiskMode.CONSERVATIVE
+    if config.interruptible and can_retry:
+        return RiskMode.AGGRESSIVE
+    return RiskMode.BALANCED
+
+
+def deadline_slack_seconds(space: CandidateSpace, deadline_at: datetime | None) -> np.ndarray:
+    """Deadline minus end time for every candidate of a space (inf without a deadline)."""
+    if deadline_at is None:
+        return np.full(space.size, np.inf)
+    slot = np.arange(space.size, dtype=np.int64) // max(space.n_options, 1)
+    end = space.first_start + slot * space.step + space.runtime_seconds
+    return deadline_at.timestamp() - end.astype(np.float64)
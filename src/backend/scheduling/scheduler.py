@@ -1,2 +1,1134 @@
-"""Main scheduler interface (scaffold)."""
+"""Main scheduler interface.
 
+`Scheduler.plan(config)` turns a workload draft into a `Schedule`:
+
+1. load planning inputs: fleet catalog, latest placement scores, carbon forecast,
+   placement-score forecast, spot prices and interruption rates. Inputs are
+   cached per fetch scope for a TTL, and each source is best-effort;
+2. enumerate candidates (`candidates.build_candidate_space`);
+3. score every chunk on carbon (g), cost ($) and interruption risk. Risk is
+   P(interrupted or not placed), from pool hazards and the forecast placement
+   score at the start time;
+4. rank under a risk mode (`risk_modes`): drop candidates outside the mode's
+   thresholds, keep a running Pareto front across chunks, then pick a
+   compromise with the mode's weights (`pareto_algorithm`).
+
+Plans are memoised on a stable hash of the draft's scheduling fields, the
+current start window, the risk mode and the versions of the carbon and
+availability inputs. Re-opening the Scheduling stage, or re-planning after an
+unrelated edit (name, description), is a dictionary hit. The scored candidate
+arrays of the most recent plans are kept too, so switching risk mode only
+re-ranks them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from src.backend.data.fleet.models import (
+    InterruptionRate,
+    PlacementScore,
+    RequestGroup,
+    SpotPrice,
+)
+from src.backend.data.fleet.pool_catalog import PoolCatalog
+from src.backend.data.forecasts.availability_forecast import (
+    SCORE_MAX,
+    SCORE_MIN,
+    AvailabilityForecast,
+)
+from src.backend.data.forecasts.carbon_forecast import CarbonForecast
+from src.backend.scheduling.candidates import (
+    CandidateChunk,
+    CandidateSpace,
+    build_candidate_space,
+    start_window,
+)
+from src.backend.scheduling.carbon_model import CarbonIntensityEngine
+from src.backend.scheduling.cost_model import SpotCostEngine
+from src.backend.scheduling.interruption_risk import InterruptionSurvivalEngine
+from src.backend.scheduling.pareto_algorithm import pareto_front_mask, select_pareto
+from src.backend.scheduling.risk_modes import (
+    RISK_PROFILES,
+    RiskMode,
+    auto_risk_mode,
+    deadline_slack_seconds,
+)
+from src.backend.scheduling.time_grid import TimeGrid, window_integral
+from src.config.defaults import (
+    DEFAULT_CANDIDATE_CHUNK_SIZE,
+    DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,
+    DEFAULT_INSTANCE_POWER_KW,
+    DEFAULT_SCHEDULER_INPUT_TTL_SECONDS,
+    DEFAULT_SCHEDULING_SLOT_SECONDS,
+)
+from src.models.schedule import PlanOption, Schedule
+from src.models.workload_config import WorkloadConfig
+
+PLAN_OBJECTIVES: tuple[str, ...] = ("carbon", "cost", "risk")
+
+# WorkloadConfig fields that affect planning; anything else (name, description,
+# timestamps, fleet display name) is ignored by the plan cache.
+SCHEDULING_FIELDS: tuple[str, ...] = (
+    "region",
+    "availability_zone",
+    "fleet_id",
+    "fleet_target_capacity",
+    "earliest_start_at",
+    "deadline_at",
+    "delay_tolerance",
+    "runtime_estimate_seconds",
+    "interruptible",
+)
+
+# Placement probability assumed for options without any placement data.
+_NEUTRAL_PLACEMENT_SCORE = (SCORE_MIN + SCORE_MAX) / 2
+
+# History windows the scoring inputs are fitted on.
+PRICE_HISTORY = timedelta(days=7)
+RATE_HISTORY = timedelta(days=30)
+PLACEMENT_HISTORY = timedelta(days=7)
+# Placement scores are collected about this often per (group, AZ, capacity) key;
+# history requests are sized so PLACEMENT_HISTORY fits (results are newest-first).
+_PLACEMENT_CADENCE = timedelta(minutes=10)
+# Keys assumed for a fleet without latest scores (AZs × capacities).
+_DEFAULT_FLEET_KEYS = 16
+_MIN_FORECAST_HORIZON = timedelta(hours=48)
+
+# Caps on per-fleet / per-pool history requests when loading inputs.
+_MAX_FORECAST_FLEETS = 16
+_MAX_RATE_POOLS = 64
+
+
+def scheduling_key(config: WorkloadConfig) -> str:
+    """Stable hash of the scheduling fields of a draft."""
+    payload: dict[str, object] = {}
+    for name in SCHEDULING_FIELDS:
+        value = getattr(config, name)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            value = int(value.timestamp())
+        payload[name] = value
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class PlanningInputs:
+    """Data a plan is computed from, with content versions."""
+
+    region: str | None
+    fleets: tuple[RequestGroup, ...]
+    latest_scores: dict[int, list[PlacementScore]]
+    carbon: CarbonForecast | None
+    availability: AvailabilityForecast | None
+    catalog: PoolCatalog | None
+    spot_prices: tuple[SpotPrice, ...]
+    interruption_rates: tuple[InterruptionRate, ...]
+    carbon_version: str
+    availability_version: str
+    loaded_at: float  # monotonic seconds
+    # Fleets whose forecast and interruption rates were loaded whatever their
+    # rank (workloads pinned to them are planned from these inputs).
+    pinned_fleet_ids: frozenset[int] = frozenset()
+
+    def covers(self, until_epoch: int) -> bool:
+        """Whether the carbon forecast reaches `until_epoch` (or there is none to extend)."""
+        if self.carbon is None:
+            return True
+        return self.carbon.end.timestamp() >= until_epoch
+
+
+def availability_version(
+    latest_scores: dict[int, list[PlacementScore]],
+    forecast: AvailabilityForecast | None,
+    prices: Sequence[SpotPrice],
+    rates: Sequence[InterruptionRate],
+) -> str:
+    """Content hash of the availability-side planning inputs."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update((forecast.version if forecast is not None else "-").encode())
+    for group_id in sorted(latest_scores):
+        for s in sorted(latest_scores[group_id], key=lambda s: (s.availability_zone, s.target_capacity)):
+            digest.update(
+                f"{group_id}|{s.availability_zone}|{s.target_capacity}|{s.score:.2f}"
+                f"|{int(s.measured_at.timestamp())};".encode()
+            )
+    for label, items in (("p", prices), ("r", rates)):
+        stamps = [int(i.measured_at.timestamp()) for i in items]
+        digest.update(f"{label}{len(stamps)}:{max(stamps, default=0)};".encode())
+    return digest.hexdigest()
+
+
+class Scheduler:
+    """Plans workload drafts over carbon, cost and interruption risk."""
+
+    def __init__(
+        self,
+        *,
+        slot: timedelta = timedelta(seconds=DEFAULT_SCHEDULING_SLOT_SECONDS),
+        score_floor: float | None = DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR,
+        chunk_size: int = DEFAULT_CANDIDATE_CHUNK_SIZE,
+        instance_power_kw: float = DEFAULT_INSTANCE_POWER_KW,
+        weights: Sequence[float] = (1.0, 1.0, 1.0),
+        max_front_size: int = 24,
+        input_ttl: timedelta = timedelta(seconds=DEFAULT_SCHEDULER_INPUT_TTL_SECONDS),
+        cache_size: int = 32,
+        candidate_cache_size: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            slot: Spacing of candidate start times.
+            score_floor: Minimum latest placement score for an option to be planned.
+            chunk_size: Candidates scored per batch (bounds peak memory).
+            instance_power_kw: Assumed draw per instance, for carbon in grams.
+            weights: Importance of (carbon, cost, risk) when picking from the front.
+            max_front_size: Alternatives kept in `Schedule.front`.
+            input_ttl: How long loaded planning inputs are reused.
+            cache_size: Plans kept in the memo cache.
+            candidate_cache_size: Scored candidate arrays kept for re-ranking.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.slot = slot
+        self.score_floor = score_floor
+        self.chunk_size = chunk_size
+        self.instance_power_kw = float(instance_power_kw)
+        self.weights = tuple(float(w) for w in weights)
+        self.max_front_size = max_front_size
+        self.input_ttl_seconds = input_ttl.total_seconds()
+        self.cache_size = cache_size
+        self.candidate_cache_size = candidate_cache_size
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._inputs: dict[tuple, PlanningInputs] = {}
+        self._plans: OrderedDict[tuple, Schedule] = OrderedDict()
+        self._scored: OrderedDict[tuple, ScoredCandidates] = OrderedDict()
+
+    # --- Cache ---
+    def invalidate(self) -> None:
+        """Drop cached inputs and plans (e.g. after credentials change)."""
+        with self._lock:
+            self._inputs.clear()
+            self._plans.clear()
+            self._scored.clear()
+
+    def _window_key(self, config: WorkloadConfig, now: datetime | None) -> tuple[int, int] | None:
+        """Start window floored to the slot grid: plans are reused within one slot."""
+        window = start_window(config, now=now)
+        if window is None:
+            return None
+        step = int(self.slot.total_seconds())
+        return (window[0] // step, window[1] // step)
+
+    # --- Planning ---
+    def plan(
+        self,
+        config: WorkloadConfig,
+        *,
+        now: datetime | None = None,
+        force: bool = False,
+        risk_mode: RiskMode | None = None,
+    ) -> Schedule:
+        """Plan a workload draft (memoised).
+
+        Args:
+            config: Workload draft; needs a runtime estimate and a region or fleet.
+            now: Reference time (defaults to now).
+            force: Reload inputs and recompute even if cached.
+            risk_mode: How to trade risk for carbon and cost (defaults to
+                `auto_risk_mode(config)`).
+
+        Returns:
+            Schedule (check `is_feasible`).
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        risk_mode = risk_mode or auto_risk_mode(config)
+        horizon_end = self.horizon_end(config, now)
+        inputs = self.inputs_for(config, now=now, until_epoch=horizon_end, force=force)
+
+        if not force:
+            cached, scored = self.cached(config, inputs, risk_mode, now=now)
+            if cached is not None:
+                return cached
+        else:
+            scored = None
+
+        if self._window_key(config, now) is None:
+            schedule = self._empty_schedule(
+                config, inputs, "No start time meets the deadline with the estimated runtime."
+            )
+        else:
+            if scored is None:
+                scored = self.score(config, inputs, now=now)
+                self.remember(config, inputs, risk_mode, now=now, scored=scored)
+            schedule = self.rank(config, inputs, scored, risk_mode, now=now)
+        self.remember(config, inputs, risk_mode, now=now, schedule=schedule)
+        return schedule
+
+    def _cache_keys(
+        self, config: WorkloadConfig, inputs: PlanningInputs, risk_mode: RiskMode, now: datetime
+    ) -> tuple[tuple, tuple]:
+        """(scored candidates key, plan key) for the memo caches."""
+        window = self._window_key(config, now)
+        scored_key = (scheduling_key(config), window, inputs.carbon_version, inputs.availability_version)
+        return scored_key, (*scored_key, risk_mode)
+
+    def cached(
+        self,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+    ) -> tuple[Schedule | None, ScoredCandidates | None]:
+        """Memoised plan and scored candidates for a draft under these inputs, if any."""
+        scored_key, key = self._cache_keys(config, inputs, risk_mode, now)
+        with self._lock:
+            schedule = self._plans.get(key)
+            if schedule is not None:
+                self._plans.move_to_end(key)
+            return schedule, self._scored.get(scored_key)
+
+    def remember(
+        self,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+        scored: ScoredCandidates | None = None,
+        schedule: Schedule | None = None,
+    ) -> None:
+        """Memoise scored candidates and/or a plan (e.g. computed outside `plan`)."""
+        scored_key, key = self._cache_keys(config, inputs, risk_mode, now)
+        with self._lock:
+            if scored is not None:
+                self._scored[scored_key] = scored
+                self._scored.move_to_end(scored_key)
+                while len(self._scored) > self.candidate_cache_size:
+                    self._scored.popitem(last=False)
+            if schedule is not None:
+                self._plans[key] = schedule
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.cache_size:
+                    self._plans.popitem(last=False)
+
+    def horizon_end(self, config: WorkloadConfig, now: datetime) -> int:
+        """Latest end of any candidate run (epoch seconds); `now` without a start window."""
+        window = start_window(config, now=now)
+        if window is None:
+            return int(now.timestamp())
+        return window[1] + int(config.runtime_estimate_seconds or 0)
+
+    # --- Inputs ---
+    @staticmethod
+    def _input_scope(config: WorkloadConfig) -> tuple:
+        return (
+            config.region,
+            config.fleet_id,
+            config.availability_zone,
+            config.fleet_target_capacity,
+        )
+
+    def inputs_for(
+        self,
+        config: WorkloadConfig,
+        *,
+        now: datetime | None = None,
+        until_epoch: int | None = None,
+        force: bool = False,
+        pinned_fleet_ids: Iterable[int] = (),
+    ) -> PlanningInputs:
+        """Planning inputs for a draft's fetch scope (cached for `input_ttl`).
+
+        `pinned_fleet_ids` are fleets the inputs must fully cover (see
+        `shared_inputs_for`); cached inputs that miss one are reloaded.
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        scope = self._input_scope(config)
+        pinned = frozenset(pinned_fleet_ids)
+        with self._lock:
+            cached = self._inputs.get(scope)
+        if (
+            cached is not None
+            and not force
+            and self._clock() - cached.loaded_at < self.input_ttl_seconds
+            and (until_epoch is None or cached.covers(until_epoch))
+            and pinned <= cached.pinned_fleet_ids
+        ):
+            return cached
+
+        inputs = self._load_inputs(config, now=now, until_epoch=until_epoch, pinned_fleet_ids=pinned)
+        with self._lock:
+            self._inputs[scope] = inputs
+        return inputs
+
+    def shared_inputs_for(
+        self,
+        config: WorkloadConfig,
+        *,
+        now: datetime | None = None,
+        until_epoch: int | None = None,
+        pinned_fleet_ids: Iterable[int] = (),
+    ) -> PlanningInputs:
+        """Region-wide inputs, shared by every workload planned in the config's region.
+
+        Planning many workloads loads inputs once per region instead of once
+        per fleet. Region-wide inputs forecast placement scores and load
+        interruption rates for the best-placed fleets only, so callers pass the
+        fleets their pinned workloads use as `pinned_fleet_ids` (all of them,
+        up front, to load once); those are always covered, and pinned workloads
+        plan as `plan` would from their own fleet's inputs. Region-wide
+        workloads planned from the same inputs see those fleets' data too.
+        """
+        scope = (
+            replace(config, fleet_id=None, availability_zone=None, fleet_target_capacity=None)
+            if config.region is not None
+            else config
+        )
+        return self.inputs_for(scope, now=now, until_epoch=until_epoch, pinned_fleet_ids=pinned_fleet_ids)
+
+    def _load_inputs(
+        self,
+        config: WorkloadConfig,
+        *,
+        now: datetime,
+        until_epoch: int | None,
+        pinned_fleet_ids: frozenset[int] = frozenset(),
+    ) -> PlanningInputs:
+        # Local import: keeps the planner usable offline with injected inputs.
+        from src.backend.data import availability_data
+
+        fleets = availability_data.get_cached_fleets() or availability_data.get_available_fleets()
+        if config.fleet_id is not None:
+            chosen = [f for f in fleets if f.id == config.fleet_id]
+        else:
+            chosen = [f for f in fleets if f.region == config.region]
+        region = config.region or next((f.region for f in chosen if f.region), None)
+        group_ids = [f.id for f in chosen]
+        pinned = [f for f in chosen if f.id in pinned_fleet_ids]
+
+        latest_scores: dict[int, list[PlacementScore]] = {}
+        availability: AvailabilityForecast | None = None
+        catalog: PoolCatalog | None = None
+        prices: list[SpotPrice] = []
+        rates: list[InterruptionRate] = []
+        carbon: CarbonForecast | None = None
+
+        # Every source is best-effort: a missing input degrades one objective
+        # (documented on `score`) rather than failing the whole plan.
+        try:
+            latest_scores = availability_data.get_fleet_placement_scores_bulk(
+                group_ids, az=config.availability_zone, target_capacity=config.fleet_target_capacity
+            )
+        except Exception:
+            pass
+
+        try:
+            availability = self._load_availability_forecast(
+                chosen, latest_scores, config, now=now, until_epoch=until_epoch, pinned=pinned
+            )
+        except Exception:
+            availability = None
+
+        try:
+            catalog = availability_data.get_pool_catalog()
+            catalog.ensure_loaded()
+        except Exception:
+            catalog = None
+
+        if region is not None:
+            try:
+                prices = availability_data.get_spot_prices(
+                    region=region,
+                    az=config.availability_zone,
+                    since=now - PRICE_HISTORY,
+                    until=now,
+                    limit=50_000,
+                )
+            except Exception:
+                prices = []
+            if catalog is not None:
+                rates = self._load_interruption_rates(chosen, catalog, region, now=now, pinned=pinned)
+            try:
+                from src.backend.data.forecasts.carbon_forecast import get_carbon_forecast
+
+                horizon = _MIN_FORECAST_HORIZON
+                if until_epoch is not None:
+                    horizon = max(horizon, timedelta(seconds=until_epoch - int(now.timestamp())))
+                carbon = get_carbon_forecast(region, start=now, horizon=horizon)
+            except Exception:
+                carbon = None
+
+        return PlanningInputs(
+            region=region,
+            fleets=tuple(chosen),
+            latest_scores=latest_scores,
+            carbon=carbon,
+            availability=availability,
+            catalog=catalog,
+            spot_prices=tuple(prices),
+            interruption_rates=tuple(rates),
+            carbon_version=carbon.version if carbon is not None else "",
+            availability_version=availability_version(latest_scores, availability, prices, rates),
+            loaded_at=self._clock(),
+            pinned_fleet_ids=frozenset(f.id for f in pinned),
+        )
+
+    def _load_availability_forecast(
+        self,
+        fleets: Sequence[RequestGroup],
+        latest_scores: dict[int, list[PlacementScore]],
+        config: WorkloadConfig,
+        *,
+        now: datetime,
+        until_epoch: int | None,
+        pinned: Sequence[RequestGroup] = (),
+    ) -> AvailabilityForecast | None:
+        from src.backend.data.availability_data import get_fleet_placement_score_frame
+        from src.backend.data.fleet.frames import PlacementScoreFrame
+        from src.backend.data.forecasts.availability_forecast import AvailabilityForecaster
+
+        # History requests are per fleet; forecast the best-placed fleets only,
+        # plus any pinned ones.
+        def _best(fleet: RequestGroup) -> float:
+            return max((s.score for s in latest_scores.get(fleet.id, ())), default=0.0)
+
+        ranked = sorted(fleets, key=_best, reverse=True)[:_MAX_FORECAST_FLEETS]
+        ranked += [fleet for fleet in pinned if fleet not in ranked]
+        rows_per_key = -(-PLACEMENT_HISTORY // _PLACEMENT_CADENCE) + 1
+        frames = [
+            get_fleet_placement_score_frame(
+                fleet.id,
+                since=now - PLACEMENT_HISTORY,
+                until=now,
+                az=config.availability_zone,
+                target_capacity=config.fleet_target_capacity,
+                limit=rows_per_key * (len(latest_scores.get(fleet.id, ())) or _DEFAULT_FLEET_KEYS),
+            )
+            for fleet in ranked
+        ]
+        frame = PlacementScoreFrame.concat(frames)
+        if not len(frame):
+            return None
+        horizon = _MIN_FORECAST_HORIZON
+        if until_epoch is not None:
+            horizon = max(horizon, timedelta(seconds=until_epoch - int(now.timestamp())))
+        return AvailabilityForecaster().fit(frame).forecast(start=now, horizon=horizon, step=self.slot)
+
+    def _load_interruption_rates(
+        self,
+        fleets: Sequence[RequestGroup],
+        catalog: PoolCatalog,
+        region: str,
+        *,
+        now: datetime,
+        pinned: Sequence[RequestGroup] = (),
+    ) -> list[InterruptionRate]:
+        from src.backend.data.availability_data import get_pool_interruption_rates
+
+        def _pool_ids(fleets: Sequence[RequestGroup]) -> list[int]:
+            pool_ids: list[int] = []
+            for fleet in fleets:
+                if not fleet.instance_types:
+                    continue
+                for pools in catalog.find_for_instance_types(region, fleet.instance_types).values():
+                    pool_ids.extend(p.id for p in pools)
+            return list(dict.fromkeys(pool_ids))
+
+        # Pinned fleets' pools are loaded on top of the cap.
+        pool_ids = _pool_ids(fleets)[:_MAX_RATE_POOLS]
+        pool_ids += [p for p in _pool_ids(pinned) if p not in pool_ids]
+        rates: list[InterruptionRate] = []
+        for pool_id in pool_ids:
+            try:
+                rates.extend(
+                    get_pool_interruption_rates(pool_id, since=now - RATE_HISTORY, until=now)
+                )
+            except Exception:
+                continue
+        return rates
+
+    # --- Scoring ---
+    def score(
+        self,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        *,
+        now: datetime,
+        tables: ScoringTables | None = None,
+    ) -> ScoredCandidates:
+        """Score every candidate of a draft on carbon, cost and risk.
+
+        Missing inputs degrade gracefully: without a carbon forecast the carbon
+        objective is constant, without any priced pool the cost objective is
+        constant (otherwise options of unpriced fleets are dropped), and without
+        interruption or placement data risk falls back to neutral values.
+        """
+        space = self.build_space(config, inputs, now=now)
+        model = ScoringModel.build(space, inputs, power_kw=self.instance_power_kw, tables=tables)
+        return ScoredCandidates.score(model, chunk_size=self.chunk_size)
+
+    def build_space(self, config: WorkloadConfig, inputs: PlanningInputs, *, now: datetime) -> CandidateSpace:
+        """Candidate space for a draft under the given inputs."""
+        return build_candidate_space(
+            config,
+            fleets=inputs.fleets,
+            latest_scores=inputs.latest_scores,
+            now=now,
+            slot=self.slot,
+            score_floor=self.score_floor,
+        )
+
+    def _empty_schedule(
+        self,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        reason: str,
+        *,
+        candidates_evaluated: int = 0,
+        risk_mode: RiskMode | None = None,
+    ) -> Schedule:
+        return Schedule(
+            config_id=config.config_id,
+            generated_at=datetime.now(tz=timezone.utc),
+            chosen=None,
+            candidates_evaluated=candidates_evaluated,
+            carbon_version=inputs.carbon_version,
+            availability_version=inputs.availability_version,
+            infeasible_reason=reason,
+            risk_mode=risk_mode,
+        )
+
+    def mode_weights(self, risk_mode: RiskMode) -> np.ndarray:
+        """Compromise weights for (carbon, cost, risk) under a risk mode."""
+        return np.asarray(self.weights) * np.asarray(RISK_PROFILES[risk_mode].weights)
+
+    def ranked_candidates(
+        self,
+        config: WorkloadConfig,
+        scored: ScoredCandidates,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Apply a risk mode to scored candidates.
+
+        Candidates starting before `now` are never eligible. If the mode's
+        thresholds exclude every remaining candidate they are dropped, so there
+        is still something to rank (by the mode's weights and penalties);
+        `rank` then marks the schedule `thresholds_relaxed`.
+
+        Returns:
+            (ranking objectives of shape (space.size, 3), eligible flat indexes).
+        """
+        space = scored.model.space
+        ranked, eligible = RISK_PROFILES[risk_mode].apply(
+            scored.objectives,
+            scored.placement,
+            deadline_slack_seconds(space, config.deadline_at),
+            space.runtime_seconds,
+        )
+        # Flat indexes are slot-major, so not-yet-started candidates are a suffix.
+        first_slot = max(-(-(int(now.timestamp()) - space.first_start) // space.step), 0)
+        first_flat = min(first_slot * space.n_options, space.size)
+        eligible[:first_flat] = False
+        candidates = np.flatnonzero(eligible)
+        if candidates.size == 0:
+            candidates = np.arange(first_flat, space.size, dtype=np.int64)
+        return ranked, candidates
+
+    def pareto_candidates(
+        self,
+        config: WorkloadConfig,
+        scored: ScoredCandidates,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Pareto front of the eligible candidates under a risk mode.
+
+        Returns:
+            (ranking objectives of shape (space.size, 3), front flat indexes).
+        """
+        ranked, candidates = self.ranked_candidates(config, scored, risk_mode, now=now)
+        step = self.chunk_size
+        index, _ = running_front(
+            (candidates[i : i + step], ranked[candidates[i : i + step]])
+            for i in range(0, candidates.size, step)
+        )
+        return ranked, index
+
+    def rank(
+        self,
+        config: WorkloadConfig,
+        inputs: PlanningInputs,
+        scored: ScoredCandidates,
+        risk_mode: RiskMode,
+        *,
+        now: datetime,
+        pareto: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> Schedule:
+        """Pick a plan from scored candidates under a risk mode.
+
+        Eligibility follows `ranked_candidates`, so a plan is returned whenever
+        any candidate can still start.
+
+        Args:
+            config: The draft being planned.
+            inputs: Inputs the candidates were scored with (for versions).
+            scored: Objectives of every candidate of the draft's space.
+            risk_mode: Profile to rank with.
+            now: Reference time.
+            pareto: `pareto_candidates` for the same arguments, if already
+                computed. Only the compromise weights then differ between calls.
+
+        Returns:
+            Schedule
+        """
+        space = scored.model.space
+        if space.size == 0:
+            reason = (
+                "No fleet meets the placement score floor."
+                if space.skipped_fleet_ids
+                else "No fleet matches the selected region or fleet."
+            )
+            return self._empty_schedule(config, inputs, reason, risk_mode=risk_mode)
+
+        ranked, index = pareto or self.pareto_candidates(config, scored, risk_mode, now=now)
+        selection = select_pareto(
+            ranked[index], objective_names=PLAN_OBJECTIVES, weights=self.mode_weights(risk_mode)
+        )
+        if selection.chosen is None:
+            return self._empty_schedule(
+                config,
+                inputs,
+                "No candidate could be scored with the available data.",
+                candidates_evaluated=space.size,
+                risk_mode=risk_mode,
+            )
+
+        front = selection.front
+        if front.shape[0] > self.max_front_size:
+            # Evenly spaced along the carbon ordering, always including the pick.
+            picks = np.linspace(0, front.shape[0] - 1, self.max_front_size).round().astype(np.int64)
+            front = np.union1d(front[picks], [selection.chosen])
+            front = front[np.argsort(ranked[index[front], 0], kind="stable")]
+
+        # Options report the unpenalised objectives.
+        flat = index[front]
+        options = scored.model.plan_options(space.take(flat), scored.objectives[flat])
+        chosen_pos = int(np.flatnonzero(front == selection.chosen)[0])
+        # The front is drawn from the eligible candidates unless there were none.
+        pick = index[selection.chosen : selection.chosen + 1]
+        _, eligible = RISK_PROFILES[risk_mode].apply(
+            scored.objectives[pick],
+            scored.placement[pick],
+            deadline_slack_seconds(space, config.deadline_at)[pick],
+            space.runtime_seconds,
+        )
+        return Schedule(
+            config_id=config.config_id,
+            generated_at=datetime.now(tz=timezone.utc),
+            chosen=options[chosen_pos],
+            front=options,
+            candidates_evaluated=space.size,
+            carbon_version=inputs.carbon_version,
+            availability_version=inputs.availability_version,
+            risk_mode=risk_mode,
+            thresholds_relaxed=not bool(eligible[0]),
+        )
+
+
+def running_front(
+    batches: Iterable[tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pareto front of (index, objectives) batches, keeping only the front in memory.
+
+    The front of a union is the front of the per-batch fronts, so each batch is
+    merged into the current front and everything dominated is dropped.
+    """
+    kept_index = np.empty(0, dtype=np.int64)
+    kept_obj = np.empty((0, len(PLAN_OBJECTIVES)))
+    for index, obj in batches:
+        index = np.concatenate([kept_index, index])
+        obj = np.vstack([kept_obj, obj])
+        mask = pareto_front_mask(obj)
+        kept_index, kept_obj = index[mask], obj[mask]
+    return kept_index, kept_obj
+
+
+def _even_mix(
+    fleet: RequestGroup,
+    catalog: PoolCatalog,
+    row_by_pool: dict[int, int],
+    n_pools: int,
+    az: str | None,
+) -> np.ndarray:
+    """Per-instance pool weights: even across instance types, then across AZ pools."""
+    weights = np.zeros(n_pools)
+    if not fleet.region or not fleet.instance_types:
+        return weights
+    per_type = [
+        [row_by_pool[p.id] for p in pools if p.id in row_by_pool]
+        for pools in catalog.find_for_instance_types(fleet.region, fleet.instance_types, az=az).values()
+    ]
+    per_type = [rows for rows in per_type if rows]
+    for rows in per_type:
+        weights[rows] += 1.0 / (len(per_type) * len(rows))
+    return weights
+
+
+def _forecast_rows(space: CandidateSpace, forecast: AvailabilityForecast | None) -> np.ndarray:
+    """Forecast row of each option (-1 when the forecast has no such key)."""
+    out = np.full(space.n_options, -1, dtype=np.int64)
+    if forecast is None or not len(forecast):
+        return out
+    rows = {
+        (int(g), a, int(c)): k
+        for k, (g, a, c) in enumerate(
+            zip(forecast.group_id, forecast.availability_zone, forecast.target_capacity)
+        )
+    }
+    for i in range(space.n_options):
+        az = space.availability_zone[i]
+        if az is not None:
+            out[i] = rows.get((int(space.fleet_id[i]), az, int(space.target_capacity[i])), -1)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringTables:
+    """Engines built from planning inputs on one grid.
+
+    Building them (prices and rates onto the grid) dominates scoring cost, so
+    workloads planned together from the same inputs share one set.
+    """
+
+    grid: TimeGrid
+    carbon: CarbonIntensityEngine
+    cost: SpotCostEngine | None
+    survival: InterruptionSurvivalEngine | None
+    # (fleet id, AZ) -> (cost prefix row, priced, hazard prefix row), filled by
+    # `option_prefixes` so workloads sharing the tables build each row once.
+    prefix_rows: dict[tuple[int, str | None], tuple[np.ndarray | None, bool, np.ndarray | None]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def build(cls, inputs: PlanningInputs, grid: TimeGrid) -> ScoringTables:
+        carbon = CarbonIntensityEngine.from_series(
+            inputs.carbon.series if inputs.carbon is not None else None, grid
+        )
+        cost = SpotCostEngine.from_history(inputs.spot_prices, grid) if inputs.spot_prices else None
+        survival = (
+            InterruptionSurvivalEngine.from_history(inputs.interruption_rates, grid)
+            if inputs.interruption_rates
+            else None
+        )
+        return cls(grid=grid, carbon=carbon, cost=cost, survival=survival)
+
+    def covers(self, start: int, end: int) -> bool:
+        return self.grid.start <= start and end <= self.grid.end
+
+    def option_prefixes(
+        self,
+        pairs: Sequence[tuple[RequestGroup, str | None]],
+        catalog: PoolCatalog | None,
+    ) -> tuple[np.ndarray | None, np.ndarray, np.ndarray | None]:
+        """Per-instance prefix integrals for (fleet, AZ) pairs.
+
+        Rows are memoised per (fleet, AZ), so the tables must only ever be used
+        with the catalog of the inputs they were built from.
+
+        Args:
+            pairs: Fleets with an optional AZ restriction, one row each.
+            catalog: Pool catalog mapping fleets to pools (None: no prefixes).
+
+        Returns:
+            (cost prefix in $ of shape (pairs, grid.size + 1) or None, whether
+            each pair has priced pools, cumulative hazard prefix or None).
+        """
+        has_cost = catalog is not None and self.cost is not None
+        has_hazard = catalog is not None and self.survival is not None
+        missing = list(
+            {
+                (fleet.id, az): (fleet, az)
+                for fleet, az in pairs
+                if (fleet.id, az) not in self.prefix_rows
+            }.values()
+        )
+        if missing:
+            cost_rows: np.ndarray | None = None
+            hazard_rows: np.ndarray | None = None
+            if has_cost:
+                engine = self.cost
+                mix = np.zeros((len(missing), len(engine.pool_ids)))
+                for row, (fleet, az) in enumerate(missing):
+                    mix[row] = engine.fleet_mix([fleet], catalog, az=az)[0]
+                cost_known = mix.sum(axis=1) > 0
+                cost_rows = engine.fleet_cumulative_cost(mix)
+            if has_hazard:
+                survival = self.survival
+                row_by_pool = {int(pid): i for i, pid in enumerate(survival.pool_ids)}
+                mix = np.zeros((len(missing), len(survival.pool_ids)))
+                for row, (fleet, az) in enumerate(missing):
+                    mix[row] = _even_mix(fleet, catalog, row_by_pool, len(survival.pool_ids), az)
+                hazard_rows = mix @ survival.cumulative_hazard
+            for row, (fleet, az) in enumerate(missing):
+                self.prefix_rows[fleet.id, az] = (
+                    cost_rows[row] if cost_rows is not None else None,
+                    bool(cost_known[row]) if cost_rows is not None else False,
+                    hazard_rows[row] if hazard_rows is not None else None,
+                )
+
+        rows = [self.prefix_rows[fleet.id, az] for fleet, az in pairs]
+        width = self.grid.size + 1
+        cost_prefix = (
+            np.array([r[0] for r in rows]).reshape(len(rows), width) if has_cost else None
+        )
+        cost_known = np.array([r[1] for r in rows], dtype=bool)
+        hazard_prefix = (
+            np.array([r[2] for r in rows]).reshape(len(rows), width) if has_hazard else None
+        )
+        return cost_prefix, cost_known, hazard_prefix
+
+
+@dataclass(slots=True)
+class ScoringModel:
+    """Per-option lookup tables over a candidate space's time grid.
+
+    Each objective is a separate column method, so callers that only see one
+    input change (e.g. a new carbon forecast) can recompute just that column.
+    """
+
+    space: CandidateSpace
+    grid: TimeGrid
+    power_kw: float
+    carbon: CarbonIntensityEngine
+    option_pair: np.ndarray  # option -> (fleet, AZ) row
+    cost_prefix: np.ndarray | None  # (pairs, grid.size + 1) $/instance
+    cost_known: np.ndarray  # (pairs,)
+    hazard_prefix: np.ndarray | None  # (pairs, grid.size + 1)
+    forecast: AvailabilityForecast | None
+    option_forecast_row: np.ndarray  # option -> forecast row, -1 if none
+
+    @classmethod
+    def build(
+        cls,
+        space: CandidateSpace,
+        inputs: PlanningInputs,
+        *,
+        power_kw: float,
+        tables: ScoringTables | None = None,
+    ) -> ScoringModel:
+        """Build lookup tables for a space.
+
+        Args:
+            space: Candidate space to score.
+            inputs: Planning inputs the space was built from.
+            power_kw: Assumed draw per instance.
+            tables: Engines built from `inputs` on a grid covering the space
+                (e.g. shared by a batch of workloads); built for the space if
+                None or not covering.
+        """
+        step = space.step
+        end = space.last_start + space.runtime_seconds
+        if tables is None or not tables.covers(space.first_start, end):
+            tables = ScoringTables.build(
+                inputs,
+                TimeGrid(
+                    start=space.first_start,
+                    step=step,
+                    size=max(-(-(end - space.first_start) // step), 1),
+                ),
+            )
+        grid = tables.grid
+        carbon = tables.carbon
+
+        pairs: dict[tuple[int, str | None], int] = {}
+        option_pair = np.empty(space.n_options, dtype=np.int64)
+        for i, (fid, az) in enumerate(zip(space.fleet_id.tolist(), space.availability_zone.tolist())):
+            option_pair[i] = pairs.setdefault((fid, az), len(pairs))
+        fleets = {f.id: f for f in space.fleets}
+        cost_prefix, cost_known, hazard_prefix = tables.option_prefixes(
+            [(fleets[fid], az) for fid, az in pairs], inputs.catalog
+        )
+
+        return cls(
+            space=space,
+            grid=grid,
+            power_kw=power_kw,
+            carbon=carbon,
+            option_pair=option_pair,
+            cost_prefix=cost_prefix,
+            cost_known=cost_known,
+            hazard_prefix=hazard_prefix,
+            forecast=inputs.availability,
+            option_forecast_row=_forecast_rows(space, inputs.availability),
+        )
+
+    def with_carbon(self, forecast: CarbonForecast | None) -> ScoringModel:
+        """Copy with a different carbon forecast (other tables are shared)."""
+        series = forecast.series if forecast is not None else None
+        return replace(self, carbon=CarbonIntensityEngine.from_series(series, self.grid))
+
+    def with_availability(self, forecast: AvailabilityForecast | None) -> ScoringModel:
+        """Copy with a different placement-score forecast (other tables are shared)."""
+        return replace(self, forecast=forecast, option_forecast_row=_forecast_rows(self.space, forecast))
+
+    @property
+    def has_cost(self) -> bool:
+        return self.cost_prefix is not None and bool(self.cost_known.any())
+
+    def placement_score(self, chunk: CandidateChunk) -> np.ndarray:
+        """Forecast placement score at each start (latest score, then neutral, as fallback)."""
+        score = chunk.placement_score.astype(np.float64, copy=True)
+        rows = self.option_forecast_row[chunk.option]
+        if self.forecast is not None:
+            has_row = rows >= 0
+            if has_row.any():
+                times = self.forecast.epoch_seconds
+                t = np.searchsorted(times, chunk.start_epoch[has_row], side="right") - 1
+                t = np.clip(t, 0, times.shape[0] - 1)
+                score[has_row] = self.forecast.mean[rows[has_row], t]
+        return np.where(np.isnan(score), _NEUTRAL_PLACEMENT_SCORE, score)
+
+    # --- Objective columns ---
+    def carbon_objective(self, chunk: CandidateChunk) -> np.ndarray:
+        """Grams of CO₂ (zeros without a carbon forecast)."""
+        if not self.carbon.has_data:
+            return np.zeros(len(chunk))
+        capacity = chunk.target_capacity.astype(np.float64)
+        return self.carbon.emissions(chunk.start_epoch, self.space.runtime_seconds, capacity, self.power_kw)
+
+    def _pair_window(self, prefix: np.ndarray, chunk: CandidateChunk) -> np.ndarray:
+        """Per-instance integral of a (pair, grid) prefix over each candidate's run.
+
+        The integral depends only on the (fleet, AZ) pair and the start slot, so
+        when the chunk covers few slots it is evaluated once per (slot, pair) and
+        shared by every capacity option.
+        """
+        space = self.space
+        pair = self.option_pair[chunk.option]
+        runtime = space.runtime_seconds
+        n_pairs = prefix.shape[0]
+        slot = (chunk.start_epoch - space.first_start) // space.step
+        if len(chunk) == 0:
+            return np.empty(0)
+        lo, hi = int(slot.min()), int(slot.max())
+        if (hi - lo + 1) * n_pairs >= len(chunk):
+            return window_integral(prefix, self.grid, chunk.start_epoch, runtime, rows=pair)
+        starts = space.first_start + space.step * np.arange(lo, hi + 1, dtype=np.int64)
+        table = window_integral(
+            prefix,
+            self.grid,
+            starts[:, None],
+            runtime,
+            rows=np.arange(n_pairs, dtype=np.int64)[None, :],
+        )
+        return table[slot - lo, pair]
+
+    def cost_objective(self, chunk: CandidateChunk) -> np.ndarray:
+        """Dollars (zeros without prices; NaN for options without priced pools)."""
+        if not self.has_cost:
+            return np.zeros(len(chunk))
+        assert self.cost_prefix is not None
+        pair = self.option_pair[chunk.option]
+        per_instance = self._pair_window(self.cost_prefix, chunk)
+        return np.where(self.cost_known[pair], per_instance * chunk.target_capacity, np.nan)
+
+    def risk_objective(self, chunk: CandidateChunk) -> np.ndarray:
+        """P(not placed or interrupted during the run)."""
+        survival = np.ones(len(chunk))
+        if self.hazard_prefix is not None:
+            h = self._pair_window(self.hazard_prefix, chunk)
+            survival = np.exp(-chunk.target_capacity * h)
+        placed = np.clip(self.placement_score(chunk) / SCORE_MAX, 0.0, 1.0)
+        return 1.0 - survival * placed
+
+    def objectives(self, chunk: CandidateChunk) -> np.ndarray:
+        """(carbon g, cost $, risk) for every candidate of a chunk, shape (n, 3)."""
+        return np.column_stack(
+            [self.carbon_objective(chunk), self.cost_objective(chunk), self.risk_objective(chunk)]
+        )
+
+    def plan_options(self, chunk: CandidateChunk, objectives: np.ndarray) -> list[PlanOption]:
+        runtime = self.space.runtime_seconds
+        mean_ci = self.carbon.mean_intensity(chunk.start_epoch, runtime)
+        scores = self.placement_score(chunk)
+        has_cost = self.has_cost
+        options: list[PlanOption] = []
+        for i in range(len(chunk)):
+            start = int(chunk.start_epoch[i])
+            az = chunk.availability_zone[i]
+            options.append(
+                PlanOption(
+                    start_at=datetime.fromtimestamp(start, tz=timezone.utc),
+                    end_at=datetime.fromtimestamp(start + runtime, tz=timezone.utc),
+                    fleet_id=int(chunk.fleet_id[i]),
+                    target_capacity=int(chunk.target_capacity[i]),
+                    availability_zone=str(az) if az is not None else None,
+                    carbon_g=float(objectives[i, 0]) if self.carbon.has_data else None,
+                    cost_usd=float(objectives[i, 1]) if has_cost else None,
+                    interruption_risk=float(objectives[i, 2]),
+                    mean_carbon_intensity=(
+                        float(mean_ci[i]) if np.isfinite(mean_ci[i]) else None
+                    ),
+                    placement_score=float(scores[i]),
+                )
+            )
+        return options
+
+
+@dataclass(frozen=True, slots=True)
+class ScoredCandidates:
+    """Objectives of every candidate of a space, kept for re-ranking.
+
+    Rows are flat candidate indexes. Risk modes only re-rank these arrays, and
+    forecast updates only rewrite the column they feed.
+    """
+
+    model: ScoringModel
+    objectives: np.ndarray  # (space.size, 3): carbon g, cost $, risk
+    placement: np.ndarray  # (space.size,) placement score at the start
+
+    @classmethod
+    def score(cls, model: ScoringModel, *, chunk_size: int) -> ScoredCandidates:
+        space = model.space
+        objectives = np.empty((space.size, len(PLAN_OBJECTIVES)))
+        placement = np.empty(space.size)
+        for chunk in space.chunks(chunk_size):
+            objectives[chunk.flat_index] = model.objectives(chunk)
+            placement[chunk.flat_index] = model.placement_score(chunk)
+        return cls(model=model, objectives=objectives, placement=placement)
+
+
+# Process-wide scheduler, built on first use (see `get_scheduler`).
+_scheduler: Scheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Return the shared scheduler (its plan cache is shared by all screens)."""
+    global _scheduler
+    scheduler = _scheduler
+    if scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = Scheduler()
+            scheduler = _scheduler
+    return scheduler
@@ -0,0 +1,295 @@
+"""Split (checkpointed) execution planning for interruptible workloads.
+
+An interruptible workload can checkpoint, stop and resume later, so it may run
+in several low-carbon intervals instead of one contiguous window. Every resume
+pays a checkpoint overhead (restoring state, warming up) that costs carbon but
+does no work, and intervals shorter than a minimum chunk length are not worth
+starting.
+
+`split_intervals` is a dynamic program over the discretised carbon grid. At
+each slot boundary the state is (intervals used, work slots done), either idle
+or running with the current interval's age (capped at the longer of the
+minimum chunk and the overhead). Each slot updates every state at once with
+array operations, so the loop is over slots × ages and the work per step is
+chunks × work slots. Backpointers recover the chosen intervals.
+
+`SplitPlanner` wraps it around a regular plan: the placement (fleet, AZ,
+capacity) comes from `Scheduler.plan`, and the split replaces the chosen plan
+only if it actually uses more than one interval.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.backend.scheduling.candidates import start_window
+from src.backend.scheduling.carbon_model import CarbonIntensityEngine
+from src.backend.scheduling.risk_modes import RiskMode
+from src.backend.scheduling.scheduler import Scheduler, get_scheduler
+from src.backend.scheduling.time_grid import TimeGrid, to_epoch_seconds
+from src.config.defaults import DEFAULT_SPLIT_MAX_CHUNKS
+from src.models.schedule import PlanOption, PlanSegment, Schedule
+from src.models.workload_config import WorkloadConfig
+
+_SECONDS_PER_HOUR = 3600.0
+
+# Added per slot index so that, between equal-carbon plans, earlier slots win.
+_EARLIER_TIE_BREAK = 1e-9
+
+
+def _advance(values: np.ndarray, gain: np.ndarray, fill: float | bool) -> np.ndarray:
+    """Move states with `gain` one work slot forward (axis 1); overflow is dropped.
+
+    Args:
+        values: Per-state values, shape (chunks + 1, work + 1).
+        gain: Whether the slot does work, per chunk row, shape (chunks + 1,).
+        fill: Value for states nothing moves into.
+    """
+    shifted = np.full_like(values, fill)
+    shifted[:, 1:] = values[:, :-1]
+    return np.where(gain[:, None], shifted, values)
+
+
+def split_intervals(
+    slot_cost: np.ndarray,
+    *,
+    work_slots: int,
+    min_chunk_slots: int,
+    overhead_slots: int,
+    max_chunks: int,
+    latest_first_slot: int | None = None,
+) -> list[tuple[int, int]] | None:
+    """Cheapest set of disjoint run intervals that completes the work.
+
+    The first interval does work from its first slot; every later one spends
+    its first `overhead_slots` restoring the checkpoint. Every interval is at
+    least `min_chunk_slots` long unless it finishes the work.
+
+    Args:
+        slot_cost: Cost of running during each slot, shape (slots,).
+        work_slots: Slots of work to complete.
+        min_chunk_slots: Minimum interval length.
+        overhead_slots: Non-working slots at the start of each resumed interval.
+        max_chunks: Most intervals to use.
+        latest_first_slot: Last slot the first interval may start at (None:
+            any); later intervals may use every slot.
+
+    Returns:
+        [(first slot, end slot exclusive), ...] in order, or None if the work
+        cannot be completed within the slots.
+    """
+    n_slots = int(slot_cost.shape[0])
+    W, K = int(work_slots), max(int(max_chunks), 1)
+    L, o = max(int(min_chunk_slots), 1), max(int(overhead_slots), 0)
+    if W <= 0:
+        return []
+    # Ages at or above A behave the same (long enough to stop, past the
+    # overhead), so they share one state. A >= 2 keeps "just started" distinct.
+    A = max(L, o + 1, 2)
+
+    gain = np.ones((K + 1, A + 1), dtype=bool)
+    gain[2:, 1 : o + 1] = False
+    can_stop = np.zeros((W + 1, A), dtype=bool)  # columns are ages 1..A
+    can_stop[:, L - 1 :] = True
+    can_stop[W, :] = True
+
+    idle = np.full((K + 1, W + 1), np.inf)
+    idle[0, 0] = 0.0
+    run = np.full((K + 1, W + 1, A + 1), np.inf)
+    # Backpointers: age a run stopped at each boundary (0: was idle), and
+    # whether the capped age came from itself rather than from age A - 1.
+    stopped_at_age = np.zeros((n_slots + 1, K + 1, W + 1), dtype=np.int32)
+    kept_saturated = np.zeros((n_slots, K + 1, W + 1), dtype=bool)
+
+    for t in range(n_slots + 1):
+        stoppable = np.where(can_stop, run[:, :, 1:], np.inf)
+        age = np.argmin(stoppable, axis=2)
+        best = np.take_along_axis(stoppable, age[:, :, None], axis=2)[:, :, 0]
+        stop = best < idle
+        idle = np.where(stop, best, idle)
+        stopped_at_age[t] = np.where(stop, age + 1, 0)
+        if t == n_slots:
+            break
+
+        cost = float(slot_cost[t])
+        new_run = np.full_like(run, np.inf)
+        starting = np.full_like(idle, np.inf)
+        starting[1:] = idle[:-1]
+        if latest_first_slot is not None and t > latest_first_slot:
+            # Too late to start: only resumed intervals may begin here.
+            starting[1] = np.inf
+        new_run[:, :, 1] = _advance(starting, gain[:, 1], np.inf) + cost
+        for a in range(2, A + 1):
+            source = run[:, :, a - 1]
+            if a == A:
+                saturated = run[:, :, A] < source
+                source = np.where(saturated, run[:, :, A], source)
+                kept_saturated[t] = _advance(saturated, gain[:, A], False)
+            new_run[:, :, a] = _advance(source, gain[:, a], np.inf) + cost
+        run = new_run
+
+    totals = idle[:, W]
+    k = int(np.argmin(totals))
+    if not np.isfinite(totals[k]):
+        return None
+
+    intervals: list[tuple[int, int]] = []
+    t, w, a, end = n_slots, W, 0, 0
+    while t > 0 or a > 0:
+        if a == 0:
+            a = int(stopped_at_age[t, k, w])
+            if a > 0:
+                end = t
+            else:
+                t -= 1
+            continue
+        prev_w = w - int(gain[k, a])
+        if a == 1:
+            intervals.append((t - 1, end))
+            k, a = k - 1, 0
+        elif a == A and kept_saturated[t - 1, k, w]:
+            a = A
+        else:
+            a -= 1
+        w, t = prev_w, t - 1
+    intervals.reverse()
+
+    merged: list[tuple[int, int]] = []
+    for first, last in intervals:
+        if merged and merged[-1][1] == first:
+            merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+class SplitPlanner:
+    """Plans interruptible workloads as several checkpointed run intervals."""
+
+    def __init__(
+        self,
+        scheduler: Scheduler | None = None,
+        *,
+        max_chunks: int = DEFAULT_SPLIT_MAX_CHUNKS,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            scheduler: Scheduler used for placement and inputs (defaults to the
+                shared one); its slot is the split grid resolution.
+            max_chunks: Most run intervals per plan.
+        """
+        self.scheduler = scheduler or get_scheduler()
+        self.max_chunks = max_chunks
+
+    def plan(
+        self,
+        config: WorkloadConfig,
+        *,
+        checkpoint_overhead: timedelta,
+        min_chunk: timedelta,
+        now: datetime | None = None,
+        risk_mode: RiskMode | None = None,
+    ) -> Schedule:
+        """Plan a workload, splitting its run when that lowers carbon.
+
+        The first interval starts within the workload's start window (its delay
+        tolerance), like the contiguous plan; later intervals may run up to the
+        deadline.
+
+        Args:
+            config: Interruptible workload draft.
+            checkpoint_overhead: Time each resumed interval spends restoring
+                before doing work.
+            min_chunk: Shortest interval worth starting.
+            now: Reference time (defaults to now).
+            risk_mode: Risk mode for the placement plan.
+
+        Returns:
+            The regular plan, with a split plan chosen (and added to the
+            front) when more than one interval is cheaper in carbon.
+        """
+        if not config.interruptible:
+            raise ValueError("Only interruptible workloads can be split")
+        now = now or datetime.now(tz=timezone.utc)
+        base = self.scheduler.plan(config, now=now, risk_mode=risk_mode)
+        window = start_window(config, now=now)
+        if base.chosen is None or window is None:
+            return base
+
+        runtime = int(config.runtime_estimate_seconds or 0)
+        earliest = window[0]
+        latest_end = (
+            to_epoch_seconds(config.deadline_at) if config.deadline_at is not None else window[1] + runtime
+        )
+        step = int(self.scheduler.slot.total_seconds())
+        grid = TimeGrid(start=earliest, step=step, size=max((latest_end - earliest) // step, 1))
+
+        inputs = self.scheduler.inputs_for(config, now=now, until_epoch=latest_end)
+        series = inputs.carbon.series if inputs.carbon is not None else None
+        engine = CarbonIntensityEngine.from_series(series, grid)
+        if not engine.has_data:
+            # Nothing to minimise: every split costs the same as the plan.
+            return base
+        intensity = np.where(np.isfinite(engine.intensity), engine.intensity, np.nanmean(engine.intensity))
+
+        chosen = base.chosen
+        capacity = float(chosen.target_capacity)
+        power_kw = self.scheduler.instance_power_kw
+        slot_cost = intensity * capacity * power_kw * (step / _SECONDS_PER_HOUR)
+        slot_cost = slot_cost + _EARLIER_TIE_BREAK * np.arange(1, grid.size + 1)
+
+        work_slots = -(-runtime // step)
+        intervals = split_intervals(
+            slot_cost,
+            work_slots=work_slots,
+            min_chunk_slots=math.ceil(min_chunk.total_seconds() / step),
+            overhead_slots=math.ceil(checkpoint_overhead.total_seconds() / step),
+            max_chunks=self.max_chunks,
+            # The first interval starts within the delay tolerance, like the
+            # contiguous plan; later ones only have to finish by the deadline.
+            latest_first_slot=(window[1] - earliest) // step,
+        )
+        if intervals is None or len(intervals) < 2:
+            return base
+
+        starts = np.array([grid.start + first * step for first, _ in intervals], dtype=np.int64)
+        ends = np.array([grid.start + last * step for _, last in intervals], dtype=np.int64)
+        # The work is rounded up to whole slots; the last interval ends when it is done.
+        ends[-1] -= work_slots * step - runtime
+        durations = ends - starts
+        carbon = engine.emissions(starts, durations, np.full(len(intervals), capacity), power_kw)
+        mean_ci = engine.mean_intensity(starts, durations)
+        segments = tuple(
+            PlanSegment(
+                start_at=datetime.fromtimestamp(int(s), tz=timezone.utc),
+                end_at=datetime.fromtimestamp(int(e), tz=timezone.utc),
+                carbon_g=float(g),
+                mean_carbon_intensity=float(ci),
+            )
+            for s, e, g, ci in zip(starts, ends, carbon, mean_ci)
+        )
+        total_carbon = float(carbon.sum())
+        split = PlanOption(
+            start_at=segments[0].start_at,
+            end_at=segments[-1].end_at,
+            fleet_id=chosen.fleet_id,
+            target_capacity=chosen.target_capacity,
+            availability_zone=chosen.availability_zone,
+            carbon_g=total_carbon,
+            # Cost and interruption risk are scored for contiguous runs only.
+            cost_usd=None,
+            interruption_risk=None,
+            mean_carbon_intensity=float((mean_ci * durations).sum() / durations.sum()),
+            placement_score=None,
+            segments=segments,
+        )
+        front = sorted(
+            [split, *base.front],
+            key=lambda option: option.carbon_g if option.carbon_g is not None else math.inf,
+        )
+        return replace(base, chosen=split, front=front)
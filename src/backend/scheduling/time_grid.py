@@ -0,0 +1,178 @@
+"""Regular time grids and step-function integrals shared by scoring engines.
+
+Scoring engines (interruption risk, cost, carbon) resample irregular upstream
+series onto one regular grid and keep prefix integrals, so "integral of X over
+[start, start + duration)" is two array lookups plus a linear interpolation
+inside the boundary slots, for any number of candidates at once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+
+def to_epoch_seconds(dt: datetime) -> int:
+    """Convert a datetime to integer epoch seconds (naive values are treated as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+@dataclass(frozen=True, slots=True)
+class TimeGrid:
+    """`size` slots of `step` seconds starting at epoch second `start`."""
+
+    start: int
+    step: int
+    size: int
+
+    @classmethod
+    def covering(cls, start: datetime, end: datetime, step: timedelta) -> TimeGrid:
+        """Smallest grid aligned to `step` that covers [start, end)."""
+        step_s = int(step.total_seconds())
+        if step_s <= 0:
+            raise ValueError("step must be positive")
+        t0 = (to_epoch_seconds(start) // step_s) * step_s
+        t1 = to_epoch_seconds(end)
+        size = max(-(-(t1 - t0) // step_s), 1)
+        return cls(start=t0, step=step_s, size=int(size))
+
+    @property
+    def end(self) -> int:
+        return self.start + self.step * self.size
+
+    def slot_starts(self) -> np.ndarray:
+        return self.start + self.step * np.arange(self.size, dtype=np.int64)
+
+    def edges(self) -> np.ndarray:
+        return self.start + self.step * np.arange(self.size + 1, dtype=np.int64)
+
+    def slot_index(self, epoch_seconds: np.ndarray | int) -> np.ndarray:
+        """Slot containing each timestamp, clipped to the grid."""
+        idx = (np.asarray(epoch_seconds, dtype=np.int64) - self.start) // self.step
+        return np.clip(idx, 0, self.size - 1)
+
+
+def step_function_on_grid(
+    times: np.ndarray,
+    values: np.ndarray,
+    grid: TimeGrid,
+    *,
+    extend: np.ndarray | None = None,
+) -> np.ndarray:
+    """Sample a last-observation-carried-forward step function at each slot start.
+
+    Args:
+        times: Observation epoch seconds (any order).
+        values: Observation values.
+        grid: Target grid.
+        extend: Optional per-slot values used after the last observation (e.g. a
+            forecast). Without it the last observed value is held.
+
+    Returns:
+        Array of shape (grid.size,). Slots before the first observation take the
+        first observed value; an empty series yields NaN.
+    """
+    out = np.full(grid.size, np.nan)
+    if times.size == 0:
+        if extend is not None:
+            out[:] = extend
+        return out
+
+    order = np.argsort(times, kind="stable")
+    t_sorted = np.asarray(times, dtype=np.int64)[order]
+    v_sorted = np.asarray(values, dtype=np.float64)[order]
+    starts = grid.slot_starts()
+    # Slot `i` uses the latest observation at or before its start.
+    idx = np.searchsorted(t_sorted, starts, side="right") - 1
+    out[:] = v_sorted[np.clip(idx, 0, None)]
+
+    if extend is not None:
+        after = starts > t_sorted[-1]
+        out[after] = np.asarray(extend, dtype=np.float64)[after]
+    return out
+
+
+def series_by_key(
+    keys: np.ndarray, times: np.ndarray, values: np.ndarray
+) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Split observation columns into one (times, values) series per key.
+
+    Args:
+        keys: Integer key of each observation (e.g. a pool id).
+        times: Observation epoch seconds.
+        values: Observation values.
+
+    Returns:
+        {key: (times, values)}, each series in its original observation order.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    unique, first = np.unique(keys[order], return_index=True)
+    times = np.asarray(times, dtype=np.int64)[order]
+    values = np.asarray(values, dtype=np.float64)[order]
+    bounds = np.append(first, order.shape[0])
+    return {
+        int(key): (times[bounds[i] : bounds[i + 1]], values[bounds[i] : bounds[i + 1]])
+        for i, key in enumerate(unique)
+    }
+
+
+def prefix_integral(rates: np.ndarray, grid: TimeGrid) -> np.ndarray:
+    """Cumulative integral of per-second `rates` at each grid edge.
+
+    Args:
+        rates: Array of shape (..., grid.size), constant within each slot.
+        grid: Grid the rates are sampled on.
+
+    Returns:
+        Array of shape (..., grid.size + 1) with a leading zero.
+    """
+    cumulative = np.cumsum(rates * grid.step, axis=-1)
+    zeros = np.zeros(rates.shape[:-1] + (1,), dtype=cumulative.dtype)
+    return np.concatenate([zeros, cumulative], axis=-1)
+
+
+def integral_at(
+    prefix: np.ndarray,
+    grid: TimeGrid,
+    epoch_seconds: np.ndarray,
+    rows: np.ndarray | None = None,
+) -> np.ndarray:
+    """Evaluate a prefix integral at arbitrary times (linear within a slot).
+
+    Outside the grid the first/last slot's rate is held, i.e. the integral is
+    extrapolated linearly.
+
+    Args:
+        prefix: Output of `prefix_integral`, shape (..., grid.size + 1).
+        grid: The grid.
+        epoch_seconds: Query times, broadcastable against `rows`.
+        rows: Optional row index into the leading axis of a 2-D `prefix`.
+    """
+    offset = np.asarray(epoch_seconds, dtype=np.int64) - grid.start
+    slot = np.clip(offset // grid.step, 0, grid.size - 1)
+    frac = (offset - slot * grid.step) / grid.step
+    if rows is None:
+        lo = prefix[..., slot]
+        hi = prefix[..., slot + 1]
+    else:
+        lo = prefix[rows, slot]
+        hi = prefix[rows, slot + 1]
+    return lo + (hi - lo) * frac
+
+
+def window_integral(
+    prefix: np.ndarray,
+    grid: TimeGrid,
+    start: np.ndarray,
+    duration: np.ndarray | int,
+    rows: np.ndarray | None = None,
+) -> np.ndarray:
+    """Integral over [start, start + duration) for many windows at once."""
+    start = np.asarray(start, dtype=np.int64)
+    end = start + np.asarray(duration, dtype=np.int64)
+    return integral_at(prefix, grid, end, rows) - integral_at(prefix, grid, start, rows)
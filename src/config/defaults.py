@@ -7,4 +7,72 @@ DEFAULT_SPOT_FLEET_API_BASE_URL = "https://206zjclkvi.execute-api.eu-west-1.amaz
 # Spot Fleet API key (optional).
 # If set, it will be sent as the `x-api-key` header on all Spot Fleet API requests.
 # Can be provided via environment variable SPOT_FLEET_API_KEY.
-DEFAULT_SPOT_FLEET_API_KEY: str | None = None
\ No newline at end of file
+DEFAULT_SPOT_FLEET_API_KEY: str | None = None
+
+# How old the cached request-group (fleet) catalog may get before the service
+# revalidates it in the background. The cached copy is always served first.
+DEFAULT_FLEET_CATALOG_REVALIDATE_SECONDS = 300
+
+# Per-upstream circuit breakers (Spot Fleet API, NESO, WattTime).
+# A breaker opens when at least CIRCUIT_MINIMUM_CALLS calls in the rolling window
+# have a failure rate >= CIRCUIT_FAILURE_RATE_THRESHOLD. Calls slower than
+# CIRCUIT_SLOW_CALL_SECONDS count as failures. While open, calls fail fast for
+# CIRCUIT_OPEN_SECONDS (doubling up to CIRCUIT_MAX_OPEN_SECONDS on failed probes).
+# After that, a probe request with a short timeout decides whether to close again.
+DEFAULT_CIRCUIT_WINDOW_SECONDS = 60
+DEFAULT_CIRCUIT_MINIMUM_CALLS = 4
+DEFAULT_CIRCUIT_FAILURE_RATE_THRESHOLD = 0.5
+DEFAULT_CIRCUIT_SLOW_CALL_SECONDS = 10.0
+DEFAULT_CIRCUIT_OPEN_SECONDS = 30
+DEFAULT_CIRCUIT_MAX_OPEN_SECONDS = 300
+DEFAULT_CIRCUIT_PROBE_TIMEOUT_SECONDS = 5.0
+
+# Placement score levels (1–10 scale) whose crossing is reported as a change event
+# by the fleet service's latest-snapshot differ.
+DEFAULT_PLACEMENT_SCORE_THRESHOLDS: tuple[float, ...] = (4.0, 7.0)
+
+# Spot Fleet freshness: skip the header's background probe while data fetched by
+# other calls is at most this old, and never probe more often than the interval
+# (several mounted headers share one tracker).
+DEFAULT_FLEET_FRESHNESS_PASSIVE_SECONDS = 300
+DEFAULT_FLEET_FRESHNESS_PROBE_INTERVAL_SECONDS = 30
+
+# Scheduling candidate grid: start slots every SCHEDULING_SLOT_SECONDS, generated
+# in chunks of at most CANDIDATE_CHUNK_SIZE candidates. Fleet/AZ/capacity options
+# whose latest placement score is below the floor are skipped (unscored options
+# are kept).
+DEFAULT_SCHEDULING_SLOT_SECONDS = 300
+DEFAULT_CANDIDATE_CHUNK_SIZE = 65_536
+DEFAULT_CANDIDATE_PLACEMENT_SCORE_FLOOR = 3.0
+
+# Scheduler: assumed power draw per instance (carbon objective in grams) and how
+# long loaded planning inputs (forecasts, prices, rates) are reused across plans.
+DEFAULT_INSTANCE_POWER_KW = 0.2
+DEFAULT_SCHEDULER_INPUT_TTL_SECONDS = 600
+
+# Incremental rescheduling: a new forecast only re-scores a scheduled workload if
+# it moves carbon intensity over the workload's window by more than this fraction,
+# or a placement score it depends on by more than this many points (1–10 scale).
+DEFAULT_RESCHEDULE_CARBON_TOLERANCE = 0.05
+DEFAULT_RESCHEDULE_PLACEMENT_TOLERANCE = 0.5
+
+# Batch scheduling: candidates kept per workload (cheapest first) and how long the
+# local search may improve on the greedy assignment.
+DEFAULT_BATCH_CANDIDATES_PER_WORKLOAD = 1024
+DEFAULT_BATCH_SEARCH_SECONDS = 2.0
+
+# Split execution: most run segments a checkpointed (interruptible) plan may use.
+DEFAULT_SPLIT_MAX_CHUNKS = 4
+
+# Backtesting: replayed workloads are planned at the next decision tick after they
+# are submitted, and a run that is not placed or is interrupted waits this long
+# before it starts again.
+DEFAULT_BACKTEST_DECISION_INTERVAL_SECONDS = 900
+DEFAULT_BACKTEST_RESTART_DELAY_SECONDS = 900
+
+# Anytime planning: the wizard shows the best plan found within this budget, then
+# keeps refining it in batches of this many candidates, publishing an improved
+# plan at most this often.
+DEFAULT_ANYTIME_BUDGET_SECONDS = 0.2
+DEFAULT_ANYTIME_BATCH_SIZE = 8192
+DEFAULT_ANYTIME_UPDATE_SECONDS = 0.5
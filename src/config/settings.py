@@ -1,13 +1,130 @@
 """Application settings and configuration."""
 
 import os
+import threading
 from pathlib import Path
+from typing import Callable
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.config.defaults import DEFAULT_SPOT_FLEET_API_BASE_URL
-from src.storage.config_store import ConfigStore
+from src.config.defaults import DEFAULT_SPOT_FLEET_API_BASE_URL, DEFAULT_SPOT_FLEET_API_KEY
+from src.storage.config_store import ConfigStore, CredentialsConfig
+
+SettingsListener = Callable[["Settings"], None]
+
+
+class Settings:
+    """Cached view over environment overrides and `data/configs/credentials.json`.
+
+    Credentials are parsed once and re-read only when the file's mtime/size
+    changes (checked with a single `stat`) or `reload()` is called, e.g. on
+    `CredentialsChanged`. The `SPOT_FLEET_API_BASE_URL` and `SPOT_FLEET_API_KEY`
+    environment variables are read at construction and again on `reload()`.
+    Subscribers are notified whenever the parsed credentials or those variables
+    actually change, so clients holding sessions can rebuild them.
+
+    The API key saved on the Credentials screen wins; `SPOT_FLEET_API_KEY` is
+    the fallback when none is saved, then the built-in default.
+    """
+
+    def __init__(self, configs_dir: Path | None = None) -> None:
+        if configs_dir is None:
+            repo_root = Path(__file__).resolve().parents[2]
+            configs_dir = repo_root / "data" / "configs"
+        self._store = ConfigStore(configs_dir)
+        self._lock = threading.Lock()
+        self._credentials: CredentialsConfig | None = None
+        self._signature: tuple[int, int] | None = None
+        self._listeners: list[SettingsListener] = []
+
+        self._env = _read_env()
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self._store.credentials_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @property
+    def credentials(self) -> CredentialsConfig:
+        """Parsed credentials, reloaded only if the file changed on disk."""
+        signature = self._file_signature()
+        with self._lock:
+            if self._credentials is not None and signature == self._signature:
+                return self._credentials
+        return self._reload(signature)
+
+    def reload(self) -> CredentialsConfig:
+        """Force a re-read of the credentials file and environment (notifies on change)."""
+        return self._reload(self._file_signature(), env=_read_env())
+
+    def _reload(
+        self, signature: tuple[int, int] | None, *, env: tuple[str | None, str | None] | None = None
+    ) -> CredentialsConfig:
+        credentials = self._store.load_credentials()
+        with self._lock:
+            previous = self._credentials
+            previous_env = self._env
+            self._credentials = credentials
+            self._signature = signature
+            if env is not None:
+                self._env = env
+            changed = previous != credentials or previous_env != self._env
+            listeners = list(self._listeners) if previous is not None and changed else []
+        for listener in listeners:
+            try:
+                listener(self)
+            except Exception:
+                continue
+        return credentials
+
+    def subscribe(self, listener: SettingsListener) -> Callable[[], None]:
+        """Call `listener` whenever the credentials change.
+
+        Returns:
+            A function that removes the listener.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                try:
+                    self._listeners.remove(listener)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    @property
+    def spot_fleet_api_base_url(self) -> str:
+        return self._env[0] or DEFAULT_SPOT_FLEET_API_BASE_URL
+
+    @property
+    def spot_fleet_api_key(self) -> str | None:
+        """Key saved on the Credentials screen, else `SPOT_FLEET_API_KEY`, else default."""
+        return self.credentials.spot_fleet_api_key or self._env[1] or DEFAULT_SPOT_FLEET_API_KEY
+
+
+def _read_env() -> tuple[str | None, str | None]:
+    """(`SPOT_FLEET_API_BASE_URL`, `SPOT_FLEET_API_KEY`) from the environment."""
+    return os.getenv("SPOT_FLEET_API_BASE_URL"), os.getenv("SPOT_FLEET_API_KEY")
+
+
+_settings: Settings | None = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """Get the process-wide settings instance."""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
+    return _settings
 
 
 def get_spot_fleet_api_base_url() -> str:
@@ -19,20 +136,20 @@ def get_spot_fleet_api_base_url() -> str:
     Returns:
         Base URL string for the Spot Fleet API
     """
-    return os.getenv("SPOT_FLEET_API_BASE_URL", DEFAULT_SPOT_FLEET_API_BASE_URL)
+    return get_settings().spot_fleet_api_base_url
 
 
 def get_spot_fleet_api_key() -> str | None:
     """Get the Spot Fleet API key from config
 
+    The key saved on the Credentials screen is used first, then the
+    `SPOT_FLEET_API_KEY` environment variable, then the default.
+
     Returns:
         API key string, or None if not configured.
     """
 
     try:
-        repo_root = Path(__file__).resolve().parents[2]
-        store = ConfigStore(repo_root / "data" / "configs")
-        creds = store.load_credentials()
-        return creds.spot_fleet_api_key or None
+        return get_settings().spot_fleet_api_key or None
     except Exception:
-        return None
\ No newline at end of file
+        return None
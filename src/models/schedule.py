@@ -1,2 +1,174 @@
-"""Schedule / execution plan model (scaffold)."""
+"""Schedule / execution plan model.
 
+A `Schedule` is the planner's answer for one workload draft: the chosen plan,
+the Pareto front it was picked from, and the input versions it was computed
+with (so callers can tell whether it is still current). A plan for an
+interruptible workload may be split into several checkpointed run segments.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Self
+
+
+def _dt_from_iso(value: str) -> datetime:
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _float_or_none(value: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class PlanSegment:
+    """One run interval of a split (checkpointed) plan."""
+
+    start_at: datetime
+    end_at: datetime
+    carbon_g: float | None = None
+    mean_carbon_intensity: float | None = None  # gCO2/kWh over the segment
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "start_at": self.start_at.isoformat(),
+            "end_at": self.end_at.isoformat(),
+            "carbon_g": self.carbon_g,
+            "mean_carbon_intensity": self.mean_carbon_intensity,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            start_at=_dt_from_iso(str(data["start_at"])),
+            end_at=_dt_from_iso(str(data["end_at"])),
+            carbon_g=_float_or_none(data.get("carbon_g")),
+            mean_carbon_intensity=_float_or_none(data.get("mean_carbon_intensity")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlanOption:
+    """One candidate plan: where and when to run, and how it scores."""
+
+    start_at: datetime
+    end_at: datetime
+    fleet_id: int
+    target_capacity: int
+    availability_zone: str | None = None  # None: the fleet picks the AZ
+
+    # Objectives (None when the input data was unavailable).
+    carbon_g: float | None = None
+    cost_usd: float | None = None
+    interruption_risk: float | None = None  # 0–1
+
+    mean_carbon_intensity: float | None = None  # gCO2/kWh over the run
+    placement_score: float | None = None  # 1–10 at the start time
+
+    # Run intervals of a split plan, in order (empty: one contiguous run from
+    # `start_at` to `end_at`).
+    segments: tuple[PlanSegment, ...] = ()
+
+    @property
+    def is_split(self) -> bool:
+        return len(self.segments) > 1
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "start_at": self.start_at.isoformat(),
+            "end_at": self.end_at.isoformat(),
+            "fleet_id": self.fleet_id,
+            "target_capacity": self.target_capacity,
+            "availability_zone": self.availability_zone,
+            "carbon_g": self.carbon_g,
+            "cost_usd": self.cost_usd,
+            "interruption_risk": self.interruption_risk,
+            "mean_carbon_intensity": self.mean_carbon_intensity,
+            "placement_score": self.placement_score,
+            "segments": [segment.to_json() for segment in self.segments],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            start_at=_dt_from_iso(str(data["start_at"])),
+            end_at=_dt_from_iso(str(data["end_at"])),
+            fleet_id=int(data["fleet_id"]),
+            target_capacity=int(data["target_capacity"]),
+            availability_zone=(
+                str(data["availability_zone"]) if data.get("availability_zone") is not None else None
+            ),
+            carbon_g=_float_or_none(data.get("carbon_g")),
+            cost_usd=_float_or_none(data.get("cost_usd")),
+            interruption_risk=_float_or_none(data.get("interruption_risk")),
+            mean_carbon_intensity=_float_or_none(data.get("mean_carbon_intensity")),
+            placement_score=_float_or_none(data.get("placement_score")),
+            segments=tuple(PlanSegment.from_json(dict(item)) for item in data.get("segments") or []),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    """Planning result for a workload draft."""
+
+    config_id: str
+    generated_at: datetime
+    chosen: PlanOption | None
+    # Non-dominated alternatives, ordered by carbon.
+    front: list[PlanOption] = field(default_factory=list)
+    candidates_evaluated: int = 0
+
+    # Versions of the inputs the plan was computed from.
+    carbon_version: str = ""
+    availability_version: str = ""
+
+    # Why there is no plan (e.g. the deadline cannot be met).
+    infeasible_reason: str | None = None
+
+    # Risk mode the plan was ranked under (see `scheduling.risk_modes`).
+    risk_mode: str | None = None
+
+    # No candidate met the risk mode's thresholds, so the plan was ranked from
+    # all of them and may exceed the mode's risk / placement limits.
+    thresholds_relaxed: bool = False
+
+    @property
+    def is_feasible(self) -> bool:
+        return self.chosen is not None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "config_id": self.config_id,
+            "generated_at": self.generated_at.isoformat(),
+            "chosen": self.chosen.to_json() if self.chosen is not None else None,
+            "front": [option.to_json() for option in self.front],
+            "candidates_evaluated": self.candidates_evaluated,
+            "carbon_version": self.carbon_version,
+            "availability_version": self.availability_version,
+            "infeasible_reason": self.infeasible_reason,
+            "risk_mode": self.risk_mode,
+            "thresholds_relaxed": self.thresholds_relaxed,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            config_id=str(data["config_id"]),
+            generated_at=_dt_from_iso(str(data["generated_at"])),
+            chosen=(
+                PlanOption.from_json(dict(data["chosen"])) if data.get("chosen") is not None else None
+            ),
+            front=[PlanOption.from_json(dict(item)) for item in data.get("front") or []],
+            candidates_evaluated=int(data.get("candidates_evaluated", 0)),
+            carbon_version=str(data.get("carbon_version", "")),
+            availability_version=str(data.get("availability_version", "")),
+            infeasible_reason=(
+                str(data["infeasible_reason"]) if data.get("infeasible_reason") is not None else None
+            ),
+            risk_mode=str(data["risk_mode"]) if data.get("risk_mode") is not None else None,
+            thresholds_relaxed=bool(data.get("thresholds_relaxed", False)),
+        )
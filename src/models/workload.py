@@ -35,6 +35,9 @@ class Workload:
     fleet: str | None = None
     region: str | None = None
 
+    # Wizard config (`WorkloadConfig.config_id`) the workload is planned from.
+    config_id: str | None = None
+
     @staticmethod
     def _dt_to_iso(dt: datetime) -> str:
         return dt.isoformat()
@@ -77,6 +80,7 @@ class Workload:
             ),
             fleet=str(data["fleet"]) if data.get("fleet") is not None else None,
             region=str(data["region"]) if data.get("region") is not None else None,
+            config_id=str(data["config_id"]) if data.get("config_id") is not None else None,
         )
 
 
@@ -10,7 +10,7 @@ The config is JSON-first and versioned so it can be stored locally or remotely.
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from typing import Any, Self
 
@@ -31,6 +31,15 @@ class DelayTolerance(StrEnum):
             DelayTolerance.UP_TO_24_HOURS: "Up to 24 hours",
         }[self]
 
+    def max_delay(self) -> timedelta:
+        """Longest the start may be postponed past the earliest start."""
+        return {
+            DelayTolerance.NOT_DELAY_TOLERANT: timedelta(0),
+            DelayTolerance.UP_TO_1_HOUR: timedelta(hours=1),
+            DelayTolerance.UP_TO_6_HOURS: timedelta(hours=6),
+            DelayTolerance.UP_TO_24_HOURS: timedelta(hours=24),
+        }[self]
+
 
 class RuntimeEstimateSource(StrEnum):
     """Where the runtime estimate came from."""
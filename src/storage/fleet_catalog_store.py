@@ -0,0 +1,60 @@
+"""Request-group (fleet) catalog cache (JSON file in `data/cache/`).
+
+The raw `/request-groups` payload is stored as-is together with the time it was
+fetched, so the UI can show the last known catalog immediately on startup while
+the service revalidates it in the background.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFleetCatalog:
+    """A persisted `/request-groups` payload."""
+
+    fetched_at: datetime
+    items: list[dict[str, Any]]
+
+
+class FleetCatalogStore:
+    """Store for the cached request-group catalog."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def catalog_path(self) -> Path:
+        return self.cache_dir / "request_groups.json"
+
+    def load(self) -> CachedFleetCatalog | None:
+        """Load the cached catalog (or None if missing/corrupted)."""
+        path = self.catalog_path
+        if not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            fetched_at = datetime.fromisoformat(str(data["fetched_at"]))
+            if fetched_at.tzinfo is None:
+                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+            items = [dict(item) for item in data.get("items", []) or []]
+        except Exception:
+            return None
+        return CachedFleetCatalog(fetched_at=fetched_at, items=items)
+
+    def save(self, items: list[dict[str, Any]], *, fetched_at: datetime | None = None) -> None:
+        """Persist the catalog payload atomically (write + rename)."""
+        fetched_at = fetched_at or datetime.now(tz=timezone.utc)
+        path = self.catalog_path
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump({"fetched_at": fetched_at.isoformat(), "items": items}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
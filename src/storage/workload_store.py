@@ -45,7 +45,7 @@ class WorkloadStore:
         with path.open("w", encoding="utf-8") as f:
             json.dump(workload.to_json(), f, indent=2, sort_keys=True)
 
-    def create_draft(self, name: str) -> Workload:
+    def create_draft(self, name: str, config_id: str | None = None) -> Workload:
         now = datetime.now(tz=timezone.utc)
         workload = Workload(
             workload_id=str(uuid4()),
@@ -53,6 +53,7 @@ class WorkloadStore:
             status=WorkloadStatus.DRAFT,
             created_at=now,
             updated_at=now,
+            config_id=config_id,
         )
         self.save(workload)
         return workload
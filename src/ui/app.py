@@ -8,6 +8,7 @@ from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 
+from src.config.settings import get_settings
 from src.storage.storage_manager import StorageManager
 from src.ui.messages import CredentialsChanged
 from src.ui.screens.credentials.credentials_screen import CredentialsScreen
@@ -64,6 +65,9 @@ class L5InterfaceApp(App[None]):
 
     def on_credentials_changed(self, message: CredentialsChanged) -> None:
         """Refresh any mounted headers immediately after credentials are saved."""
+        # Re-read credentials now; subscribers (e.g. the Spot Fleet client) rebuild on change.
+        get_settings().reload()
+
         # Textual queries are CSS-selector based; query for the widget type name.
         # We query the active screen since that's where the mounted GlobalHeader lives.
         for header in self.screen.query("GlobalHeader"):
@@ -9,7 +9,11 @@ from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Select, Static
 
-from src.backend.data.availability_data import get_available_fleets
+from src.backend.data.availability_data import (
+    get_available_fleets,
+    get_cached_fleets,
+    subscribe_fleet_catalog,
+)
 from src.backend.data.fleet.models import RequestGroup
 from src.models.workload_config import WorkloadConfig
 from src.ui.screens.create_workload.base_stage import CreateWorkloadStage, StageId
@@ -40,6 +44,7 @@ class Stage4HardwareSelection(CreateWorkloadStage):
         self._pending_target_capacity: int | None = None
         self._fleets: list[RequestGroup] | None = None
         self._hydrating: bool = False
+        self._unsubscribe_catalog = None
 
     def compose(self) -> ComposeResult:
         with Container(id=ids.STAGE_4_CONTAINER_ID):
@@ -58,8 +63,18 @@ class Stage4HardwareSelection(CreateWorkloadStage):
                     yield Select(options=[], id="target_capacity_select", prompt="Select fleet first")
 
     def on_mount(self) -> None:
+        self._unsubscribe_catalog = subscribe_fleet_catalog(self._on_catalog_changed_threadsafe)
+        # Serve the cached catalog straight away; `_load_regions` revalidates it.
+        cached = get_cached_fleets()
+        if cached:
+            self._set_fleets(cached)
         self._load_regions()
 
+    def on_unmount(self) -> None:
+        if self._unsubscribe_catalog is not None:
+            self._unsubscribe_catalog()
+            self._unsubscribe_catalog = None
+
     def load_from_config(self, config: WorkloadConfig) -> None:
         self._hydrating = True
         try:
@@ -185,17 +200,51 @@ class Stage4HardwareSelection(CreateWorkloadStage):
             self._refresh_target_capacity_options(None)
         elif event.select.id == "fleet_select":
             fleet_id = str(event.value) if event.value else None
+            self._pending_fleet_id = None
             self._pending_target_capacity = None
             self._refresh_target_capacity_options(fleet_id)
+        elif event.select.id == "az_select":
+            self._pending_az = None
+        elif event.select.id == "target_capacity_select":
+            self._pending_target_capacity = None
 
     @work(thread=True, exclusive=True)
     def _load_regions(self) -> None:
         try:
             fleets = get_available_fleets()
-            self.app.call_from_thread(self._set_fleets, fleets)
+            self.app.call_from_thread(self._on_catalog_changed, fleets)
         except Exception as e:
             self.app.call_from_thread(self._set_region_error, str(e))
 
+    def _on_catalog_changed_threadsafe(self, fleets: list[RequestGroup]) -> None:
+        # Called from the service's revalidation thread.
+        try:
+            self.app.call_from_thread(self._on_catalog_changed, fleets)
+        except Exception:
+            # App/screen may be shutting down.
+            return
+
+    def _on_catalog_changed(self, fleets: list[RequestGroup]) -> None:
+        """Apply a (re)loaded catalog, keeping the current selections if already shown."""
+        if not self.is_mounted or fleets == self._fleets:
+            return
+        if self._fleets is None:
+            self._set_fleets(fleets)
+            return
+        # What the user has selected wins; pending draft values only fill blanks.
+        self._pending_region = self._select_value("#region_select") or self._pending_region
+        self._pending_fleet_id = self._select_value("#fleet_select") or self._pending_fleet_id
+        self._pending_az = self._select_value("#az_select") or self._pending_az
+        capacity = self._select_value("#target_capacity_select")
+        if capacity:
+            self._pending_target_capacity = int(capacity)
+        with self.prevent(Select.Changed):
+            self._set_fleets(fleets)
+
+    def _select_value(self, selector: str) -> str | None:
+        raw = self.query_one(selector, Select).value
+        return str(raw) if raw not in (None, "", Select.BLANK) else None
+
     def _set_fleets(self, fleets: list[RequestGroup]) -> None:
         self._fleets = fleets
         regions = sorted({fleet.region for fleet in fleets if fleet.region})
@@ -218,7 +267,11 @@ class Stage4HardwareSelection(CreateWorkloadStage):
                     )
                 finally:
                     self._hydrating = False
+            # Applied (or no longer valid): never re-apply them over later edits.
             self._pending_region = None
+            self._pending_fleet_id = None
+            self._pending_az = None
+            self._pending_target_capacity = None
             return
 
         self._refresh_fleet_options(None)
@@ -226,6 +279,9 @@ class Stage4HardwareSelection(CreateWorkloadStage):
         self._refresh_target_capacity_options(None)
 
     def _set_region_error(self, message: str) -> None:
+        if self._fleets is not None:
+            # Already showing a cached catalog; keep it rather than blanking the form.
+            return
         sel = self.query_one("#region_select", Select)
         sel.set_options([])
         sel.prompt = "Unable to load regions"
@@ -2,18 +2,180 @@
 
 from __future__ import annotations
 
+from contextlib import closing
+
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container
+from textual.widgets import Select, Static
+from textual.worker import get_current_worker
 
+from src.backend.scheduling.anytime import AnytimePlan, AnytimePlanner
+from src.backend.scheduling.risk_modes import RiskMode, auto_risk_mode
+from src.backend.scheduling.scheduler import get_scheduler
+from src.models.schedule import PlanOption
+from src.models.workload_config import WorkloadConfig
 from src.ui.screens.create_workload.base_stage import CreateWorkloadStage, StageId
 from src.ui.screens.create_workload.components import ids
 
 
+def _format_option(option: PlanOption) -> str:
+    parts = [
+        f"{option.start_at:%a %H:%M}–{option.end_at:%H:%M} UTC",
+        f"fleet {option.fleet_id} × {option.target_capacity}",
+    ]
+    if option.is_split:
+        parts.append(f"{len(option.segments)} segments")
+    if option.availability_zone:
+        parts.append(option.availability_zone)
+    if option.carbon_g is not None:
+        parts.append(f"{option.carbon_g / 1000:.2f} kgCO₂e")
+    if option.cost_usd is not None:
+        parts.append(f"${option.cost_usd:.2f}")
+    if option.interruption_risk is not None:
+        parts.append(f"risk {option.interruption_risk:.0%}")
+    return " · ".join(parts)
+
+
+def _same_plan(plan: AnytimePlan, shown: AnytimePlan) -> bool:
+    """Whether `plan` would render the same options as `shown`."""
+    return plan.schedule.chosen == shown.schedule.chosen and plan.schedule.front == shown.schedule.front
+
+
+def _progress_text(plan: AnytimePlan) -> str:
+    if not plan.improving:
+        return ""
+    progress = f"Refining: {plan.coverage:.0%} of {plan.total:,} candidates searched"
+    if plan.carbon_gap:
+        progress += f", unsearched plans may emit up to {plan.carbon_gap:.0%} less"
+    return f"{progress}."
+
+
 class Stage6Scheduling(CreateWorkloadStage):
     stage_id = StageId.SCHEDULING
     title = "Create Workload -> Scheduling"
 
     CSS_PATH = "./create_workload.tcss"
 
+    # Select value for "pick the mode from the job semantics".
+    _AUTO_MODE = "auto"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._config: WorkloadConfig | None = None
+
     def compose(self) -> ComposeResult:
-        yield Container(id=ids.STAGE_6_CONTAINER_ID)
+        with Container(id=ids.STAGE_6_CONTAINER_ID):
+            yield Static("Risk mode", classes="section_title")
+            yield Select(
+                options=self._mode_options(None),
+                id="risk_mode_select",
+                value=self._AUTO_MODE,
+                allow_blank=False,
+            )
+            yield Static("Recommended plan", classes="section_title")
+            yield Static("Complete the previous stages to plan this workload.", id="plan_summary")
+            yield Static("", id="plan_progress", classes="muted")
+            yield Static("", id="plan_alternatives", classes="muted")
+
+    def _mode_options(self, config: WorkloadConfig | None) -> list[tuple[str, str]]:
+        auto = f"Automatic ({auto_risk_mode(config).label()})" if config is not None else "Automatic"
+        return [(auto, self._AUTO_MODE)] + [(mode.label(), mode.value) for mode in RiskMode]
+
+    def _selected_mode(self) -> RiskMode | None:
+        try:
+            raw = self.query_one("#risk_mode_select", Select).value
+        except Exception:
+            return None
+        return RiskMode(str(raw)) if raw not in (None, Select.BLANK, self._AUTO_MODE) else None
+
+    def load_from_config(self, config: WorkloadConfig) -> None:
+        # Plans are memoised by the scheduler, so re-opening this stage (or coming
+        # back after an unrelated edit) resolves immediately from cache.
+        self._config = config
+        try:
+            select = self.query_one("#risk_mode_select", Select)
+            with self.prevent(Select.Changed):
+                value = select.value
+                select.set_options(self._mode_options(config))
+                select.value = value
+        except Exception:
+            # Stage may not be composed yet.
+            pass
+        if config.runtime_estimate_seconds is None or (config.region is None and config.fleet_id is None):
+            self._set_text("Complete the previous stages to plan this workload.", "")
+            return
+        self._set_text("Planning…", "")
+        self._plan(config, self._selected_mode())
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id != "risk_mode_select" or self._config is None:
+            return
+        # The scheduler keeps the scored candidates, so this only re-ranks them.
+        self.load_from_config(self._config)
+
+    @work(thread=True, exclusive=True)
+    def _plan(self, config: WorkloadConfig, risk_mode: RiskMode | None) -> None:
+        # The best plan within the budget shows first; refined plans replace it
+        # until every candidate is scored or the stage re-plans. The planner
+        # yields at every update interval, so cancellation is noticed promptly.
+        worker = get_current_worker()
+        shown: AnytimePlan | None = None
+        try:
+            with closing(AnytimePlanner(get_scheduler()).plans(config, risk_mode=risk_mode)) as plans:
+                for plan in plans:
+                    if worker.is_cancelled:
+                        break
+                    if shown is not None and plan.improving and _same_plan(plan, shown):
+                        # Only the search progress moved on.
+                        self.app.call_from_thread(self._show_progress, plan)
+                        continue
+                    self.app.call_from_thread(self._show_schedule, plan)
+                    shown = plan
+        except Exception as e:
+            self.app.call_from_thread(self._set_text, f"Unable to plan: {e}", "")
+
+    def _show_schedule(self, plan: AnytimePlan) -> None:
+        schedule = plan.schedule
+        progress = _progress_text(plan)
+        if schedule.chosen is None:
+            if plan.improving:
+                self._set_text("Planning…", "", progress)
+            else:
+                self._set_text(schedule.infeasible_reason or "No feasible plan.", "")
+            return
+        alternatives = [_format_option(o) for o in schedule.front if o != schedule.chosen]
+        if plan.improving:
+            # The candidate count changes with every update; it is on the progress line.
+            details = f"{len(alternatives)} alternative(s):\n" + "\n".join(alternatives) if alternatives else ""
+        else:
+            details = (
+                f"{len(alternatives)} alternative(s) from {schedule.candidates_evaluated:,} candidates:\n"
+                + "\n".join(alternatives)
+                if alternatives
+                else f"Best of {schedule.candidates_evaluated:,} candidates."
+            )
+        summary = _format_option(schedule.chosen)
+        if schedule.thresholds_relaxed:
+            mode = RiskMode(schedule.risk_mode).label() if schedule.risk_mode else "risk mode"
+            summary += (
+                f"\nNo plan meets the {mode} limits; this is the best available and may exceed"
+                " its interruption risk, placement score or deadline slack limits."
+            )
+        self._set_text(summary, details, progress)
+
+    def _show_progress(self, plan: AnytimePlan) -> None:
+        try:
+            self.query_one("#plan_progress", Static).update(_progress_text(plan))
+        except Exception:
+            # Stage may not be composed yet (or already unmounted).
+            return
+
+    def _set_text(self, summary: str, alternatives: str, progress: str = "") -> None:
+        try:
+            self.query_one("#plan_summary", Static).update(summary)
+            self.query_one("#plan_progress", Static).update(progress)
+            self.query_one("#plan_alternatives", Static).update(alternatives)
+        except Exception:
+            # Stage may not be composed yet (or already unmounted).
+            return
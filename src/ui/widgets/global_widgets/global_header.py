@@ -186,9 +186,9 @@ class GlobalHeader(Static):
             wt_freshness = self._freshness_tracker.get_wt_freshness()
             availability_freshness = self._freshness_tracker.get_availability_freshness()
 
-            neso_age = neso_freshness.format_age()
-            wt_age = wt_freshness.format_age()
-            availability_age = availability_freshness.format_age()
+            neso_age = neso_freshness.format_status()
+            wt_age = wt_freshness.format_status()
+            availability_age = availability_freshness.format_status()
 
             # Format: "NESO: 5m ago | WT: 10m ago | Fleet: 2h ago"
             freshness_text = (
@@ -199,8 +199,9 @@ class GlobalHeader(Static):
             freshness_widget.update(freshness_text)
 
             # Update styling based on staleness
-            all_ok = not (
-                neso_freshness.is_stale or wt_freshness.is_stale or availability_freshness.is_stale
+            all_ok = not any(
+                f.is_stale or f.degraded
+                for f in (neso_freshness, wt_freshness, availability_freshness)
             )
             if all_ok:
                 freshness_widget.remove_class("stale")